@@ -1,8 +1,8 @@
 
+import os
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from application_pages.utils import generate_synthetic_data
+from application_pages.utils import prepare_reference_data, load_startup_snapshot, calculate_session_memory_usage, estimate_memory_bytes, build_ai_readiness_graph, HotPathTimer
 
 st.set_page_config(page_title="QuLab", layout="wide")
 st.sidebar.image("https://www.quantuniversity.com/assets/img/logo5.jpg")
@@ -37,11 +37,32 @@ This framework allows for dynamic "what-if" scenario planning, enabling users to
 """)
 
 
+# Reference tables are identical for every session, so they are built once per process
+# and shared read-only. Copy-on-write (always on from pandas 3) lets a session hold
+# shallow copies and pay for its own copy of a table only if it edits it.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# QULAB_DATA_DIR points to a directory of Parquet / Arrow / .npy tables (see load_reference_data);
+# tables it does not contain fall back to the synthetic data
+DATA_DIR = os.environ.get("QULAB_DATA_DIR")
+# Precomputed tables and data version written by build_startup_snapshot.py; used only when built
+# from the same data (see load_startup_snapshot)
+SNAPSHOT_DIR = os.environ.get("QULAB_SNAPSHOT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_snapshot"))
+
+@st.cache_resource(show_spinner=False)
+def load_shared_data():
+    shared_tables, data_version = load_startup_snapshot(SNAPSHOT_DIR, DATA_DIR) or prepare_reference_data(DATA_DIR)
+    # Deep-measured once per process and data version; reruns measure only what the session owns
+    return shared_tables, data_version, estimate_memory_bytes(shared_tables)
+
+shared_tables, data_version, shared_bytes = load_shared_data()
+
 # Initialize session state for data and parameters
 if "individual_profiles_df" not in st.session_state:
-    st.session_state.individual_profiles_df, st.session_state.occupational_data_df, \
-    st.session_state.learning_pathways_df, st.session_state.occupation_required_skills_df, \
-    st.session_state.individual_skills_df = generate_synthetic_data()
+    for table_name, table in shared_tables.items():
+        st.session_state[table_name] = table.copy(deep=False)
+    st.session_state.data_version = data_version
 
 
 # Initialize global parameters if not already in session_state
@@ -50,18 +71,57 @@ if 'alpha' not in st.session_state:
 if 'beta' not in st.session_state:
     st.session_state.beta = 0.15
 
-
-page = st.sidebar.selectbox(label="Navigation", options=["Page 1: Introduction & Data", "Page 2: Idiosyncratic Readiness (V^R)", "Page 3: Systematic Opportunity (H^R) & Simulation"])
-
-if page == "Page 1: Introduction & Data":
-    from application_pages.page1 import run_page1
-    run_page1()
-elif page == "Page 2: Idiosyncratic Readiness (V^R)":
-    from application_pages.page2 import run_page2
-    run_page2()
-elif page == "Page 3: Systematic Opportunity (H^R) & Simulation":
-    from application_pages.page3 import run_page3
-    run_page3()
+# Per-session memoized formula graph; pages push their inputs into it and only the
+# components downstream of a changed input are recomputed
+if 'score_graph' not in st.session_state:
+    st.session_state.score_graph = build_ai_readiness_graph()
+
+
+page = st.sidebar.selectbox(label="Navigation", options=["Page 1: Introduction & Data", "Page 2: Idiosyncratic Readiness (V^R)", "Page 3: Systematic Opportunity (H^R) & Simulation", "Page 4: Cohort Analytics"])
+
+# Opt-in timing of utils.py calls and page renders. The timer belongs to this session and is active
+# only while this session's script runs, so other sessions' calls are never counted.
+if 'hot_path_timer' not in st.session_state:
+    st.session_state.hot_path_timer = HotPathTimer()
+hot_path_timer = st.session_state.hot_path_timer
+debug_panel = st.sidebar.expander("Debug: Hot-Path Timing")
+hot_path_timing = debug_panel.checkbox(
+    "Time utils.py calls and pages", key="hot_path_timing",
+    help="Counts calls and wall time of every utils.py function and page render in this session."
+)
+
+with hot_path_timer.activate(hot_path_timing):
+    if page == "Page 1: Introduction & Data":
+        from application_pages.page1 import run_page1
+        with hot_path_timer.section("run_page1"):
+            run_page1()
+    elif page == "Page 2: Idiosyncratic Readiness (V^R)":
+        from application_pages.page2 import run_page2
+        with hot_path_timer.section("run_page2"):
+            run_page2()
+    elif page == "Page 3: Systematic Opportunity (H^R) & Simulation":
+        from application_pages.page3 import run_page3
+        with hot_path_timer.section("run_page3"):
+            run_page3()
+    elif page == "Page 4: Cohort Analytics":
+        from application_pages.page4 import run_page4
+        with hot_path_timer.section("run_page4"):
+            run_page4()
+
+session_bytes = calculate_session_memory_usage(st.session_state, shared_tables)
+st.sidebar.caption(f"Session memory (tables, skill-gap index, score graph and caches): {session_bytes / 1024:.1f} KiB  \nShared reference data (loaded once per process): {shared_bytes / 1024:.1f} KiB")
+
+if hot_path_timing:
+    with debug_panel:
+        timings = hot_path_timer.snapshot()
+        st.dataframe(pd.DataFrame({
+            'name': timings['name'], 'calls': timings['calls'], 'total (ms)': timings['total_seconds'] * 1000,
+            'mean (ms)': timings['mean_seconds'] * 1000, 'max (ms)': timings['max_seconds'] * 1000
+        }).round(3), hide_index=True)
+        st.caption("Totals are cumulative: a function includes the utils.py calls it makes, a page includes everything it renders.")
+        st.download_button("Export JSON", hot_path_timer.to_json(), file_name="hot_path_timings.json", mime="application/json")
+        st.download_button("Export OpenMetrics", hot_path_timer.to_openmetrics(), file_name="hot_path_timings.txt", mime="application/openmetrics-text")
+        st.button("Reset Timings", on_click=hot_path_timer.reset)
 
 
 # License
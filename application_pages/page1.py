@@ -1,7 +1,5 @@
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 
 def run_page1():
     st.header("Page 1: Introduction & Data")
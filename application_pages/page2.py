@@ -1,20 +1,7 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-from application_pages.utils import (
-    calculate_technical_ai_skills,
-    calculate_ai_augmented_productivity,
-    calculate_critical_ai_judgment,
-    calculate_ai_learning_velocity,
-    calculate_ai_fluency,
-    calculate_education_foundation,
-    calculate_practical_experience,
-    calculate_specialization_depth,
-    calculate_domain_expertise,
-    calculate_adaptive_capacity,
-    calculate_idiosyncratic_readiness
-)
+from application_pages.utils import VR_COMPONENT_NAMES, render_chart
 
 def run_page2():
     st.header("Page 2: Idiosyncratic Readiness (V^R)")
@@ -135,42 +122,17 @@ def run_page2():
         )
 
     if st.button("Calculate V^R Score"):
-        profile = st.session_state.individual_profile
-
-        # Calculate AI-Fluency sub-components
-        s1 = calculate_technical_ai_skills(profile['prompting_score'], profile['tools_score'], profile['understanding_score'], profile['datalit_score'])
-        s2 = calculate_ai_augmented_productivity(profile['output_quality_with_ai'], profile['output_quality_without_ai'], profile['time_without_ai'], profile['time_with_ai'])
-        s3 = calculate_critical_ai_judgment(profile['errors_caught'], profile['total_ai_errors'], profile['appropriate_trust_decisions'], profile['total_decisions'])
-        s4 = calculate_ai_learning_velocity(profile['delta_proficiency'], profile['delta_t_hours_invested'])
-        ai_fluency = calculate_ai_fluency(s1, s2, s3, s4)
-
-        # Calculate Domain-Expertise sub-components
-        education_foundation = calculate_education_foundation(profile['education_level'])
-        practical_experience = calculate_practical_experience(profile['years_experience'])
-        specialization_depth = calculate_specialization_depth(profile['portfolio_score'], profile['recognition_score'], profile['credentials_score'])
-        domain_expertise = calculate_domain_expertise(education_foundation, practical_experience, specialization_depth)
-
-        # Calculate Adaptive-Capacity
-        adaptive_capacity = calculate_adaptive_capacity(profile['cognitive_flexibility'], profile['social_emotional_intelligence'], profile['strategic_career_management'])
-
-        # Calculate final V^R
-        vr_score = calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity) * 100 # Normalize to 0-100
-
-        st.session_state.s1 = s1
-        st.session_state.s2 = s2
-        st.session_state.s3 = s3
-        st.session_state.s4 = s4
-        st.session_state.ai_fluency = ai_fluency
-        st.session_state.education_foundation = education_foundation
-        st.session_state.practical_experience = practical_experience
-        st.session_state.specialization_depth = specialization_depth
-        st.session_state.domain_expertise = domain_expertise
-        st.session_state.adaptive_capacity = adaptive_capacity
-        st.session_state.vr_score = vr_score
+        # Only components downstream of inputs changed since the last calculation are recomputed
+        st.session_state.score_graph.update(st.session_state.individual_profile)
+        for component_name, component_value in st.session_state.score_graph.evaluate(VR_COMPONENT_NAMES).items():
+            st.session_state[component_name] = component_value
 
         st.success(f"Idiosyncratic Readiness (V^R) Calculated!")
 
     if "vr_score" in st.session_state:
+        # Plotly is imported on first use, so the page's first paint does not wait for it
+        import plotly.express as px
+
         st.subheader("Calculated Idiosyncratic Readiness (V^R)")
         st.metric(label="Your V^R Score", value=f"{st.session_state.vr_score:.2f}")
 
@@ -181,9 +143,9 @@ def run_page2():
         }
         vr_components_df = pd.DataFrame(vr_components_data)
 
-        fig = px.bar(vr_components_df, x="Component", y="Score", title="Contribution to V^R",
-                     labels={"Score": "Component Score (0-100%)"},
-                     color_discrete_sequence=px.colors.qualitative.Pastel)
+        fig = render_chart("bar", vr_components_df, x="Component", y="Score", title="Contribution to V^R",
+                           labels={"Score": "Component Score (0-100%)"},
+                           color_discrete_sequence=px.colors.qualitative.Pastel)
         st.plotly_chart(fig)
 
         st.markdown("#### AI-Fluency Sub-Components Breakdown")
@@ -192,9 +154,9 @@ def run_page2():
             "Score": [st.session_state.s1 * 100, st.session_state.s2 * 100, st.session_state.s3 * 100, st.session_state.s4 * 100]
         }
         ai_fluency_sub_components_df = pd.DataFrame(ai_fluency_sub_components_data)
-        fig_ai_fluency = px.bar(ai_fluency_sub_components_df, x="Sub-Component", y="Score", title="AI-Fluency Sub-Component Scores",
-                                labels={"Score": "Score (0-100%)"},
-                                color_discrete_sequence=px.colors.qualitative.Pastel)
+        fig_ai_fluency = render_chart("bar", ai_fluency_sub_components_df, x="Sub-Component", y="Score", title="AI-Fluency Sub-Component Scores",
+                                      labels={"Score": "Score (0-100%)"},
+                                      color_discrete_sequence=px.colors.qualitative.Pastel)
         st.plotly_chart(fig_ai_fluency)
 
         st.markdown("#### Domain-Expertise Sub-Components Breakdown")
@@ -203,9 +165,9 @@ def run_page2():
             "Score": [st.session_state.education_foundation * 100, st.session_state.practical_experience * 100, st.session_state.specialization_depth * 100]
         }
         domain_expertise_sub_components_df = pd.DataFrame(domain_expertise_sub_components_data)
-        fig_domain_expertise = px.bar(domain_expertise_sub_components_df, x="Sub-Component", y="Score", title="Domain-Expertise Sub-Component Scores",
-                                      labels={"Score": "Score (0-100%)"},
-                                      color_discrete_sequence=px.colors.qualitative.Pastel)
+        fig_domain_expertise = render_chart("bar", domain_expertise_sub_components_df, x="Sub-Component", y="Score", title="Domain-Expertise Sub-Component Scores",
+                                            labels={"Score": "Score (0-100%)"},
+                                            color_discrete_sequence=px.colors.qualitative.Pastel)
         st.plotly_chart(fig_domain_expertise)
 
 
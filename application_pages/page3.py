@@ -1,36 +1,88 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from application_pages.utils import (
-    calculate_ai_enhancement_potential,
-    calculate_job_growth_projection,
-    calculate_wage_premium,
-    calculate_entry_accessibility,
-    calculate_base_opportunity_score,
-    calculate_growth_multiplier,
-    calculate_regional_multiplier,
-    calculate_systematic_opportunity,
-    calculate_skills_match_score,
-    calculate_timing_factor,
-    calculate_alignment_factor,
     calculate_synergy_percentage,
     calculate_ai_readiness_score,
     simulate_pathway_impact,
     calculate_idiosyncratic_readiness,
-    calculate_ai_fluency,
-    calculate_domain_expertise,
-    calculate_adaptive_capacity,
-    calculate_technical_ai_skills,
-    calculate_ai_augmented_productivity,
-    calculate_critical_ai_judgment,
-    calculate_ai_learning_velocity,
-    calculate_education_foundation,
-    calculate_practical_experience,
-    calculate_specialization_depth
+    calculate_systematic_opportunity_table,
+    optimize_pathway_portfolio,
+    simulate_pathway_grid,
+    calculate_ai_readiness_batch,
+    calculate_ai_readiness_surface,
+    calculate_occupation_ranks,
+    summarize_rank_sensitivity,
+    calculate_recommendation_stability,
+    build_occupation_skill_index,
+    recommend_occupations,
+    build_occupation_embedding,
+    find_similar_occupations,
+    find_adjacent_occupations,
+    simulate_ai_readiness_uncertainty,
+    TRAJECTORY_METRICS,
+    build_pathway_schedule,
+    simulate_ai_readiness_trajectory,
+    ScoreCache,
+    score_profile_cached,
+    render_chart,
+    SkillGapIndex,
+    diff_skill_scores
 )
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_systematic_opportunity_table(lambda_val, gamma_val, data_version, _occupational_data_df):
+    # Memoized on (lambda, gamma, data version); the frame itself is excluded from hashing
+    return calculate_systematic_opportunity_table(_occupational_data_df, lambda_val, gamma_val)
+
+@st.cache_resource(show_spinner=False)
+def get_occupation_skill_index(data_version, _occupation_required_skills_df, _occupational_data_df):
+    # Read-only and identical for every session with the same data version
+    return build_occupation_skill_index(_occupation_required_skills_df, _occupational_data_df['occupation_name'])
+
+@st.cache_resource(show_spinner=False)
+def get_occupations_by_name(data_version, _occupational_data_df):
+    # occupational_data_df indexed by occupation name (first row of a repeated name), so the selected
+    # occupation's inputs are a hash lookup rather than a scan of the catalog on every rerun
+    return _occupational_data_df.drop_duplicates('occupation_name').set_index('occupation_name', drop=False)
+
+@st.cache_resource(show_spinner=False)
+def get_required_skills_by_occupation(data_version, _occupation_required_skills_df):
+    # {occupation_name: its required-skill rows}, split once per data version rather than filtered on every rerun
+    return dict(tuple(_occupation_required_skills_df.groupby('occupation_name', sort=False, observed=True)))
+
+@st.cache_resource(show_spinner=False)
+def get_occupation_embedding(data_version, _occupation_skill_index):
+    return build_occupation_embedding(_occupation_skill_index)
+
+# Score results are content-keyed, so one cache can serve every session of the process
+SHARE_SCORE_CACHE = True
+
+@st.cache_resource(show_spinner=False)
+def get_shared_score_cache():
+    return ScoreCache()
+
+def get_score_cache():
+    if SHARE_SCORE_CACHE:
+        return get_shared_score_cache()
+    if "score_cache" not in st.session_state:
+        st.session_state.score_cache = ScoreCache()
+    return st.session_state.score_cache
+
+# The session's skill-gap index holds one user: the skills in the editor
+SESSION_SKILLS_USER = "session"
+
+def get_skill_gap_index(occupation_skill_index, individual_skills_df):
+    # Built once per data version, then updated with only the skills changed since the last run
+    if st.session_state.get("skill_gap_index_version") != st.session_state.data_version:
+        st.session_state.skill_gap_index = SkillGapIndex(occupation_skill_index, individual_skills_df.assign(user_id=SESSION_SKILLS_USER))
+        st.session_state.skill_gap_index_version = st.session_state.data_version
+    elif st.session_state.skill_gap_index_skills is not individual_skills_df:
+        st.session_state.skill_gap_index.update(SESSION_SKILLS_USER, diff_skill_scores(st.session_state.skill_gap_index_skills, individual_skills_df))
+    st.session_state.skill_gap_index_skills = individual_skills_df
+    return st.session_state.skill_gap_index
+
 def run_page3():
     st.header("Page 3: Systematic Opportunity (H^R) & Pathway Simulation")
     st.markdown("""
@@ -50,7 +102,7 @@ def run_page3():
     if "max_possible_skills_match" not in st.session_state:
         st.session_state.max_possible_skills_match = 100
     if "individual_skills_for_synergy" not in st.session_state:
-        st.session_state.individual_skills_for_synergy = st.session_state.individual_skills_df.copy()
+        st.session_state.individual_skills_for_synergy = st.session_state.individual_skills_df # st.data_editor returns a new frame on edit
 
     st.subheader("Systematic Opportunity ($H^R$) Inputs")
 
@@ -83,9 +135,10 @@ def run_page3():
     st.subheader("Synergy Inputs")
     st.markdown("Synergy measures the alignment between your individual skills and market demands.")
 
-    required_skills_for_selected_occupation = st.session_state.occupation_required_skills_df[
-        st.session_state.occupation_required_skills_df['occupation_name'] == st.session_state.selected_occupation
-    ].copy()
+    required_skills_by_occupation = get_required_skills_by_occupation(st.session_state.data_version, st.session_state.occupation_required_skills_df)
+    required_skills_for_selected_occupation = required_skills_by_occupation.get(
+        st.session_state.selected_occupation, st.session_state.occupation_required_skills_df.iloc[:0]
+    )
 
     st.markdown("#### Required Skills for Selected Occupation")
     st.dataframe(required_skills_for_selected_occupation)
@@ -106,42 +159,43 @@ def run_page3():
         help="The maximum possible score for skills matching (e.g., 100 for a perfect match of 100%)."
     )
 
+    hr_table = get_systematic_opportunity_table(
+        st.session_state.lambda_val, st.session_state.gamma_val,
+        st.session_state.data_version, st.session_state.occupational_data_df
+    )
+    occupation_skill_index = get_occupation_skill_index(
+        st.session_state.data_version, st.session_state.occupation_required_skills_df,
+        st.session_state.occupational_data_df
+    )
+    skill_gap_index = get_skill_gap_index(occupation_skill_index, st.session_state.individual_skills_for_synergy)
+
     if st.button("Calculate AI-Readiness Score (H^R and Synergy)"):
         # Ensure V^R is calculated first if not present
         if "vr_score" not in st.session_state:
             st.warning("Please calculate Idiosyncratic Readiness (V^R) on Page 2 first.")
         else:
-            current_occupation_data = st.session_state.occupational_data_df[
-                st.session_state.occupational_data_df['occupation_name'] == st.session_state.selected_occupation
-            ].iloc[0]
-
-            # Calculate H^R components
-            ai_enhancement_potential = calculate_ai_enhancement_potential(current_occupation_data['ai_enhancement_score'])
-            job_growth_projection = calculate_job_growth_projection(current_occupation_data['job_growth_rate_g'])
-            wage_premium = calculate_wage_premium(current_occupation_data['ai_skilled_wage'], current_occupation_data['median_wage'])
-            entry_accessibility = calculate_entry_accessibility(current_occupation_data['education_years_required'], current_occupation_data['experience_years_required'])
-            base_opportunity_score = calculate_base_opportunity_score(ai_enhancement_potential, job_growth_projection, wage_premium, entry_accessibility)
-            growth_multiplier = calculate_growth_multiplier(current_occupation_data['current_job_postings'], current_occupation_data['previous_job_postings'], st.session_state.lambda_val)
-            regional_multiplier = calculate_regional_multiplier(current_occupation_data['local_demand'], current_occupation_data['national_avg_demand'], current_occupation_data['remote_work_factor'], st.session_state.gamma_val)
-            hr_score = calculate_systematic_opportunity(base_opportunity_score, growth_multiplier, regional_multiplier) * 100 # Normalize to 0-100
-
-            # Calculate Synergy components
-            skills_match_score = calculate_skills_match_score(st.session_state.individual_skills_for_synergy, required_skills_for_selected_occupation)
-            timing_factor = calculate_timing_factor(st.session_state.individual_profile['years_experience'])
-            alignment_factor = calculate_alignment_factor(skills_match_score, st.session_state.max_possible_skills_match, timing_factor)
-            synergy_percentage = calculate_synergy_percentage(st.session_state.vr_score, hr_score, alignment_factor)
-
-            # Calculate Final AI-R Score
-            ai_r_score = calculate_ai_readiness_score(st.session_state.vr_score, hr_score, synergy_percentage, st.session_state.alpha, st.session_state.beta)
-
-            st.session_state.hr_score = hr_score
-            st.session_state.skills_match_score = skills_match_score
-            st.session_state.timing_factor = timing_factor
-            st.session_state.alignment_factor = alignment_factor
-            st.session_state.synergy_percentage = synergy_percentage
-            st.session_state.ai_r_score = ai_r_score
+            # Identical profile, skills, H^R and parameters (from any session) are served from the score cache;
+            # otherwise the session's graph recomputes only what changed since the last calculation. H^R is
+            # read from the precomputed occupation table.
+            scores = score_profile_cached(
+                get_score_cache(), st.session_state.individual_profile, st.session_state.individual_skills_for_synergy,
+                hr_table.loc[st.session_state.selected_occupation], required_skills_for_selected_occupation,
+                max_possible_match=st.session_state.max_possible_skills_match,
+                alpha=st.session_state.alpha, beta=st.session_state.beta,
+                lambda_val=st.session_state.lambda_val, gamma=st.session_state.gamma_val,
+                score_graph=st.session_state.score_graph
+            )
+            for score_name, score_value in scores.items():
+                st.session_state[score_name] = score_value
+            ai_r_score = scores['ai_r_score']
 
             st.success(f"AI-Readiness Score Calculated! Your AI-R Score: {ai_r_score:.2f}")
+            score_cache_stats = get_score_cache().stats()
+            st.caption(f"Score cache: {score_cache_stats['hits']} hits, {score_cache_stats['misses']} misses, {score_cache_stats['entries']} entries ({score_cache_stats['bytes'] / 1024:.1f} KiB)")
+
+    # Plotly is imported on first use, so the inputs above are painted before it loads
+    import plotly.express as px
+    import plotly.graph_objects as go
 
     if "ai_r_score" in st.session_state:
         st.subheader("Calculated AI-Readiness Score")
@@ -156,18 +210,19 @@ def run_page3():
             st.metric(label="AI-R Score", value=f"{st.session_state.ai_r_score:.2f}")
 
         st.markdown("#### H^R Components Breakdown")
+        selected_hr_components = hr_table.loc[st.session_state.selected_occupation]
         hr_components_data = {
             "Component": ["AI-Enhancement Potential", "Job Growth Projection", "Wage Premium", "Entry Accessibility"],
-            "Score": [calculate_ai_enhancement_potential(st.session_state.occupational_data_df[st.session_state.occupational_data_df['occupation_name'] == st.session_state.selected_occupation].iloc[0]['ai_enhancement_score']) * 100,
-                      calculate_job_growth_projection(st.session_state.occupational_data_df[st.session_state.occupational_data_df['occupation_name'] == st.session_state.selected_occupation].iloc[0]['job_growth_rate_g']),
-                      calculate_wage_premium(st.session_state.occupational_data_df[st.session_state.occupational_data_df['occupation_name'] == st.session_state.selected_occupation].iloc[0]['ai_skilled_wage'], st.session_state.occupational_data_df[st.session_state.occupational_data_df['occupation_name'] == st.session_state.selected_occupation].iloc[0]['median_wage']) * 100,
-                      calculate_entry_accessibility(st.session_state.occupational_data_df[st.session_state.occupational_data_df['occupation_name'] == st.session_state.selected_occupation].iloc[0]['education_years_required'], st.session_state.occupational_data_df[st.session_state.occupational_data_df['occupation_name'] == st.session_state.selected_occupation].iloc[0]['experience_years_required']) * 100
+            "Score": [selected_hr_components['ai_enhancement_potential'] * 100,
+                      selected_hr_components['job_growth_projection'],
+                      selected_hr_components['wage_premium'] * 100,
+                      selected_hr_components['entry_accessibility'] * 100
                      ]
         }
         hr_components_df = pd.DataFrame(hr_components_data)
-        fig_hr = px.bar(hr_components_df, x="Component", y="Score", title="H^R Base Components",
-                        labels={"Score": "Score (0-100%)"},
-                        color_discrete_sequence=px.colors.qualitative.Pastel)
+        fig_hr = render_chart("bar", hr_components_df, x="Component", y="Score", title="H^R Base Components",
+                              labels={"Score": "Score (0-100%)"},
+                              color_discrete_sequence=px.colors.qualitative.Pastel)
         st.plotly_chart(fig_hr)
 
         st.markdown("#### Overall AI-Readiness Score Contribution")
@@ -178,10 +233,136 @@ def run_page3():
                       st.session_state.beta * st.session_state.synergy_percentage]
         }
         overall_scores_df = pd.DataFrame(overall_scores_data)
-        fig_overall = px.pie(overall_scores_df, names="Component", values="Score", title="Overall AI-R Score Contribution",
-                             color_discrete_sequence=px.colors.qualitative.Pastel)
+        fig_overall = render_chart("pie", overall_scores_df, names="Component", values="Score", title="Overall AI-R Score Contribution",
+                                   color_discrete_sequence=px.colors.qualitative.Pastel)
         st.plotly_chart(fig_overall)
 
+        st.markdown("#### Uncertainty Bands")
+        st.markdown("""
+        Self-reported scores and market data are noisy. The inputs behind $V^R$, $H^R$ and the skills match are perturbed many times (Monte Carlo) and pushed through the same formulas; the bands show the range the scores fall in.
+        """)
+        uncertainty_level = st.slider(
+            "Input Uncertainty (%)", min_value=0, max_value=50, value=10, step=1,
+            help="Relative noise applied to each input: score inputs move by this share of their range, counts, hours, wages and postings by this relative amount."
+        )
+        occupations_by_name = get_occupations_by_name(st.session_state.data_version, st.session_state.occupational_data_df)
+        selected_occupation_row = occupations_by_name.loc[st.session_state.selected_occupation]
+        uncertainty_bands = simulate_ai_readiness_uncertainty(
+            st.session_state.individual_profile, selected_occupation_row, st.session_state.skills_match_score,
+            st.session_state.max_possible_skills_match, st.session_state.alpha, st.session_state.beta,
+            st.session_state.lambda_val, st.session_state.gamma_val, relative_noise=uncertainty_level / 100
+        )
+        uncertainty_bands = uncertainty_bands.rename(index={"vr_score": "V^R", "hr_score": "H^R", "synergy_percentage": "Synergy%", "ai_r_score": "AI-R"})
+        fig_uncertainty = go.Figure(go.Bar(
+            x=uncertainty_bands.index, y=uncertainty_bands['p50'],
+            error_y=dict(type="data", symmetric=False,
+                         array=uncertainty_bands['p95'] - uncertainty_bands['p50'],
+                         arrayminus=uncertainty_bands['p50'] - uncertainty_bands['p5'])
+        ))
+        fig_uncertainty.update_layout(title="Median Scores with 5th-95th Percentile Bands", yaxis_title="Score")
+        st.plotly_chart(fig_uncertainty)
+        st.dataframe(uncertainty_bands)
+
+        st.markdown("#### Alpha/Beta Sensitivity")
+        st.markdown(r"""
+        AI-R is linear in $\alpha$ and $\beta$, so the score of every occupation is evaluated over the full $\alpha \times \beta$ grid at once. The rank map shows where the selected occupation stands among all occupations for each parameter combination; the table summarizes how robust each occupation's ranking is.
+        """)
+        skills_match_all = skill_gap_index.skills_match(SESSION_SKILLS_USER).to_numpy()
+        all_occupation_scores = calculate_ai_readiness_batch(
+            st.session_state.vr_score, hr_table['hr_score'].to_numpy(), skills_match_all,
+            st.session_state.individual_profile['years_experience'], st.session_state.max_possible_skills_match,
+            st.session_state.alpha, st.session_state.beta
+        )
+        sensitivity_alphas = np.linspace(0.0, 1.0, 21)
+        sensitivity_betas = np.linspace(0.0, 1.0, 21)
+        ai_r_surface = calculate_ai_readiness_surface(
+            st.session_state.vr_score, hr_table['hr_score'].to_numpy(), all_occupation_scores['synergy_percentage'],
+            sensitivity_alphas, sensitivity_betas
+        )
+        occupation_index = hr_table.index.get_loc(st.session_state.selected_occupation)
+        rank_surface = calculate_occupation_ranks(ai_r_surface)[:, :, occupation_index]
+
+        st.metric(
+            label="Recommendation Stability",
+            value=f"{calculate_recommendation_stability(ai_r_surface, all_occupation_scores['ai_r_score']) * 100:.0f}%",
+            help="Share of the alpha x beta grid on which the occupation ranked first at the current alpha and beta stays first."
+        )
+        fig_rank = px.imshow(rank_surface, x=sensitivity_betas, y=sensitivity_alphas, origin="lower", aspect="auto",
+                             labels={"x": "Synergy Coefficient (beta)", "y": "Weight on Individual Factors (alpha)", "color": "Rank"},
+                             title=f"Rank of {st.session_state.selected_occupation} Among All Occupations",
+                             color_continuous_scale="Viridis_r")
+        st.plotly_chart(fig_rank)
+        st.dataframe(summarize_rank_sensitivity(ai_r_surface, hr_table.index, all_occupation_scores['ai_r_score']))
+
+    st.subheader("Top Occupation Recommendations")
+    st.markdown("""
+    Your profile scored against every occupation in the catalog and ranked by AI-Readiness Score, with the $H^R$, skills-match and synergy breakdown of each recommendation.
+    """)
+
+    if "vr_score" not in st.session_state:
+        st.info("Calculate your Idiosyncratic Readiness (V^R) on Page 2 to see recommendations.")
+    else:
+        if "top_k_occupations" not in st.session_state:
+            st.session_state.top_k_occupations = min(5, len(hr_table))
+        st.session_state.top_k_occupations = st.slider(
+            "Number of Recommendations", 1, max(len(hr_table), 2), min(st.session_state.top_k_occupations, len(hr_table)), 1,
+            help="How many of the highest-scoring occupations to show."
+        )
+        recommendations = recommend_occupations(
+            st.session_state.vr_score,
+            st.session_state.individual_profile['years_experience'],
+            st.session_state.individual_skills_for_synergy,
+            hr_table,
+            occupation_skill_index,
+            k=st.session_state.top_k_occupations,
+            max_possible_match=st.session_state.max_possible_skills_match,
+            alpha=st.session_state.alpha,
+            beta=st.session_state.beta
+        )
+        st.dataframe(recommendations[['rank', 'ai_r_score', 'hr_score', 'skills_match_score', 'synergy_percentage',
+                                      'base_opportunity_score', 'growth_multiplier', 'regional_multiplier']])
+        fig_recommendations = render_chart("bar", recommendations.reset_index(), x="occupation_name", y="ai_r_score",
+                                           title="Top Occupations by AI-Readiness Score",
+                                           labels={"occupation_name": "Occupation", "ai_r_score": "AI-R Score"},
+                                           color_discrete_sequence=px.colors.qualitative.Pastel)
+        st.plotly_chart(fig_recommendations)
+
+    st.subheader("Similar Occupations")
+    st.markdown("""
+    Occupations closest to your current skill profile, and occupations whose skill requirements are adjacent to the selected target occupation (natural career transitions), by cosine similarity of importance-weighted skill requirements.
+    """)
+    occupation_embedding = get_occupation_embedding(st.session_state.data_version, occupation_skill_index)
+    col_similar1, col_similar2 = st.columns(2)
+    with col_similar1:
+        st.markdown("#### Closest to Your Skills")
+        st.dataframe(find_similar_occupations(st.session_state.individual_skills_for_synergy, occupation_embedding, k=5))
+    with col_similar2:
+        st.markdown(f"#### Adjacent to {st.session_state.selected_occupation}")
+        st.dataframe(find_adjacent_occupations(st.session_state.selected_occupation, occupation_embedding, k=5))
+
+    st.subheader("Skill Gaps")
+    st.markdown("""
+    Required skills you are missing or below, weighted by their importance. Closing a gap raises your skills match for the occupation by its gain; gaps are listed in the order that raises the match fastest, with the match after closing each one. Edits to your skills update only the occupations that require the edited skills.
+    """)
+    skill_gaps = skill_gap_index.gaps(SESSION_SKILLS_USER, st.session_state.selected_occupation)
+    if skill_gaps.empty:
+        st.success(f"You meet every skill requirement of {st.session_state.selected_occupation}.")
+    else:
+        if "vr_score" in st.session_state and "hr_score" in st.session_state:
+            skill_gaps['projected_ai_r_score'] = calculate_ai_readiness_batch(
+                st.session_state.vr_score, st.session_state.hr_score, skill_gaps['projected_skills_match'],
+                st.session_state.individual_profile['years_experience'], st.session_state.max_possible_skills_match,
+                st.session_state.alpha, st.session_state.beta
+            )['ai_r_score']
+        st.markdown(f"#### Gap-Closing Path for {st.session_state.selected_occupation}")
+        st.dataframe(skill_gaps)
+    gap_scores_df = skill_gap_index.gap_scores(SESSION_SKILLS_USER).sort_values(ascending=False).rename_axis("occupation_name").reset_index()
+    fig_gaps = render_chart("bar", gap_scores_df, x="occupation_name", y="gap_score",
+                            title="Skill Gap by Occupation",
+                            labels={"occupation_name": "Occupation", "gap_score": "Skill Gap (Skills-Match Points)"},
+                            color_discrete_sequence=px.colors.qualitative.Pastel)
+    st.plotly_chart(fig_gaps)
+
     st.subheader("Pathway Simulation")
     st.markdown("""
     Simulate the impact of different learning pathways on your AI-Readiness Score. Choose a pathway and adjust completion and mastery levels to see projected changes.
@@ -217,20 +398,12 @@ def run_page3():
                 st.session_state.learning_pathways_df['pathway_name'] == st.session_state.selected_pathway
             ].iloc[0]
 
-            # Recalculate AI-Fluency, Domain-Expertise, Adaptive-Capacity based on current profile
-            profile = st.session_state.individual_profile
-            s1_current = calculate_technical_ai_skills(profile['prompting_score'], profile['tools_score'], profile['understanding_score'], profile['datalit_score'])
-            s2_current = calculate_ai_augmented_productivity(profile['output_quality_with_ai'], profile['output_quality_without_ai'], profile['time_without_ai'], profile['time_with_ai'])
-            s3_current = calculate_critical_ai_judgment(profile['errors_caught'], profile['total_ai_errors'], profile['appropriate_trust_decisions'], profile['total_decisions'])
-            s4_current = calculate_ai_learning_velocity(profile['delta_proficiency'], profile['delta_t_hours_invested'])
-            ai_fluency_current = calculate_ai_fluency(s1_current, s2_current, s3_current, s4_current)
-
-            education_foundation_current = calculate_education_foundation(profile['education_level'])
-            practical_experience_current = calculate_practical_experience(profile['years_experience'])
-            specialization_depth_current = calculate_specialization_depth(profile['portfolio_score'], profile['recognition_score'], profile['credentials_score'])
-            domain_expertise_current = calculate_domain_expertise(education_foundation_current, practical_experience_current, specialization_depth_current)
-
-            adaptive_capacity_current = calculate_adaptive_capacity(profile['cognitive_flexibility'], profile['social_emotional_intelligence'], profile['strategic_career_management'])
+            # Current AI-Fluency, Domain-Expertise, Adaptive-Capacity from the graph (recomputed only if the profile changed)
+            score_graph = st.session_state.score_graph
+            score_graph.update(st.session_state.individual_profile)
+            ai_fluency_current = score_graph.get('ai_fluency')
+            domain_expertise_current = score_graph.get('domain_expertise')
+            adaptive_capacity_current = score_graph.get('adaptive_capacity')
 
             # Simulate impact on V^R components
             ai_fluency_new, domain_expertise_new, adaptive_capacity_new = simulate_pathway_impact(
@@ -249,11 +422,11 @@ def run_page3():
             vr_score_new = calculate_idiosyncratic_readiness(ai_fluency_new, domain_expertise_new, adaptive_capacity_new) * 100
 
             # Recalculate new Synergy with new V^R (H^R assumed to be same for pathway simulation)
-            # Re-calculate individual skills df with potential pathway impacts if applicable (this is complex and not explicitly defined for skills, so will use current for simplicity for now)
-            # For a more robust solution, skills data should also be dynamically updated based on pathway impact
-            skills_match_score_new = calculate_skills_match_score(st.session_state.individual_skills_for_synergy, required_skills_for_selected_occupation)
-            timing_factor_new = calculate_timing_factor(st.session_state.individual_profile['years_experience'])
-            alignment_factor_new = calculate_alignment_factor(skills_match_score_new, st.session_state.max_possible_skills_match, timing_factor_new)
+            # Pathways define no skill-level impacts, so the skills match is unchanged: it is read from the
+            # skill-gap index instead of re-matched (see the Skill Gaps section for closing skill gaps)
+            skills_match_score_new = skill_gap_index.skills_match(SESSION_SKILLS_USER)[st.session_state.selected_occupation]
+            score_graph.update({'skills_match_score': skills_match_score_new, 'max_possible_match': st.session_state.max_possible_skills_match})
+            alignment_factor_new = score_graph.get('alignment_factor')
 
             synergy_percentage_new = calculate_synergy_percentage(vr_score_new, st.session_state.hr_score, alignment_factor_new)
 
@@ -283,12 +456,144 @@ def run_page3():
         }
         comparison_df = pd.DataFrame(comparison_data)
 
-        fig_comparison = px.bar(comparison_df.melt(id_vars="Metric", var_name="Type", value_name="Score"),
-                                x="Metric", y="Score", color="Type", barmode="group",
-                                title="Current vs. Projected AI-Readiness Scores",
-                                labels={"Score": "Score (0-100%)"},
-                                color_discrete_sequence=px.colors.qualitative.Bold)
+        fig_comparison = render_chart("bar", comparison_df.melt(id_vars="Metric", var_name="Type", value_name="Score"),
+                                      x="Metric", y="Score", color="Type", barmode="group",
+                                      title="Current vs. Projected AI-Readiness Scores",
+                                      labels={"Score": "Score (0-100%)"},
+                                      color_discrete_sequence=px.colors.qualitative.Bold)
         st.plotly_chart(fig_comparison)
 
+    st.subheader("What-If Grid")
+    st.markdown("""
+    Projected scores for every learning pathway across all completion and mastery levels, computed in one pass. Pick a pathway and metric to explore the grid without re-running the simulation.
+    """)
+
+    if "vr_score" not in st.session_state or "hr_score" not in st.session_state:
+        st.info("Calculate the initial AI-Readiness Score to see the what-if grid.")
+    else:
+        st.session_state.score_graph.update(st.session_state.individual_profile)
+        current_vr_components = st.session_state.score_graph.evaluate(['ai_fluency', 'domain_expertise', 'adaptive_capacity'])
+        what_if_grid = simulate_pathway_grid(
+            current_vr_components['ai_fluency'],
+            current_vr_components['domain_expertise'],
+            current_vr_components['adaptive_capacity'],
+            st.session_state.learning_pathways_df,
+            st.session_state.hr_score,
+            st.session_state.alignment_factor,
+            st.session_state.alpha,
+            st.session_state.beta
+        )
+        grid_metrics = {"AI-R": "ai_r_score", "V^R": "vr_score", "Synergy%": "synergy_percentage"}
+        col_grid1, col_grid2 = st.columns(2)
+        with col_grid1:
+            grid_pathway = st.selectbox("What-If Pathway", options=what_if_grid['pathway_name'].tolist(),
+                                        index=what_if_grid['pathway_name'].tolist().index(st.session_state.selected_pathway))
+        with col_grid2:
+            grid_metric = st.radio("What-If Metric", list(grid_metrics), horizontal=True)
+
+        pathway_index = what_if_grid['pathway_name'].tolist().index(grid_pathway)
+        fig_grid = px.imshow(what_if_grid[grid_metrics[grid_metric]][pathway_index],
+                             x=what_if_grid['mastery_score'], y=what_if_grid['completion_score'], origin="lower", aspect="auto",
+                             labels={"x": "Pathway Mastery Score", "y": "Pathway Completion Score", "color": f"Projected {grid_metric}"},
+                             title=f"Projected {grid_metric}: {grid_pathway}",
+                             color_continuous_scale="Viridis")
+        st.plotly_chart(fig_grid)
+
+    st.subheader("Pathway Portfolio Optimizer")
+    st.markdown("""
+    Find the combination of learning pathways that maximizes your projected AI-Readiness Score for the selected occupation within a budget, at the completion and mastery levels set above. Pathways are listed in the suggested order of study.
+    """)
+
+    budget_types = ["Number of Pathways"] + (["Hours"] if "duration_hours" in st.session_state.learning_pathways_df.columns else [])
+    if "portfolio_budget_type" not in st.session_state:
+        st.session_state.portfolio_budget_type = budget_types[0]
+    if "portfolio_budget" not in st.session_state:
+        st.session_state.portfolio_budget = 2.0
+
+    col_budget1, col_budget2 = st.columns(2)
+    with col_budget1:
+        st.session_state.portfolio_budget_type = st.radio(
+            "Budget Type", budget_types,
+            index=budget_types.index(st.session_state.portfolio_budget_type) if st.session_state.portfolio_budget_type in budget_types else 0,
+            help="Limit either the number of pathways taken or the total study hours."
+        )
+    with col_budget2:
+        st.session_state.portfolio_budget = st.number_input(
+            "Budget", min_value=0.0, value=float(st.session_state.portfolio_budget), step=1.0,
+            help="Maximum number of pathways, or maximum total hours, depending on the budget type."
+        )
+
+    if st.button("Optimize Pathway Portfolio"):
+        if "vr_score" not in st.session_state or "hr_score" not in st.session_state:
+            st.warning("Please calculate the initial AI-Readiness Score first.")
+        else:
+            st.session_state.score_graph.update(st.session_state.individual_profile)
+            current_vr_components = st.session_state.score_graph.evaluate(['ai_fluency', 'domain_expertise', 'adaptive_capacity'])
+            st.session_state.pathway_portfolio = optimize_pathway_portfolio(
+                current_vr_components['ai_fluency'],
+                current_vr_components['domain_expertise'],
+                current_vr_components['adaptive_capacity'],
+                st.session_state.learning_pathways_df,
+                st.session_state.portfolio_budget,
+                hr_score=st.session_state.hr_score,
+                alignment_factor=st.session_state.alignment_factor,
+                alpha=st.session_state.alpha,
+                beta=st.session_state.beta,
+                cost_column="duration_hours" if st.session_state.portfolio_budget_type == "Hours" else None,
+                completion_score=st.session_state.pathway_completion_score,
+                mastery_score=st.session_state.pathway_mastery_score
+            )
+            st.success(f"Optimal Portfolio Found! Projected AI-R Score: {st.session_state.pathway_portfolio['ai_r_score']:.2f}")
+
+    if "pathway_portfolio" in st.session_state:
+        portfolio = st.session_state.pathway_portfolio
+        col_portfolio1, col_portfolio2, col_portfolio3 = st.columns(3)
+        with col_portfolio1:
+            st.metric(label="Current AI-R Score", value=f"{st.session_state.ai_r_score:.2f}")
+        with col_portfolio2:
+            st.metric(label="Projected AI-R Score", value=f"{portfolio['ai_r_score']:.2f}")
+        with col_portfolio3:
+            st.metric(label="Budget Used", value=f"{portfolio['total_cost']:.0f}")
+
+        if portfolio['sequence']:
+            portfolio_df = st.session_state.learning_pathways_df.set_index('pathway_id').loc[portfolio['pathway_ids']].reset_index()
+            portfolio_df.insert(0, 'step', range(1, len(portfolio_df) + 1))
+            st.dataframe(portfolio_df, hide_index=True)
+        else:
+            st.info("No combination of pathways within this budget improves your projected AI-Readiness Score.")
 
+    st.subheader("AI-R Trajectory")
+    st.markdown("""
+    Project your AI-Readiness Score month by month. Pathways are studied back to back in the order selected below, at the completion and mastery levels set above; your experience grows each month and job postings for the selected occupation follow its projected growth rate.
+    """)
+    trajectory_pathways = st.multiselect(
+        "Trajectory Pathways", st.session_state.learning_pathways_df['pathway_name'].tolist(),
+        help="Pathways in the order you plan to study them."
+    )
+    col_trajectory1, col_trajectory2 = st.columns(2)
+    with col_trajectory1:
+        trajectory_months = st.slider("Horizon (Months)", min_value=6, max_value=120, value=60, step=6)
+    with col_trajectory2:
+        study_hours_per_month = st.number_input("Study Hours per Month", min_value=1.0, value=20.0, step=1.0)
 
+    if "ai_r_score" in st.session_state:
+        trajectory = simulate_ai_readiness_trajectory(
+            pd.DataFrame([st.session_state.individual_profile]),
+            get_occupations_by_name(st.session_state.data_version, st.session_state.occupational_data_df).loc[[st.session_state.selected_occupation]],
+            st.session_state.learning_pathways_df,
+            build_pathway_schedule(trajectory_pathways, st.session_state.learning_pathways_df, trajectory_months, study_hours_per_month),
+            st.session_state.skills_match_score,
+            n_periods=trajectory_months,
+            max_possible_match=st.session_state.max_possible_skills_match,
+            alpha=st.session_state.alpha, beta=st.session_state.beta,
+            lambda_val=st.session_state.lambda_val, gamma=st.session_state.gamma_val,
+            completion_score=st.session_state.pathway_completion_score,
+            mastery_score=st.session_state.pathway_mastery_score
+        )
+        trajectory_df = pd.DataFrame(trajectory[0], columns=TRAJECTORY_METRICS).rename_axis("month").reset_index()
+        fig_trajectory = render_chart("line", trajectory_df, x="month", y=["vr_score", "hr_score", "ai_r_score"],
+                                      title=f"Projected Scores for {st.session_state.selected_occupation}",
+                                      labels={"month": "Month", "value": "Score", "variable": "Metric"})
+        st.plotly_chart(fig_trajectory)
+    else:
+        st.info("Calculate the initial AI-Readiness Score to project its trajectory.")
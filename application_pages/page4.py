@@ -0,0 +1,114 @@
+
+import glob
+import os
+import streamlit as st
+from application_pages.utils import (
+    CHART_MAX_BARS,
+    COHORT_COLUMNS,
+    calculate_systematic_opportunity_table,
+    iter_columnar_chunks,
+    iter_synthetic_cohort_scores,
+    render_chart,
+    summarize_scored_results
+)
+
+METRIC_LABELS = {"ai_r_score": "AI-R", "vr_score": "V^R", "hr_score": "H^R", "synergy_percentage": "Synergy%", "skills_match_score": "Skills Match"}
+# Default batch-scored results file (batch_score.py output) for the "Batch-Scored File" source
+COHORT_SCORES_PATH = os.environ.get("QULAB_COHORT_SCORES", "")
+COHORT_CHUNK_SIZE = 500_000
+
+@st.cache_data(max_entries=8, show_spinner="Summarizing scored results...")
+def get_file_aggregates(path, file_signature):
+    # file_signature (paths, sizes and modification times) invalidates the entry when the file changes
+    return summarize_scored_results(iter_columnar_chunks(path, COHORT_CHUNK_SIZE, COHORT_COLUMNS))
+
+@st.cache_data(max_entries=8, show_spinner="Scoring synthetic cohort...")
+def get_synthetic_aggregates(n_profiles, lambda_val, gamma_val, max_possible_match, alpha, beta, data_version,
+                             _occupational_data_df, _occupation_required_skills_df):
+    hr_table = calculate_systematic_opportunity_table(_occupational_data_df, lambda_val, gamma_val)
+    return summarize_scored_results(iter_synthetic_cohort_scores(
+        n_profiles, hr_table, _occupation_required_skills_df, chunk_size=COHORT_CHUNK_SIZE // max(len(hr_table), 1) or 1,
+        max_possible_match=max_possible_match, alpha=alpha, beta=beta))
+
+def get_file_signature(path):
+    paths = sorted(glob.glob(os.path.join(path, '**'), recursive=True)) if os.path.isdir(path) else [path]
+    return tuple((file_path, os.path.getsize(file_path), os.path.getmtime(file_path)) for file_path in paths if os.path.isfile(file_path))
+
+def run_page4():
+    st.header("Page 4: Cohort Analytics")
+    st.markdown("""
+    Distribution views over a whole cohort of AI-Readiness scores: every profile scored against every occupation with the same formulas as the previous pages. Scores are summarized in a single streaming pass (histograms, quantile sketches and per-occupation sums), so cohorts of millions of scored rows are summarized without loading them into memory at once.
+    """)
+
+    cohort_source = st.radio(
+        "Cohort Source", ["Synthetic Cohort", "Batch-Scored File"], horizontal=True,
+        help="Score a synthetic cohort against the current occupations and parameters, or summarize the output of batch_score.py."
+    )
+    if cohort_source == "Synthetic Cohort":
+        n_profiles = st.number_input(
+            "Cohort Size (Profiles)", min_value=1_000, max_value=10_000_000, value=100_000, step=10_000,
+            help="Synthetic profiles, each scored against every occupation in the catalog."
+        )
+        aggregates = get_synthetic_aggregates(
+            int(n_profiles), st.session_state.get("lambda_val", 0.3), st.session_state.get("gamma_val", 0.2),
+            st.session_state.get("max_possible_skills_match", 100), st.session_state.alpha, st.session_state.beta,
+            st.session_state.data_version, st.session_state.occupational_data_df, st.session_state.occupation_required_skills_df
+        )
+    else:
+        scores_path = st.text_input(
+            "Scored Results File", value=COHORT_SCORES_PATH,
+            help="Output of batch_score.py: CSV, Parquet (a file or a directory of parts), Arrow IPC / Feather or a .npy column directory."
+        )
+        if not scores_path or not os.path.exists(scores_path):
+            st.info("Enter the path of a batch-scored results file, e.g. one written by `python batch_score.py profiles.parquet --output scores.parquet`.")
+            return
+        aggregates = get_file_aggregates(scores_path, get_file_signature(scores_path))
+
+    if aggregates.rows == 0:
+        st.warning("The cohort has no scored rows.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(label="Scored Rows", value=f"{aggregates.rows:,}")
+    with col2:
+        st.metric(label="Users", value=f"{aggregates.users:,}")
+    with col3:
+        st.metric(label="Occupations", value=f"{len(aggregates.by_occupation.keys):,}")
+
+    st.subheader("Score Distribution")
+    distribution_metric = st.selectbox(
+        "Distribution Metric", list(METRIC_LABELS), format_func=METRIC_LABELS.get,
+        help="Score whose distribution over all (user, occupation) rows is shown."
+    )
+    # Plotly is imported on first use, so the page's first paint does not wait for it
+    import plotly.express as px
+
+    histogram = aggregates.histograms[distribution_metric]
+    user_value = st.session_state.get(distribution_metric)
+    if user_value is not None:
+        user_percentile = aggregates.sketches[distribution_metric].rank(user_value) * 100
+        st.metric(label=f"Your {METRIC_LABELS[distribution_metric]} Percentile", value=f"{user_percentile:.1f}",
+                  help="Share of cohort rows scoring at or below your score (within 1%).")
+    else:
+        st.info("Calculate your scores on Pages 2 and 3 to see where you stand in the cohort.")
+    # Binned while streaming, so the figure holds one bar per bin whatever the cohort size
+    fig_distribution = render_chart("histogram", (histogram.counts, histogram.edges()),
+                                    title=f"{METRIC_LABELS[distribution_metric]} Distribution", x_title=METRIC_LABELS[distribution_metric],
+                                    marker_x=user_value, marker_label="You", color=px.colors.qualitative.Pastel[0])
+    st.plotly_chart(fig_distribution)
+
+    st.markdown("#### Percentiles")
+    st.markdown("Quantile sketch estimates, within 1% of the exact values.")
+    st.dataframe(aggregates.percentiles().rename(index=METRIC_LABELS))
+
+    st.subheader("By Occupation")
+    occupation_means = aggregates.by_occupation.means().sort_values("ai_r_score", ascending=False)
+    st.dataframe(occupation_means.rename(columns={**METRIC_LABELS, "skill_gap": "Skill Gap", "count": "Rows"}).rename_axis("occupation_name"))
+    # The CHART_MAX_BARS occupations with the highest average AI-R
+    fig_occupations = render_chart("bar", occupation_means.head(CHART_MAX_BARS).rename_axis("occupation_name").reset_index(),
+                                   x="occupation_name", y=["synergy_percentage", "skill_gap"], barmode="group",
+                                   title="Average Synergy% and Skill Gap by Occupation (Highest Average AI-R)",
+                                   labels={"occupation_name": "Occupation", "value": "Average", "variable": "Metric"},
+                                   color_discrete_sequence=px.colors.qualitative.Pastel)
+    st.plotly_chart(fig_occupations)
@@ -1,4 +1,17 @@
 
+import contextvars
+import functools
+import glob
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 import pandas as pd
 import numpy as np
 
@@ -32,21 +45,13 @@ def calculate_ai_learning_velocity(delta_proficiency, delta_t_hours_invested):
 def calculate_ai_fluency(s1, s2, s3, s4):
     return 0.1 * s1 + 0.2 * s2 + 0.3 * s3 + 0.4 * s4
 
+EDUCATION_FOUNDATION = {
+    "PhD": 1.0, "Master's": 0.8, "Bachelor's": 0.6, "Associate's/Certificate": 0.4,
+    "HS + significant coursework": 0.2, "Some College": 0.3
+}
+
 def calculate_education_foundation(education_level):
-    if education_level == "PhD":
-        return 1.0
-    elif education_level == "Master's":
-        return 0.8
-    elif education_level == "Bachelor's":
-        return 0.6
-    elif education_level == "Associate's/Certificate":
-        return 0.4
-    elif education_level == "HS + significant coursework":
-        return 0.2
-    elif education_level == "Some College":
-        return 0.3
-    else:
-        return 0.0
+    return EDUCATION_FOUNDATION.get(education_level, 0.0)
 
 def calculate_practical_experience(years_experience, gamma=0.15):
     if (years_experience + (1 / gamma)) == 0:
@@ -112,15 +117,12 @@ def calculate_skills_match_score(user_skills_df, required_skills_df):
     if merged_df.empty:
         return 0
 
-    weighted_sum = 0
     total_importance = required_skills_df['skill_importance'].sum()
 
     if total_importance == 0:
         return 0
 
-    for _, row in merged_df.iterrows():
-        weighted_sum += (min(row['individual_skill_score'], row['required_skill_score']) / 100) * row['skill_importance']
-
+    weighted_sum = ((np.minimum(merged_df['individual_skill_score'].to_numpy(dtype=float), merged_df['required_skill_score'].to_numpy(dtype=float)) / 100) * merged_df['skill_importance'].to_numpy(dtype=float)).sum()
 
     return (weighted_sum / total_importance) * 100
 
@@ -152,6 +154,1803 @@ def simulate_pathway_impact(current_ai_fluency, current_domain_expertise, curren
 
     return ai_fluency, domain_expertise, adaptive_capacity
 
+# The scalar formulas above run in well under a microsecond, less than a timed wrapper costs, so
+# hot-path timing leaves them unwrapped (their time counts towards whichever timed function or method
+# calls them, e.g. ScoreGraph.evaluate); the DataFrame-based skills match is slower and stays timed
+SCALAR_FORMULA_NAMES = frozenset(name for name, value in globals().items() if inspect.isfunction(value) and value.__module__ == __name__) - {
+    'calculate_skills_match_score'}
+
+# Vectorized (batch) scoring
+# Array counterparts of the scalar formulas above. Every function accepts scalars,
+# NumPy arrays or pandas Series (broadcasting applies) and reproduces the scalar
+# division guards and clamps with masks, so results match element for element.
+
+EDUCATION_LEVELS = list(EDUCATION_FOUNDATION)
+EDUCATION_FOUNDATION_SCORES = np.array(list(EDUCATION_FOUNDATION.values()) + [0.0]) # last entry: any other level
+PATHWAY_IMPACT_COLUMNS = ['impact_ai_fluency', 'impact_domain_expertise', 'impact_adaptive_capacity']
+
+def _as_float_array(values):
+    return np.asarray(values, dtype=float)
+
+def _index_codes(index, values):
+    # Positions of values in index (-1 when absent). Categorical values are looked up once per
+    # category and then gathered by their integer codes, with no per-row string hashing.
+    if isinstance(getattr(values, 'dtype', None), pd.CategoricalDtype):
+        category_codes = np.r_[index.get_indexer(values.cat.categories), -1] # code -1 (missing) stays -1
+        return category_codes[np.asarray(values.cat.codes)]
+    return index.get_indexer(values)
+
+def _unique_index(values, name=None):
+    # Unique values in order of appearance as a plain (non-categorical) index
+    unique = pd.unique(values)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        unique = unique.astype(values.cat.categories.dtype)
+    return pd.Index(unique, name=name)
+
+def _safe_divide(numerator, denominator, fill=0.0):
+    numerator, denominator = np.broadcast_arrays(_as_float_array(numerator), _as_float_array(denominator))
+    out = np.full(numerator.shape, fill, dtype=float)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+def calculate_technical_ai_skills_batch(prompting, tools, understanding, data_lit):
+    return calculate_technical_ai_skills(_as_float_array(prompting), _as_float_array(tools), _as_float_array(understanding), _as_float_array(data_lit))
+
+def calculate_ai_augmented_productivity_batch(output_quality_with_ai, output_quality_without_ai, time_without_ai, time_with_ai):
+    quality_ratio = _safe_divide(output_quality_with_ai, output_quality_without_ai)
+    time_ratio = _safe_divide(time_without_ai, time_with_ai)
+    valid = (_as_float_array(output_quality_without_ai) != 0) & (_as_float_array(time_with_ai) != 0)
+    return np.where(valid, quality_ratio * time_ratio, 0.0)
+
+def calculate_critical_ai_judgment_batch(errors_caught, total_ai_errors, appropriate_trust_decisions, total_decisions):
+    term1 = _safe_divide(errors_caught, np.where(_as_float_array(total_ai_errors) > 0, total_ai_errors, 0))
+    term2 = _safe_divide(appropriate_trust_decisions, np.where(_as_float_array(total_decisions) > 0, total_decisions, 0))
+    return 1 - (term1 + term2) / 2
+
+def calculate_ai_learning_velocity_batch(delta_proficiency, delta_t_hours_invested):
+    return _safe_divide(delta_proficiency, delta_t_hours_invested)
+
+def calculate_education_foundation_batch(education_level):
+    if not isinstance(getattr(education_level, 'dtype', None), pd.CategoricalDtype):
+        education_level = pd.Index(np.atleast_1d(np.asarray(education_level, dtype=object)))
+    codes = _index_codes(pd.Index(EDUCATION_LEVELS), education_level)
+    scores = EDUCATION_FOUNDATION_SCORES[codes] # unknown levels map to code -1, i.e. the trailing 0.0
+    return scores if np.ndim(education_level) else scores[0]
+
+def calculate_practical_experience_batch(years_experience, gamma=0.15):
+    years_experience = _as_float_array(years_experience)
+    return _safe_divide(years_experience, years_experience + (1 / gamma))
+
+def calculate_job_growth_projection_batch(growth_rate_g):
+    return np.trunc(np.clip(50 + (_as_float_array(growth_rate_g) * 100), 0, 100))
+
+def calculate_wage_premium_batch(ai_skilled_wage, median_wage):
+    return _safe_divide(_as_float_array(ai_skilled_wage) - _as_float_array(median_wage), median_wage)
+
+def calculate_entry_accessibility_batch(education_years_required, experience_years_required):
+    denominator = 1 + 0.1 * (_as_float_array(education_years_required) + _as_float_array(experience_years_required))
+    return _safe_divide(1.0, denominator)
+
+def calculate_growth_multiplier_batch(current_job_postings, previous_job_postings, lambda_val=0.3):
+    ratio = _safe_divide(current_job_postings, previous_job_postings, fill=1.0)
+    return np.where(_as_float_array(previous_job_postings) == 0, 1.0, ratio ** lambda_val)
+
+def calculate_regional_multiplier_batch(local_demand, national_avg_demand, remote_work_factor, gamma=0.2):
+    demand_ratio = _safe_divide(local_demand, national_avg_demand)
+    multiplier = 1 + gamma * (demand_ratio + _as_float_array(remote_work_factor) - 1)
+    return np.where(_as_float_array(national_avg_demand) == 0, 1.0, multiplier)
+
+def calculate_timing_factor_batch(years_experience):
+    years_experience = _as_float_array(years_experience)
+    return np.where(years_experience <= 0, 1.0, 1 + (years_experience / 5))
+
+def calculate_alignment_factor_batch(skills_match_score, max_possible_match, timing_factor):
+    return _safe_divide(skills_match_score, max_possible_match) * _as_float_array(timing_factor)
+
+def simulate_pathway_impact_batch(current_ai_fluency, current_domain_expertise, current_adaptive_capacity, impact_ai_fluency, impact_domain_expertise, impact_adaptive_capacity, completion_score=1.0, mastery_score=1.0):
+    completion_score, mastery_score = _as_float_array(completion_score), _as_float_array(mastery_score)
+    ai_fluency = np.minimum(_as_float_array(current_ai_fluency) + _as_float_array(impact_ai_fluency) * completion_score * mastery_score, 1.0)
+    domain_expertise = np.minimum(_as_float_array(current_domain_expertise) + _as_float_array(impact_domain_expertise) * completion_score * mastery_score, 1.0)
+    adaptive_capacity = np.minimum(_as_float_array(current_adaptive_capacity) + _as_float_array(impact_adaptive_capacity) * completion_score * mastery_score, 1.0)
+    return ai_fluency, domain_expertise, adaptive_capacity
+
+def simulate_pathway_grid(current_ai_fluency, current_domain_expertise, current_adaptive_capacity, learning_pathways_df, hr_score, alignment_factor, alpha, beta,
+                          completion_scores=np.linspace(0.0, 1.0, 21), mastery_scores=np.linspace(0.0, 1.0, 21)):
+    # Every pathway over a full completion x mastery grid in one broadcast; each metric is a
+    # (pathways, completion, mastery) cube matching simulate_pathway_impact cell by cell
+    completion_scores = _as_float_array(completion_scores)
+    mastery_scores = _as_float_array(mastery_scores)
+    impacts = learning_pathways_df[PATHWAY_IMPACT_COLUMNS].to_numpy(dtype=float)[:, :, None, None]
+    ai_fluency, domain_expertise, adaptive_capacity = simulate_pathway_impact_batch(
+        current_ai_fluency, current_domain_expertise, current_adaptive_capacity,
+        impacts[:, 0], impacts[:, 1], impacts[:, 2],
+        completion_scores[None, :, None], mastery_scores[None, None, :]
+    )
+    vr_score = calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity) * 100
+    synergy_percentage = calculate_synergy_percentage(vr_score, hr_score, alignment_factor)
+    return {
+        'pathway_name': learning_pathways_df['pathway_name'].to_numpy(),
+        'completion_score': completion_scores, 'mastery_score': mastery_scores,
+        'ai_fluency': ai_fluency, 'domain_expertise': domain_expertise, 'adaptive_capacity': adaptive_capacity,
+        'vr_score': vr_score, 'synergy_percentage': synergy_percentage,
+        'ai_r_score': calculate_ai_readiness_score(vr_score, hr_score, synergy_percentage, alpha, beta)
+    }
+
+def calculate_idiosyncratic_readiness_batch(profiles, gamma=0.15):
+    # profiles: individual_profiles_df or any mapping of column name -> array
+    s1 = calculate_technical_ai_skills_batch(profiles['prompting_score'], profiles['tools_score'], profiles['understanding_score'], profiles['datalit_score'])
+    s2 = calculate_ai_augmented_productivity_batch(profiles['output_quality_with_ai'], profiles['output_quality_without_ai'], profiles['time_without_ai'], profiles['time_with_ai'])
+    s3 = calculate_critical_ai_judgment_batch(profiles['errors_caught'], profiles['total_ai_errors'], profiles['appropriate_trust_decisions'], profiles['total_decisions'])
+    s4 = calculate_ai_learning_velocity_batch(profiles['delta_proficiency'], profiles['delta_t_hours_invested'])
+    ai_fluency = calculate_ai_fluency(s1, s2, s3, s4)
+
+    education_foundation = calculate_education_foundation_batch(profiles['education_level'])
+    practical_experience = calculate_practical_experience_batch(profiles['years_experience'], gamma)
+    specialization_depth = calculate_specialization_depth(_as_float_array(profiles['portfolio_score']), _as_float_array(profiles['recognition_score']), _as_float_array(profiles['credentials_score']))
+    domain_expertise = calculate_domain_expertise(education_foundation, practical_experience, specialization_depth)
+
+    adaptive_capacity = calculate_adaptive_capacity(_as_float_array(profiles['cognitive_flexibility']), _as_float_array(profiles['social_emotional_intelligence']), _as_float_array(profiles['strategic_career_management']))
+
+    vr_score = calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity) * 100 # Normalize to 0-100
+
+    return pd.DataFrame({
+        's1': s1, 's2': s2, 's3': s3, 's4': s4, 'ai_fluency': ai_fluency,
+        'education_foundation': education_foundation, 'practical_experience': practical_experience,
+        'specialization_depth': specialization_depth, 'domain_expertise': domain_expertise,
+        'adaptive_capacity': adaptive_capacity, 'vr_score': vr_score
+    }, index=getattr(profiles, 'index', None))
+
+def calculate_systematic_opportunity_batch(occupations, lambda_val=0.3, gamma=0.2):
+    # occupations: occupational_data_df or any mapping of column name -> array
+    ai_enhancement_potential = _as_float_array(occupations['ai_enhancement_score'])
+    job_growth_projection = calculate_job_growth_projection_batch(occupations['job_growth_rate_g'])
+    wage_premium = calculate_wage_premium_batch(occupations['ai_skilled_wage'], occupations['median_wage'])
+    entry_accessibility = calculate_entry_accessibility_batch(occupations['education_years_required'], occupations['experience_years_required'])
+    base_opportunity_score = calculate_base_opportunity_score(ai_enhancement_potential, job_growth_projection, wage_premium, entry_accessibility)
+    growth_multiplier = calculate_growth_multiplier_batch(occupations['current_job_postings'], occupations['previous_job_postings'], lambda_val)
+    regional_multiplier = calculate_regional_multiplier_batch(occupations['local_demand'], occupations['national_avg_demand'], occupations['remote_work_factor'], gamma)
+    hr_score = calculate_systematic_opportunity(base_opportunity_score, growth_multiplier, regional_multiplier) * 100 # Normalize to 0-100
+
+    return pd.DataFrame({
+        'ai_enhancement_potential': ai_enhancement_potential, 'job_growth_projection': job_growth_projection,
+        'wage_premium': wage_premium, 'entry_accessibility': entry_accessibility,
+        'base_opportunity_score': base_opportunity_score, 'growth_multiplier': growth_multiplier,
+        'regional_multiplier': regional_multiplier, 'hr_score': hr_score
+    }, index=getattr(occupations, 'index', None))
+
+def calculate_systematic_opportunity_table(occupational_data_df, lambda_val=0.3, gamma=0.2):
+    # H^R and all of its components for the whole catalog, indexed by occupation_name
+    hr_table = calculate_systematic_opportunity_batch(occupational_data_df, lambda_val, gamma)
+    hr_table.index = pd.Index(occupational_data_df['occupation_name'], name='occupation_name')
+    return hr_table
+
+def compute_data_version(*dataframes):
+    # Content hash of the given tables, used as a cache key for derived tables
+    digest = hashlib.sha1()
+    for df in dataframes:
+        digest.update(repr(list(df.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def calculate_ai_readiness_batch(vr_score, hr_score, skills_match_score, years_experience, max_possible_match, alpha, beta):
+    # Inputs broadcast, e.g. vr_score[:, None] against hr_score[None, :] scores users x occupations
+    timing_factor = calculate_timing_factor_batch(years_experience)
+    alignment_factor = calculate_alignment_factor_batch(skills_match_score, max_possible_match, timing_factor)
+    synergy_percentage = calculate_synergy_percentage(_as_float_array(vr_score), _as_float_array(hr_score), alignment_factor)
+    ai_r_score = calculate_ai_readiness_score(_as_float_array(vr_score), _as_float_array(hr_score), synergy_percentage, alpha, beta)
+    return {
+        'timing_factor': timing_factor, 'alignment_factor': alignment_factor,
+        'synergy_percentage': synergy_percentage, 'ai_r_score': ai_r_score
+    }
+
+def build_occupation_skill_index(occupation_required_skills_df, occupations=None):
+    # Array layout of the long-format required-skills table, grouped by occupation. It depends only
+    # on reference data, so it can be built once per data version and reused for every match.
+    if occupations is None:
+        occupations = occupation_required_skills_df['occupation_name']
+    occupations = _unique_index(pd.Series(occupations), name='occupation_name')
+    required = occupation_required_skills_df[_index_codes(occupations, occupation_required_skills_df['occupation_name']) >= 0]
+
+    # Only required skills can contribute, so they define the skill axis
+    skills = _unique_index(required['skill_name'])
+    occupation_codes = _index_codes(occupations, required['occupation_name'])
+    order = np.argsort(occupation_codes, kind='stable')
+    occupation_codes = occupation_codes[order]
+    importance = required['skill_importance'].to_numpy(dtype=float)[order]
+    segment_starts = np.flatnonzero(np.r_[True, np.diff(occupation_codes) != 0]) if len(occupation_codes) else np.zeros(0, dtype=int)
+    return {
+        'occupations': occupations,
+        'skills': skills,
+        'occupation_codes': occupation_codes,
+        'skill_codes': _index_codes(skills, required['skill_name'])[order],
+        'required_scores': required['required_skill_score'].to_numpy(dtype=float)[order],
+        'importance': importance,
+        'total_importance': np.bincount(occupation_codes, weights=importance, minlength=len(occupations)),
+        'segment_starts': segment_starts,
+        'segment_occupations': occupation_codes[segment_starts]
+    }
+
+def _skill_scores(individual_skills_df):
+    # Non-numeric scores become NaN, which (as in calculate_skills_match_score) makes every match using them NaN
+    return pd.to_numeric(individual_skills_df['individual_skill_score'], errors='coerce').to_numpy(dtype=float)
+
+def build_user_skill_matrix(individual_skills_df, skills):
+    # Dense users x skills score matrix over the given skill axis; missing skills score 0. The skills
+    # match is a sum over a user's skill rows, and calculate_skills_match_score credits repeated rows of
+    # a skill separately, so a user's k-th row of a skill goes to the user's k-th matrix row: users with
+    # repeated skills get several adjacent rows (users repeats their id) whose matches add up.
+    users = pd.Index(individual_skills_df['user_id'].dropna().unique(), name='user_id')
+    user_codes = users.get_indexer(individual_skills_df['user_id'])
+    skill_codes = _index_codes(skills, individual_skills_df['skill_name'])
+    known = (user_codes >= 0) & (skill_codes >= 0)
+    user_codes, skill_codes = user_codes[known], skill_codes[known]
+    # Occurrence number of each row within its (user, skill) run, in table order
+    keys = user_codes * len(skills) + skill_codes
+    order = np.argsort(keys, kind='stable')
+    positions = np.arange(len(keys))
+    run_starts = np.maximum.accumulate(np.where(np.r_[True, keys[order][1:] != keys[order][:-1]], positions, 0)) if len(keys) else positions
+    occurrences = np.empty(len(keys), dtype=int)
+    occurrences[order] = positions - run_starts
+    depth = int(occurrences.max()) + 1 if len(occurrences) else 1
+    # Every user has an occurrence-0 row, even with no known skills
+    row_keys = np.unique(np.r_[np.arange(len(users)) * depth, user_codes * depth + occurrences])
+    user_skill_matrix = np.zeros((len(row_keys), len(skills)))
+    user_skill_matrix[np.searchsorted(row_keys, user_codes * depth + occurrences), skill_codes] = _skill_scores(individual_skills_df)[known]
+    return users[row_keys // depth], user_skill_matrix
+
+def _sum_user_rows(users, values):
+    # Adds up the adjacent rows build_user_skill_matrix gives a user with repeated skills (NaN propagates)
+    if users.is_unique:
+        return users, values
+    starts = np.flatnonzero(~users.duplicated())
+    return users[starts], np.add.reduceat(values, starts, axis=0)
+
+def _skill_vector(individual_skills_df, skills):
+    # One person's scores over the given skill axis for similarity search: repeated skills add up and
+    # missing scores count as 0
+    users, user_skill_matrix = build_user_skill_matrix(individual_skills_df.assign(user_id=0), skills)
+    return np.nan_to_num(user_skill_matrix).sum(axis=0)
+
+def calculate_skills_match_from_matrix(user_skill_matrix, skill_index, max_block_elements=2**22, matrix_skills=None):
+    # Weighted element-wise minima of user scores against requirements, summed per occupation.
+    # matrix_skills: skill axis of user_skill_matrix when it is not skill_index['skills'] (e.g. a stored,
+    # memory-mapped matrix); only the needed columns of one block of rows are read at a time.
+    match = np.zeros((len(user_skill_matrix), len(skill_index['occupations'])))
+    skill_codes = skill_index['skill_codes']
+    if len(skill_codes) == 0:
+        return match
+
+    missing_skills = None
+    if matrix_skills is not None:
+        skill_codes = pd.Index(matrix_skills).get_indexer(skill_index['skills'][skill_codes])
+        missing_skills = skill_codes < 0
+        skill_codes = np.maximum(skill_codes, 0)
+    block_size = max(1, max_block_elements // len(skill_codes))
+    for start in range(0, len(user_skill_matrix), block_size):
+        block = user_skill_matrix[start:start + block_size, skill_codes]
+        if missing_skills is not None:
+            block = np.where(missing_skills, 0.0, block)
+        weighted = (np.minimum(block, skill_index['required_scores']) / 100) * skill_index['importance']
+        match[start:start + block_size, skill_index['segment_occupations']] = np.add.reduceat(weighted, skill_index['segment_starts'], axis=1)
+
+    return _safe_divide(match, skill_index['total_importance']) * 100
+
+def calculate_skills_match_matrix(individual_skills_df, occupation_required_skills_df, occupations=None, max_block_elements=2**22, skill_index=None):
+    # Scores every user against every occupation in one pass: a dense user x skill matrix is
+    # compared with the (sparse, long-format) occupation x skill requirements, and the weighted
+    # element-wise minima are summed per occupation. Returns a users x occupations DataFrame.
+    if skill_index is None:
+        skill_index = build_occupation_skill_index(occupation_required_skills_df, occupations)
+    users, user_skill_matrix = build_user_skill_matrix(individual_skills_df, skill_index['skills'])
+    users, match = _sum_user_rows(users, calculate_skills_match_from_matrix(user_skill_matrix, skill_index, max_block_elements))
+    return pd.DataFrame(match, index=users, columns=skill_index['occupations'])
+
+def calculate_skills_match_pairs(user_skill_matrix, skill_index, user_rows, occupation_codes):
+    # Skills match for explicit (user row, occupation code) pairs, visiting only each pair's own
+    # required skills; element for element equal to calculate_skills_match_from_matrix
+    user_rows = np.asarray(user_rows, dtype=int)
+    occupation_codes = np.asarray(occupation_codes, dtype=int)
+    n_required = len(skill_index['skill_codes'])
+    segment_lengths = np.diff(np.r_[skill_index['segment_starts'], n_required])
+    occupation_starts = np.zeros(len(skill_index['occupations']), dtype=int)
+    occupation_lengths = np.zeros(len(skill_index['occupations']), dtype=int)
+    occupation_starts[skill_index['segment_occupations']] = skill_index['segment_starts']
+    occupation_lengths[skill_index['segment_occupations']] = segment_lengths
+
+    pair_lengths = occupation_lengths[occupation_codes]
+    pair_offsets = np.cumsum(pair_lengths) - pair_lengths
+    positions = np.repeat(occupation_starts[occupation_codes] - pair_offsets, pair_lengths) + np.arange(pair_lengths.sum())
+    block = user_skill_matrix[np.repeat(user_rows, pair_lengths), skill_index['skill_codes'][positions]]
+    weighted = (np.minimum(block, skill_index['required_scores'][positions]) / 100) * skill_index['importance'][positions]
+    match = np.zeros(len(user_rows))
+    has_skills = pair_lengths > 0
+    if weighted.size:
+        match[has_skills] = np.add.reduceat(weighted, pair_offsets[has_skills])
+    return _safe_divide(match, skill_index['total_importance'][occupation_codes]) * 100
+
+def score_profiles_batch(individual_profiles_df, individual_skills_df, hr_table, occupation_required_skills_df, max_possible_match=100, alpha=0.6, beta=0.15):
+    # Full AI-R chain for every profile against every occupation in hr_table (see
+    # calculate_systematic_opportunity_table). Returns one row per (user, occupation).
+    vr_scores = calculate_idiosyncratic_readiness_batch(individual_profiles_df)['vr_score'].to_numpy()
+    hr_scores = hr_table['hr_score'].to_numpy()
+    user_ids = individual_profiles_df['user_id'].to_numpy()
+    skills_match = calculate_skills_match_matrix(individual_skills_df, occupation_required_skills_df, hr_table.index)
+    skills_match = skills_match.reindex(index=user_ids, fill_value=0.0).to_numpy()
+    years_experience = _as_float_array(individual_profiles_df['years_experience'])
+
+    scores = calculate_ai_readiness_batch(vr_scores[:, None], hr_scores[None, :], skills_match, years_experience[:, None], max_possible_match, alpha, beta)
+
+    n_users, n_occupations = len(user_ids), len(hr_scores)
+    return pd.DataFrame({
+        'user_id': np.repeat(user_ids, n_occupations),
+        'occupation_name': np.tile(hr_table.index.to_numpy(), n_users),
+        'vr_score': np.repeat(vr_scores, n_occupations),
+        'hr_score': np.tile(hr_scores, n_users),
+        'skills_match_score': skills_match.ravel(),
+        'alignment_factor': scores['alignment_factor'].ravel(),
+        'synergy_percentage': scores['synergy_percentage'].ravel(),
+        'ai_r_score': scores['ai_r_score'].ravel()
+    })
+
+# Occupation recommendations
+
+def recommend_occupations(vr_score, years_experience, individual_skills_df, hr_table, skill_index, k=5, max_possible_match=100, alpha=0.6, beta=0.15):
+    # Top-K occupations for one profile by AI-R. The per-occupation terms (H^R table and skill
+    # index) are precomputed per data version, so a query is one skills-match pass over the
+    # catalog plus a partial selection (argpartition) of the K best.
+    _, user_skill_matrix = build_user_skill_matrix(individual_skills_df.assign(user_id=0), skill_index['skills'])
+    skills_match = calculate_skills_match_from_matrix(user_skill_matrix, skill_index).sum(axis=0)
+    if not skill_index['occupations'].equals(hr_table.index):
+        skills_match = pd.Series(skills_match, index=skill_index['occupations']).reindex(hr_table.index, fill_value=0.0).to_numpy()
+
+    scores = calculate_ai_readiness_batch(vr_score, hr_table['hr_score'].to_numpy(), skills_match, years_experience, max_possible_match, alpha, beta)
+    ai_r_scores = scores['ai_r_score']
+    k = min(k, len(ai_r_scores))
+    if k <= 0:
+        return hr_table.iloc[:0]
+    top = np.argpartition(-ai_r_scores, k - 1)[:k]
+    top = top[np.lexsort((top, -ai_r_scores[top]))]
+
+    recommendations = hr_table.iloc[top].copy()
+    recommendations.insert(0, 'rank', np.arange(1, k + 1))
+    recommendations['skills_match_score'] = skills_match[top]
+    recommendations['alignment_factor'] = scores['alignment_factor'][top]
+    recommendations['synergy_percentage'] = scores['synergy_percentage'][top]
+    recommendations['ai_r_score'] = ai_r_scores[top]
+    return recommendations
+
+# Occupation similarity (nearest neighbours in skill space)
+
+def build_occupation_embedding(skill_index):
+    # L2-normalized occupation x skill embedding (required score x importance), kept in the sparse,
+    # occupation-grouped layout of the skill index; cosine similarity is then a sparse product
+    values = (skill_index['required_scores'] / 100) * skill_index['importance']
+    norms = np.sqrt(np.bincount(skill_index['occupation_codes'], weights=values ** 2, minlength=len(skill_index['occupations'])))
+    return {
+        'occupations': skill_index['occupations'],
+        'skills': skill_index['skills'],
+        'occupation_codes': skill_index['occupation_codes'],
+        'skill_codes': skill_index['skill_codes'],
+        'values': _safe_divide(values, norms[skill_index['occupation_codes']]),
+        'segment_starts': skill_index['segment_starts'],
+        'segment_occupations': skill_index['segment_occupations']
+    }
+
+def calculate_occupation_similarity(query_vectors, embedding, max_block_elements=2**22):
+    # Cosine similarity of each query row (over embedding['skills']) with every occupation,
+    # computed in blocks of queries so the gathered block stays bounded
+    query_vectors = np.atleast_2d(_as_float_array(query_vectors))
+    query_vectors = _safe_divide(query_vectors, np.linalg.norm(query_vectors, axis=1, keepdims=True))
+    similarity = np.zeros((len(query_vectors), len(embedding['occupations'])))
+    skill_codes = embedding['skill_codes']
+    if len(skill_codes) == 0:
+        return similarity
+    block_size = max(1, max_block_elements // len(skill_codes))
+    for start in range(0, len(query_vectors), block_size):
+        weighted = query_vectors[start:start + block_size, skill_codes] * embedding['values']
+        similarity[start:start + block_size, embedding['segment_occupations']] = np.add.reduceat(weighted, embedding['segment_starts'], axis=1)
+    return similarity
+
+def _top_k_similar(similarity, embedding, k, exclude=None):
+    if exclude is not None:
+        similarity = similarity.copy()
+        similarity[exclude] = -np.inf
+    k = min(k, len(similarity) - (exclude is not None))
+    if k <= 0:
+        return pd.DataFrame({'similarity': []}, index=embedding['occupations'][:0])
+    top = np.argpartition(-similarity, k - 1)[:k]
+    top = top[np.lexsort((top, -similarity[top]))]
+    return pd.DataFrame({'similarity': similarity[top]}, index=embedding['occupations'][top])
+
+def find_similar_occupations(individual_skills_df, embedding, k=10):
+    # Occupations closest to one person's skill vector
+    skill_vector = _skill_vector(individual_skills_df, embedding['skills']) / 100
+    return _top_k_similar(calculate_occupation_similarity(skill_vector, embedding)[0], embedding, k)
+
+def find_adjacent_occupations(occupation_name, embedding, k=10):
+    # Occupations whose skill requirements are closest to occupation_name's (career transitions)
+    occupation = embedding['occupations'].get_loc(occupation_name)
+    in_occupation = embedding['occupation_codes'] == occupation
+    occupation_vector = np.zeros(len(embedding['skills']))
+    np.add.at(occupation_vector, embedding['skill_codes'][in_occupation], embedding['values'][in_occupation])
+    return _top_k_similar(calculate_occupation_similarity(occupation_vector, embedding)[0], embedding, k, exclude=occupation)
+
+# Skill-gap index
+# Which required skills each user is missing or below, weighted by importance: at every required entry
+# of the occupation skill index the shortfall is max(required - individual, 0) / 100 * importance. Most
+# users hold few of the catalog's required skills, so the index stores the sparse complement: for each
+# skill a user has, the credit min(individual, required) / 100 * importance at every entry requiring
+# it, per user in skill-index order (one occupation's entries are a contiguous range). Shortfall =
+# required / 100 * importance - credit, and gap score = best attainable match - skills match, so
+# closing a gap raises the match by exactly its share. Built once per data version; update() sets a
+# user's changed skill scores and revisits only the entries of those skills (the occupations requiring them).
+
+class SkillGapIndex:
+    def __init__(self, skill_index, individual_skills_df):
+        self.skill_index = skill_index
+        skill_codes = skill_index['skill_codes']
+        n_occupations = len(skill_index['occupations'])
+        # Required entries grouped by skill, and each occupation's range of entries
+        self.skill_order = np.argsort(skill_codes, kind='stable')
+        self.skill_starts = np.searchsorted(skill_codes[self.skill_order], np.arange(len(skill_index['skills']) + 1))
+        self.occupation_starts = np.searchsorted(skill_index['occupation_codes'], np.arange(n_occupations + 1))
+        self.full_credits = skill_index['required_scores'] / 100 * skill_index['importance']
+        self.max_match = _safe_divide(np.bincount(skill_index['occupation_codes'], weights=self.full_credits, minlength=n_occupations),
+                                      skill_index['total_importance']) * 100
+
+        self.users = pd.Index(individual_skills_df['user_id'].dropna().unique(), name='user_id')
+        held = pd.DataFrame({
+            'user_row': self.users.get_indexer(individual_skills_df['user_id']),
+            'skill_code': _index_codes(skill_index['skills'], individual_skills_df['skill_name']),
+            'score': np.nan_to_num(_skill_scores(individual_skills_df))
+        })
+        held = held[(held['user_row'] >= 0) & (held['skill_code'] >= 0)]
+        skill_starts, skill_ends = self.skill_starts[held['skill_code']], self.skill_starts[held['skill_code'] + 1]
+        lengths = skill_ends - skill_starts
+        offsets = np.cumsum(lengths) - lengths
+        positions = self.skill_order[np.repeat(skill_starts - offsets, lengths) + np.arange(lengths.sum())]
+        user_rows = np.repeat(held['user_row'].to_numpy(), lengths)
+        credits = np.minimum(np.repeat(held['score'].to_numpy(), lengths), skill_index['required_scores'][positions]) / 100 * skill_index['importance'][positions]
+        # Repeated (user, skill) rows are credited separately, as in calculate_skills_match_score, and
+        # their credits at an entry add up; np.unique also sorts by user row, then position
+        entry_keys, entries = np.unique(user_rows * len(skill_codes) + positions, return_inverse=True)
+        credits = np.bincount(entries, weights=credits, minlength=len(entry_keys))
+        user_rows, positions = entry_keys // max(len(skill_codes), 1), entry_keys % max(len(skill_codes), 1)
+        credited = credits > 0
+        # CSR layout by user row; users changed by update() keep their credits in a {position: credit} dict
+        self.credit_starts = np.searchsorted(user_rows[credited], np.arange(len(self.users) + 1))
+        self.credit_positions = positions[credited]
+        self.credits = credits[credited]
+        self.updated_credits = {}
+
+    def _user_row(self, user_id):
+        row = int(self.users.get_indexer([user_id])[0])
+        if row < 0:
+            raise KeyError(f"User '{user_id}' is not in the skill-gap index")
+        return row
+
+    def _user_credits(self, row):
+        # (positions, credits) of a user row in position order
+        if row in self.updated_credits:
+            positions = np.array(sorted(self.updated_credits[row]), dtype=int)
+            return positions, np.array([self.updated_credits[row][position] for position in positions.tolist()])
+        credit_range = slice(self.credit_starts[row], self.credit_starts[row + 1])
+        return self.credit_positions[credit_range], self.credits[credit_range]
+
+    def skills_match(self, user_id):
+        # Equal to calculate_skills_match_matrix's row for the user (missing scores count as 0 here),
+        # in O(user's credited entries)
+        positions, credits = self._user_credits(self._user_row(user_id))
+        totals = np.bincount(self.skill_index['occupation_codes'][positions], weights=credits, minlength=len(self.max_match))
+        return pd.Series(_safe_divide(totals, self.skill_index['total_importance']) * 100, index=self.skill_index['occupations'], name='skills_match_score')
+
+    def gap_scores(self, user_id):
+        return (self.max_match - self.skills_match(user_id)).rename('gap_score')
+
+    def gaps(self, user_id, occupation_name):
+        # One occupation's gaps, largest skills-match gain first, with the match after closing each in turn:
+        # the gap-closing path from the current skills match to the best attainable one
+        occupation = self.skill_index['occupations'].get_loc(occupation_name)
+        first, last = self.occupation_starts[occupation:occupation + 2]
+        positions, credits = self._user_credits(self._user_row(user_id))
+        held = slice(*np.searchsorted(positions, [first, last]))
+        occupation_credits = np.zeros(last - first)
+        occupation_credits[positions[held] - first] = credits[held]
+        shortfalls = self.full_credits[first:last] - occupation_credits
+        in_gap = np.flatnonzero(shortfalls > 0)
+        gains = _safe_divide(shortfalls[in_gap], self.skill_index['total_importance'][occupation]) * 100
+        ranking = np.argsort(-gains, kind='stable')
+        order, gains = in_gap[ranking], gains[ranking]
+        importance = self.skill_index['importance'][first:last]
+        return pd.DataFrame({
+            'skill_name': self.skill_index['skills'].to_numpy()[self.skill_index['skill_codes'][first:last][order]],
+            # Below the requirement, the credit holds the individual score exactly
+            'individual_skill_score': _safe_divide(occupation_credits[order] * 100, importance[order]),
+            'required_skill_score': self.skill_index['required_scores'][first:last][order],
+            'skill_importance': importance[order],
+            'skills_match_gain': gains,
+            'projected_skills_match': self.max_match[occupation] - gains.sum() + np.cumsum(gains)
+        })
+
+    def memory_bytes(self):
+        # What this index owns; skill_index is shared by every session of a data version and not counted
+        return sys.getsizeof(self) + estimate_memory_bytes({name: value for name, value in vars(self).items() if name != 'skill_index'})
+
+    def update(self, user_id, skill_scores):
+        # skill_scores: {skill_name: score, or the list of scores of a repeated skill's rows (empty when
+        # removed)}; missing (NaN) scores count as 0 and skills no occupation requires are ignored.
+        # Returns the codes of the occupations whose entries were revisited.
+        row = int(self.users.get_indexer([user_id])[0])
+        if row < 0:
+            row = len(self.users)
+            self.users = self.users.append(pd.Index([user_id], name=self.users.name))
+            self.credit_starts = np.r_[self.credit_starts, self.credit_starts[-1]]
+        if row not in self.updated_credits:
+            self.updated_credits[row] = dict(zip(*(values.tolist() for values in self._user_credits(row))))
+        user_credits = self.updated_credits[row]
+        revisited = [np.zeros(0, dtype=int)]
+        for skill_code, score in zip(self.skill_index['skills'].get_indexer(list(skill_scores)), skill_scores.values()):
+            if skill_code < 0:
+                continue
+            scores = np.nan_to_num(np.atleast_1d(np.asarray(score, dtype=float)))
+            positions = self.skill_order[self.skill_starts[skill_code]:self.skill_starts[skill_code + 1]]
+            credits = (np.minimum(scores[:, None], self.skill_index['required_scores'][positions]) / 100 * self.skill_index['importance'][positions]).sum(axis=0)
+            for position, credit in zip(positions.tolist(), credits.tolist()):
+                if credit > 0:
+                    user_credits[position] = credit
+                else:
+                    user_credits.pop(position, None)
+            revisited.append(self.skill_index['occupation_codes'][positions])
+        return np.unique(np.concatenate(revisited))
+
+def _skill_score_lists(skills_df):
+    # {skill_name: sorted scores of its rows}; rows without a skill name are dropped, missing scores count as 0
+    skills_df = skills_df[skills_df['skill_name'].notna()]
+    scores = np.nan_to_num(_skill_scores(skills_df))
+    lists = {}
+    for skill_name, score in zip(skills_df['skill_name'].tolist(), scores.tolist()):
+        lists.setdefault(skill_name, []).append(score)
+    return {skill_name: sorted(scores) for skill_name, scores in lists.items()}
+
+def diff_skill_scores(previous_skills_df, current_skills_df):
+    # {skill_name: scores of its rows} of the skills added, changed or removed (no scores) between two
+    # versions of one user's skills table, for SkillGapIndex.update
+    previous, current = _skill_score_lists(previous_skills_df), _skill_score_lists(current_skills_df)
+    return {skill_name: current.get(skill_name, []) for skill_name in {**previous, **current} if current.get(skill_name, []) != previous.get(skill_name, [])}
+
+# Monte Carlo uncertainty
+
+# Perturbation model per input: (noise scale, lower bound, upper bound). Bounded scores get additive
+# Gaussian noise with sd = relative_noise * scale, clipped to their range; unbounded positive inputs
+# (counts, hours, wages, postings) get multiplicative log-normal noise with sigma = relative_noise.
+PROFILE_UNCERTAINTY = {
+    'prompting_score': (1, 0, 1), 'tools_score': (1, 0, 1), 'understanding_score': (1, 0, 1), 'datalit_score': (1, 0, 1),
+    'output_quality_with_ai': (100, 0, 100), 'output_quality_without_ai': (100, 0, 100),
+    'time_without_ai': None, 'time_with_ai': None, 'errors_caught': None, 'total_ai_errors': None,
+    'appropriate_trust_decisions': None, 'total_decisions': None, 'delta_proficiency': (1, 0, 1),
+    'delta_t_hours_invested': None, 'portfolio_score': (1, 0, 1), 'recognition_score': (1, 0, 1),
+    'credentials_score': (1, 0, 1), 'cognitive_flexibility': (100, 0, 100),
+    'social_emotional_intelligence': (100, 0, 100), 'strategic_career_management': (100, 0, 100)
+}
+OCCUPATION_UNCERTAINTY = {
+    'ai_enhancement_score': (1, 0, 1), 'job_growth_rate_g': (1, -1, np.inf), 'ai_skilled_wage': None, 'median_wage': None,
+    'current_job_postings': None, 'previous_job_postings': None, 'remote_work_factor': (1, 0, 1),
+    'local_demand': None, 'national_avg_demand': None
+}
+
+def _perturb_inputs(values, uncertainty, n_draws, relative_noise, rng):
+    draws = {}
+    for column, value in values.items():
+        spec = uncertainty.get(column, False)
+        if spec is False or relative_noise == 0:
+            draws[column] = np.full(n_draws, value, dtype=object if isinstance(value, str) else float)
+        elif spec is None:
+            draws[column] = float(value) * np.exp(rng.normal(0.0, relative_noise, n_draws))
+        else:
+            scale, lower, upper = spec
+            draws[column] = np.clip(float(value) + rng.normal(0.0, relative_noise * scale, n_draws), lower, upper)
+    return draws
+
+def simulate_ai_readiness_uncertainty(individual_profile, occupation, skills_match_score, max_possible_match=100, alpha=0.6, beta=0.15,
+                                      lambda_val=0.3, gamma=0.2, n_draws=10_000, relative_noise=0.1, percentiles=(5, 50, 95), seed=0):
+    # Pushes n_draws perturbed copies of one profile (dict) and one occupation (row/dict), plus a
+    # perturbed skills match, through the batch chain and reports percentile bands per metric
+    rng = np.random.default_rng(seed)
+    profile_draws = _perturb_inputs(individual_profile, PROFILE_UNCERTAINTY, n_draws, relative_noise, rng)
+    occupation_draws = _perturb_inputs(dict(occupation), OCCUPATION_UNCERTAINTY, n_draws, relative_noise, rng)
+    skills_match_draws = np.clip(skills_match_score + rng.normal(0.0, relative_noise * max_possible_match, n_draws), 0, max_possible_match)
+
+    vr_score = calculate_idiosyncratic_readiness_batch(profile_draws)['vr_score'].to_numpy()
+    hr_score = calculate_systematic_opportunity_batch(occupation_draws, lambda_val, gamma)['hr_score'].to_numpy()
+    scores = calculate_ai_readiness_batch(vr_score, hr_score, skills_match_draws, profile_draws['years_experience'], max_possible_match, alpha, beta)
+
+    draws = np.vstack([vr_score, hr_score, scores['synergy_percentage'], scores['ai_r_score']])
+    bands = pd.DataFrame(np.percentile(draws, percentiles, axis=1).T, columns=[f"p{p:g}" for p in percentiles],
+                         index=pd.Index(['vr_score', 'hr_score', 'synergy_percentage', 'ai_r_score'], name='metric'))
+    bands.insert(0, 'mean', draws.mean(axis=1))
+    return bands
+
+# Alpha/beta sensitivity
+
+def calculate_ai_readiness_surface(vr_score, hr_score, synergy_percentage, alphas=np.linspace(0.0, 1.0, 21), betas=np.linspace(0.0, 1.0, 21)):
+    # AI-R is linear in alpha and beta once V^R, H^R and synergy are known, so the whole surface is
+    # one broadcast of calculate_ai_readiness_score. Returns shape (alphas, betas, *scores shape),
+    # e.g. (A, B, users, occupations) for a cohort scored against a catalog.
+    vr_score, hr_score, synergy_percentage = np.broadcast_arrays(_as_float_array(vr_score), _as_float_array(hr_score), _as_float_array(synergy_percentage))
+    trailing = (1,) * vr_score.ndim
+    alphas = _as_float_array(alphas).reshape((-1, 1) + trailing)
+    betas = _as_float_array(betas).reshape((1, -1) + trailing)
+    return calculate_ai_readiness_score(vr_score, hr_score, synergy_percentage, alphas, betas)
+
+def calculate_occupation_ranks(ai_r_scores):
+    # Rank of each occupation (last axis) by AI-R, 1 = best; ties keep catalog order
+    order = np.argsort(-ai_r_scores, axis=-1, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.broadcast_to(np.arange(1, ai_r_scores.shape[-1] + 1), order.shape), axis=-1)
+    return ranks
+
+def summarize_rank_sensitivity(ai_r_surface, occupation_names, current_ai_r_scores=None):
+    # How stable each occupation's rank is across the alpha x beta surface (and any cohort axes)
+    ranks = calculate_occupation_ranks(ai_r_surface).reshape(-1, ai_r_surface.shape[-1])
+    summary = pd.DataFrame({
+        'best_rank': ranks.min(axis=0),
+        'worst_rank': ranks.max(axis=0),
+        'mean_rank': ranks.mean(axis=0),
+        'top_share': (ranks == 1).mean(axis=0)
+    }, index=pd.Index(occupation_names, name='occupation_name'))
+    if current_ai_r_scores is not None:
+        current_ranks = calculate_occupation_ranks(_as_float_array(current_ai_r_scores)).reshape(-1, ai_r_surface.shape[-1])
+        summary.insert(0, 'current_rank', current_ranks.mean(axis=0) if len(current_ranks) > 1 else current_ranks[0])
+        summary = summary.sort_values('current_rank', kind='stable')
+    return summary
+
+def calculate_recommendation_stability(ai_r_surface, current_ai_r_scores):
+    # Share of the alpha x beta surface on which each user's current top occupation stays on top
+    current_top = np.argmax(_as_float_array(current_ai_r_scores), axis=-1)
+    return (np.argmax(ai_r_surface, axis=-1) == current_top).mean(axis=(0, 1))
+
+# Pathway portfolio optimization
+
+def _pareto_prune(costs, gains, eps=1e-12):
+    # Keeps states not dominated by another state with lower-or-equal cost and greater-or-equal gains
+    order = np.lexsort((-gains.sum(axis=1), costs))
+    kept = []
+    for i in order:
+        if kept and np.any(np.all(gains[kept] >= gains[i] - eps, axis=1)):
+            continue
+        kept.append(i)
+    return np.array(kept, dtype=int)
+
+def optimize_pathway_portfolio(current_ai_fluency, current_domain_expertise, current_adaptive_capacity, learning_pathways_df, budget,
+                               hr_score=0.0, alignment_factor=0.0, alpha=0.6, beta=0.15, cost_column=None,
+                               completion_score=1.0, mastery_score=1.0, w=(0.45, 0.35, 0.20)):
+    # Chooses the set of pathways within budget (sum of cost_column, or number of pathways when
+    # cost_column is None) that maximizes projected AI-R for one occupation (given its H^R and
+    # alignment factor). AI-R increases with V^R, so this maximizes V^R after simulate_pathway_impact.
+    # Impacts are non-negative and every step caps at 1.0, so applying a chosen set in any order gives
+    # min(current + total impact, 1.0): orderings are equivalent and the search is over combinations.
+    # A 0/1 knapsack DP keeps a Pareto frontier of (cost, gain per component) states, with gains
+    # capped at the remaining headroom, and drops states whose optimistic bound cannot beat the best.
+    raw_impacts = learning_pathways_df[PATHWAY_IMPACT_COLUMNS].to_numpy(dtype=float)
+    impacts = raw_impacts * completion_score * mastery_score
+    if np.any(raw_impacts < 0):
+        raise ValueError("optimize_pathway_portfolio requires non-negative pathway impacts")
+    costs = np.ones(len(impacts)) if cost_column is None else learning_pathways_df[cost_column].to_numpy(dtype=float)
+    weights = np.asarray(w, dtype=float)
+    current = np.array([current_ai_fluency, current_domain_expertise, current_adaptive_capacity], dtype=float)
+    # Once any pathway is applied each component becomes min(current + gain, 1.0)
+    capped_base = np.minimum(current, 1.0)
+    headroom = np.maximum(1.0 - current, 0.0)
+
+    candidates = np.flatnonzero(costs <= budget)
+    # Most weighted gain per unit of cost first, so good states (and tight bounds) appear early
+    item_values = np.minimum(impacts[candidates], headroom) @ weights
+    order = np.argsort(-item_values / np.maximum(costs[candidates], 1e-12), kind='stable')
+    candidates, item_values = candidates[order], item_values[order]
+    item_costs = costs[candidates]
+    cumulative_costs = np.r_[0.0, np.cumsum(item_costs)]
+    cumulative_values = np.r_[0.0, np.cumsum(item_values)]
+    remaining_gain = np.r_[np.cumsum(impacts[candidates][::-1], axis=0)[::-1], np.zeros((1, 3))]
+
+    def fractional_knapsack_bound(start, capacity):
+        # Gain is subadditive under the caps, so a fractional knapsack over the remaining
+        # items' individually-capped values bounds what any affordable subset can add
+        target = cumulative_costs[start] + capacity
+        last = np.searchsorted(cumulative_costs, target, side='right') - 1
+        bound = cumulative_values[last] - cumulative_values[start]
+        partial = last < len(item_costs)
+        next_item = np.minimum(last, len(item_costs) - 1)
+        fraction = np.clip((target - cumulative_costs[last]) / np.maximum(item_costs[next_item], 1e-12), 0.0, 1.0)
+        return bound + np.where(partial, fraction * item_values[next_item], 0.0)
+
+    # Greedy portfolio as the initial incumbent
+    best_value, best_cost, best_set = -np.inf, np.inf, ()
+    greedy_cost, greedy_gain, greedy_set = 0.0, np.zeros(3), ()
+    for pathway in candidates:
+        step_gain = np.minimum(greedy_gain + impacts[pathway], headroom)
+        if greedy_cost + costs[pathway] <= budget + 1e-9 and (step_gain - greedy_gain) @ weights > 1e-12:
+            greedy_cost += costs[pathway]
+            greedy_gain = step_gain
+            greedy_set += (pathway,)
+    if greedy_set:
+        best_value, best_cost, best_set = float(greedy_gain @ weights), greedy_cost, greedy_set
+
+    state_costs = np.zeros(1)
+    state_gains = np.zeros((1, 3))
+    state_sets = [()]
+    for position, pathway in enumerate(candidates):
+        affordable = state_costs + costs[pathway] <= budget + 1e-9
+        new_costs = state_costs[affordable] + costs[pathway]
+        new_gains = np.minimum(state_gains[affordable] + impacts[pathway], headroom)
+        new_sets = [state_sets[i] + (pathway,) for i in np.flatnonzero(affordable)]
+        if new_sets:
+            new_values = new_gains @ weights
+            top = int(np.lexsort((new_costs, -new_values))[0])
+            if new_values[top] > best_value + 1e-12 or (new_values[top] >= best_value - 1e-12 and new_costs[top] < best_cost):
+                best_value, best_cost, best_set = float(new_values[top]), float(new_costs[top]), new_sets[top]
+
+        state_costs = np.concatenate([state_costs, new_costs])
+        state_gains = np.vstack([state_gains, new_gains])
+        state_sets = state_sets + new_sets
+
+        # Keep only states that could still strictly beat the incumbent under optimistic completion
+        current_values = state_gains @ weights
+        uncapped_bound = (np.minimum(state_gains + remaining_gain[position + 1], headroom) @ weights) - current_values
+        budget_bound = fractional_knapsack_bound(position + 1, budget - state_costs)
+        promising = current_values + np.minimum(uncapped_bound, budget_bound) > best_value + 1e-12
+        promising[0] = True # always keep the empty set as a starting point
+        kept = np.flatnonzero(promising)
+        kept = kept[_pareto_prune(state_costs[kept], state_gains[kept])]
+        state_costs, state_gains = state_costs[kept], state_gains[kept]
+        state_sets = [state_sets[i] for i in kept]
+
+    # Drop pathways whose gain is entirely absorbed by the caps, most expensive first
+    for pathway in sorted(best_set, key=lambda i: -costs[i]):
+        reduced = tuple(i for i in best_set if i != pathway)
+        if reduced and np.minimum(impacts[list(reduced)].sum(axis=0), headroom) @ weights >= best_value - 1e-12:
+            best_set = reduced
+
+    # Best non-empty portfolio versus doing nothing (which leaves components uncapped)
+    chosen = ()
+    if best_set and (best_value + capped_base @ weights) > current @ weights:
+        chosen = best_set
+
+    # Study order: largest marginal V^R gain first, replayed through the scalar simulation
+    ai_fluency, domain_expertise, adaptive_capacity = (float(value) for value in current)
+    sequence = []
+    pending = list(chosen)
+    while pending:
+        step_results = [simulate_pathway_impact(ai_fluency, domain_expertise, adaptive_capacity, learning_pathways_df['pathway_type'].iloc[i], *raw_impacts[i], completion_score, mastery_score) for i in pending]
+        step = int(np.argmax([np.dot(result, weights) for result in step_results]))
+        ai_fluency, domain_expertise, adaptive_capacity = step_results[step]
+        sequence.append(pending.pop(step))
+
+    vr_score = calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity, *weights) * 100
+    synergy_percentage = calculate_synergy_percentage(vr_score, hr_score, alignment_factor)
+    return {
+        'sequence': learning_pathways_df['pathway_name'].to_numpy()[sequence].tolist(),
+        'pathway_ids': learning_pathways_df['pathway_id'].to_numpy()[sequence].tolist(),
+        'total_cost': float(costs[sequence].sum()),
+        'ai_fluency': ai_fluency, 'domain_expertise': domain_expertise, 'adaptive_capacity': adaptive_capacity,
+        'vr_score': vr_score, 'synergy_percentage': synergy_percentage,
+        'ai_r_score': calculate_ai_readiness_score(vr_score, hr_score, synergy_percentage, alpha, beta)
+    }
+
+# Multi-period trajectories
+
+TRAJECTORY_METRICS = [
+    'years_experience', 'ai_fluency', 'domain_expertise', 'adaptive_capacity', 'vr_score',
+    'job_postings', 'growth_multiplier', 'hr_score', 'alignment_factor', 'synergy_percentage', 'ai_r_score'
+]
+
+def build_pathway_schedule(pathway_sequences, learning_pathways_df, n_periods, hours_per_month=20.0, duration_column='duration_hours'):
+    # Turns ordered pathway names (one list shared by everyone, or one list per user) into an int
+    # array of the pathway row completed in each month 0..n_periods (-1 for none). Pathways are
+    # studied back to back, each taking ceil(duration / hours_per_month) months (at least one);
+    # without a duration column every pathway takes one month.
+    positions = pd.Index(learning_pathways_df['pathway_name'])
+    if duration_column in learning_pathways_df:
+        months = np.maximum(np.ceil(learning_pathways_df[duration_column].to_numpy(dtype=float) / hours_per_month), 1).astype(int)
+    else:
+        months = np.ones(len(learning_pathways_df), dtype=int)
+    shared = len(pathway_sequences) == 0 or isinstance(pathway_sequences[0], str)
+    sequences = [pathway_sequences] if shared else pathway_sequences
+
+    lengths = np.array([len(sequence) for sequence in sequences], dtype=int)
+    names = pd.Index([name for sequence in sequences for name in sequence], dtype=object)
+    codes = positions.get_indexer(names)
+    if np.any(codes < 0):
+        raise ValueError(f"Unknown pathway(s): {', '.join(names[codes < 0].unique())}")
+    # Finish month of each pathway: cumulative duration within its user's sequence
+    users = np.repeat(np.arange(len(sequences)), lengths)
+    cumulative_months = np.cumsum(months[codes])
+    segment_starts = np.cumsum(lengths) - lengths
+    finish_months = cumulative_months - np.repeat(np.r_[0, cumulative_months][segment_starts], lengths)
+    within_horizon = finish_months <= n_periods
+
+    schedule = np.full((len(sequences), n_periods + 1), -1, dtype=int)
+    schedule[users[within_horizon], finish_months[within_horizon]] = codes[within_horizon]
+    return schedule[0] if shared else schedule
+
+def project_job_postings(current_job_postings, previous_job_postings, growth_rate_g, months):
+    # Postings along a monthly axis: geometric interpolation between previous (month -12) and
+    # current (month 0) postings for the past, annual growth at job_growth_rate_g afterwards
+    current = _as_float_array(current_job_postings)[..., None]
+    previous = _as_float_array(previous_job_postings)[..., None]
+    annual_growth = np.maximum(1 + _as_float_array(growth_rate_g), 0.0)[..., None]
+    months = _as_float_array(months)
+    past_ratio = _safe_divide(current, previous, fill=1.0)
+    postings = np.where(months <= 0, current * past_ratio ** (months / 12), current * annual_growth ** (months / 12))
+    postings = np.where(months == 0, current, postings)
+    return np.where(months == -12, previous, postings)
+
+def simulate_ai_readiness_trajectory(individual_profiles_df, occupations, learning_pathways_df, pathway_schedule, skills_match_score,
+                                     n_periods=60, max_possible_match=100, alpha=0.6, beta=0.15, lambda_val=0.3, gamma=0.2,
+                                     completion_score=1.0, mastery_score=1.0):
+    # Month-by-month AI-R for a cohort, returned as a (users x months 0..n_periods x TRAJECTORY_METRICS)
+    # array. Each month years_experience ages by 1/12 (practical experience and timing factor follow),
+    # job postings follow project_job_postings so the growth multiplier compares each month with the
+    # same month a year earlier, and scheduled pathways are applied as with simulate_pathway_impact.
+    # Impacts are non-negative, so applying a user's pathways one after another gives
+    # min(start + cumulative impact, 1.0) from the first completion on; every month is computed at once.
+    # occupations: one row (shared target) or one row per user; pathway_schedule: from build_pathway_schedule.
+    n_users = len(individual_profiles_df)
+    months = np.arange(n_periods + 1)
+    components = calculate_idiosyncratic_readiness_batch(individual_profiles_df)
+
+    years_experience = _as_float_array(individual_profiles_df['years_experience'])[:, None] + months / 12
+    practical_experience = calculate_practical_experience_batch(years_experience)
+
+    schedule = np.broadcast_to(np.asarray(pathway_schedule, dtype=int), (n_users, n_periods + 1))
+    completed = schedule >= 0
+    impacts = learning_pathways_df[PATHWAY_IMPACT_COLUMNS].to_numpy(dtype=float)
+    if np.any(impacts < 0):
+        raise ValueError("simulate_ai_readiness_trajectory requires non-negative pathway impacts")
+    monthly_gains = np.where(completed[..., None], impacts[np.maximum(schedule, 0)], 0.0) * completion_score * mastery_score
+    cumulative_gains = np.cumsum(monthly_gains, axis=1)
+    any_completed = np.logical_or.accumulate(completed, axis=1)
+
+    ai_fluency = components['ai_fluency'].to_numpy()[:, None] + cumulative_gains[..., 0]
+    domain_expertise = calculate_domain_expertise(
+        components['education_foundation'].to_numpy()[:, None], practical_experience, components['specialization_depth'].to_numpy()[:, None]
+    ) + cumulative_gains[..., 1]
+    adaptive_capacity = components['adaptive_capacity'].to_numpy()[:, None] + cumulative_gains[..., 2]
+    ai_fluency, domain_expertise, adaptive_capacity = (
+        np.where(any_completed, np.minimum(component, 1.0), component) for component in (ai_fluency, domain_expertise, adaptive_capacity)
+    )
+    vr_score = calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity) * 100
+
+    opportunity = calculate_systematic_opportunity_batch(occupations, lambda_val, gamma)
+    job_postings = project_job_postings(occupations['current_job_postings'], occupations['previous_job_postings'], occupations['job_growth_rate_g'], np.arange(-12, n_periods + 1))
+    growth_multiplier = calculate_growth_multiplier_batch(job_postings[:, 12:], job_postings[:, :-12], lambda_val)
+    hr_score = calculate_systematic_opportunity(
+        opportunity['base_opportunity_score'].to_numpy()[:, None], growth_multiplier, opportunity['regional_multiplier'].to_numpy()[:, None]
+    ) * 100
+
+    scores = calculate_ai_readiness_batch(vr_score, hr_score, _as_float_array(skills_match_score).reshape(-1, 1), years_experience, max_possible_match, alpha, beta)
+
+    trajectory = np.empty((n_users, n_periods + 1, len(TRAJECTORY_METRICS)))
+    for position, metric in enumerate([
+        years_experience, ai_fluency, domain_expertise, adaptive_capacity, vr_score,
+        job_postings[:, 12:], growth_multiplier, hr_score, scores['alignment_factor'], scores['synergy_percentage'], scores['ai_r_score']
+    ]):
+        trajectory[:, :, position] = metric
+    return trajectory
+
+# Incremental score graph
+
+_UNCACHED = object()
+
+class ScoreGraph:
+    # Memoized dependency graph of score formulas. nodes maps a node name to (function, input names);
+    # names that are not nodes are inputs, set with update(). Changing an input drops the cached values
+    # of its downstream nodes only, so e.g. a new errors_caught recomputes s3, ai_fluency, vr_score,
+    # synergy_percentage and ai_r_score while every other component is served from the cache.
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.dependents = {}
+        for name, (_, inputs) in nodes.items():
+            for input_name in inputs:
+                self.dependents.setdefault(input_name, []).append(name)
+        self.inputs = {}
+        self.values = {}
+        self.evaluations = 0
+
+    def update(self, values):
+        # Returns the names of the inputs whose value changed
+        changed = [name for name, value in values.items() if name not in self.inputs or self.inputs[name] != value]
+        stale = []
+        for name in changed:
+            self.inputs[name] = values[name]
+            stale.extend(self.dependents.get(name, []))
+        while stale:
+            name = stale.pop()
+            # Nodes downstream of an uncached node cannot be cached either
+            if self.values.pop(name, _UNCACHED) is not _UNCACHED:
+                stale.extend(self.dependents.get(name, []))
+        return changed
+
+    def get(self, name):
+        return self._get(name)
+
+    def _get(self, name):
+        # Recursion goes through _get so that hot-path timing records one get() per caller's lookup
+        if name not in self.nodes:
+            if name not in self.inputs:
+                raise KeyError(f"Score graph input '{name}' has not been set")
+            return self.inputs[name]
+        if name not in self.values:
+            function, inputs = self.nodes[name]
+            self.values[name] = function(*(self._get(input_name) for input_name in inputs))
+            self.evaluations += 1
+        return self.values[name]
+
+    def evaluate(self, names):
+        return {name: self._get(name) for name in names}
+
+    def memory_bytes(self):
+        # The node table is shared by every graph and not counted
+        return sys.getsizeof(self) + estimate_memory_bytes([self.dependents, self.inputs, self.values])
+
+AI_READINESS_GRAPH_NODES = {
+    's1': (calculate_technical_ai_skills, ('prompting_score', 'tools_score', 'understanding_score', 'datalit_score')),
+    's2': (calculate_ai_augmented_productivity, ('output_quality_with_ai', 'output_quality_without_ai', 'time_without_ai', 'time_with_ai')),
+    's3': (calculate_critical_ai_judgment, ('errors_caught', 'total_ai_errors', 'appropriate_trust_decisions', 'total_decisions')),
+    's4': (calculate_ai_learning_velocity, ('delta_proficiency', 'delta_t_hours_invested')),
+    'ai_fluency': (calculate_ai_fluency, ('s1', 's2', 's3', 's4')),
+    'education_foundation': (calculate_education_foundation, ('education_level',)),
+    'practical_experience': (calculate_practical_experience, ('years_experience',)),
+    'specialization_depth': (calculate_specialization_depth, ('portfolio_score', 'recognition_score', 'credentials_score')),
+    'domain_expertise': (calculate_domain_expertise, ('education_foundation', 'practical_experience', 'specialization_depth')),
+    'adaptive_capacity': (calculate_adaptive_capacity, ('cognitive_flexibility', 'social_emotional_intelligence', 'strategic_career_management')),
+    'vr_score': (lambda ai_fluency, domain_expertise, adaptive_capacity: calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity) * 100, # Normalize to 0-100
+                 ('ai_fluency', 'domain_expertise', 'adaptive_capacity')),
+    'timing_factor': (calculate_timing_factor, ('years_experience',)),
+    'alignment_factor': (calculate_alignment_factor, ('skills_match_score', 'max_possible_match', 'timing_factor')),
+    'synergy_percentage': (calculate_synergy_percentage, ('vr_score', 'hr_score', 'alignment_factor')),
+    'ai_r_score': (calculate_ai_readiness_score, ('vr_score', 'hr_score', 'synergy_percentage', 'alpha', 'beta'))
+}
+VR_COMPONENT_NAMES = ['s1', 's2', 's3', 's4', 'ai_fluency', 'education_foundation', 'practical_experience',
+                      'specialization_depth', 'domain_expertise', 'adaptive_capacity', 'vr_score']
+
+def build_ai_readiness_graph():
+    return ScoreGraph(AI_READINESS_GRAPH_NODES)
+
+# Score result cache
+
+def _normalize_cache_value(value):
+    # Numbers hash by value whatever their type (1, 1.0, np.int64(1)), so equal profiles share a key
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return float(value)
+    return value
+
+def make_score_cache_key(individual_profile, individual_skills_df, occupation, required_skills_df, **params):
+    # Content hash of everything score_profile depends on; user_id and row order are ignored
+    if 'hr_score' in occupation:
+        occupation = {'hr_score': occupation['hr_score']}
+    digest = hashlib.sha1()
+    digest.update(repr(sorted((name, _normalize_cache_value(value)) for name, value in dict(individual_profile).items() if name != 'user_id')).encode())
+    digest.update(repr(sorted((name, _normalize_cache_value(value)) for name, value in dict(occupation).items())).encode())
+    digest.update(repr(sorted((name, _normalize_cache_value(value)) for name, value in params.items())).encode())
+    # Each skills table sorted and row-hashed (repeated rows count, as in calculate_skills_match_score); names
+    # are hashed as strings so mixed-type columns sort. Rows without a skill name match nothing unless a
+    # required skill has no name either, so they are left out of the key.
+    if not required_skills_df['skill_name'].isna().any():
+        individual_skills_df = individual_skills_df[individual_skills_df['skill_name'].notna()]
+    individual = pd.DataFrame({'skill_name': individual_skills_df['skill_name'].astype(str).to_numpy(),
+                               'individual_skill_score': pd.to_numeric(individual_skills_df['individual_skill_score'], errors='coerce').to_numpy(dtype=float)})
+    required = pd.DataFrame({'skill_name': required_skills_df['skill_name'].astype(str).to_numpy(),
+                             'required_skill_score': required_skills_df['required_skill_score'].to_numpy(dtype=float),
+                             'skill_importance': required_skills_df['skill_importance'].to_numpy(dtype=float)})
+    for table in (individual, required):
+        digest.update(repr((list(table.columns), len(table))).encode())
+        digest.update(pd.util.hash_pandas_object(table.sort_values(list(table.columns)), index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+class ScoreCache:
+    # Thread-safe LRU cache bounded by number of entries and by estimated memory; one instance can be
+    # shared by every session of a process
+    def __init__(self, max_entries=1024, max_bytes=32 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key][0]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        size = estimate_memory_bytes(value) + sys.getsizeof(key)
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (value, size)
+            self.total_bytes += size
+            while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                self.total_bytes -= self.entries.popitem(last=False)[1][1]
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key, _UNCACHED)
+        if value is _UNCACHED:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def memory_bytes(self):
+        with self.lock:
+            return sys.getsizeof(self) + sys.getsizeof(self.entries) + self.total_bytes
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.entries), 'bytes': self.total_bytes, 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+SCORE_PROFILE_RESULTS = VR_COMPONENT_NAMES + ['hr_score', 'skills_match_score', 'timing_factor', 'alignment_factor', 'synergy_percentage', 'ai_r_score']
+
+def score_profile(individual_profile, individual_skills_df, occupation, required_skills_df, max_possible_match=100,
+                  alpha=0.6, beta=0.15, lambda_val=0.3, gamma=0.2, score_graph=None):
+    # Full AI-R pipeline for one profile against one occupation and its required skills. occupation is a
+    # row of the H^R table (calculate_systematic_opportunity_table, whose hr_score is used as is) or of
+    # occupational_data_df (H^R computed with lambda_val and gamma); pass a session's ScoreGraph to reuse
+    # its unchanged components
+    if 'hr_score' in occupation:
+        hr_score = occupation['hr_score']
+    else:
+        hr_score = calculate_systematic_opportunity_batch({name: [value] for name, value in dict(occupation).items()}, lambda_val, gamma)['hr_score'].iloc[0]
+    skills_match_score = calculate_skills_match_score(individual_skills_df, required_skills_df)
+    score_graph = build_ai_readiness_graph() if score_graph is None else score_graph
+    score_graph.update(individual_profile)
+    score_graph.update({'hr_score': hr_score, 'skills_match_score': skills_match_score, 'max_possible_match': max_possible_match, 'alpha': alpha, 'beta': beta})
+    return score_graph.evaluate(SCORE_PROFILE_RESULTS)
+
+def score_profile_cached(cache, individual_profile, individual_skills_df, occupation, required_skills_df, max_possible_match=100,
+                         alpha=0.6, beta=0.15, lambda_val=0.3, gamma=0.2, score_graph=None):
+    params = {'max_possible_match': max_possible_match, 'alpha': alpha, 'beta': beta, 'lambda_val': lambda_val, 'gamma': gamma}
+    key = make_score_cache_key(individual_profile, individual_skills_df, occupation, required_skills_df, **params)
+    return cache.get_or_compute(key, lambda: score_profile(individual_profile, individual_skills_df, occupation, required_skills_df, score_graph=score_graph, **params))
+
+# Cohort aggregates
+# One-pass summaries of batch-scored results (score_profiles_batch / batch_score.py output: one row per
+# (user, occupation)), updated chunk by chunk, so any number of rows is summarized in bounded memory.
+# StreamingHistogram keeps exact counts in a fixed number of equal-width bins, doubling the bin width
+# when a value falls outside the current range. QuantileSketch returns percentiles within a relative
+# error (DDSketch: counts per logarithmic bucket). GroupedSums accumulates row counts and column sums
+# per key, from which per-occupation means follow.
+
+COHORT_METRICS = ['vr_score', 'hr_score', 'skills_match_score', 'synergy_percentage', 'ai_r_score']
+COHORT_COLUMNS = ['user_id', 'occupation_name'] + COHORT_METRICS
+
+class StreamingHistogram:
+    def __init__(self, n_bins=64):
+        if n_bins < 2 or n_bins % 2:
+            raise ValueError("n_bins must be an even number of at least 2")
+        self.counts = np.zeros(n_bins, dtype=np.int64)
+        self.start = None
+        self.width = None
+
+    def update(self, values):
+        values = _as_float_array(values)
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return
+        low, high = values.min(), values.max()
+        n_bins = len(self.counts)
+        if self.start is None:
+            self.start = low
+            self.width = (high - low) / (n_bins - 1) if high > low else 1.0
+        # Merging neighbouring bins keeps every old edge an edge, so counts stay exact
+        while low < self.start:
+            self.counts = np.r_[np.zeros(n_bins // 2, dtype=np.int64), self.counts.reshape(-1, 2).sum(axis=1)]
+            self.start -= n_bins * self.width
+            self.width *= 2
+        while high >= self.start + n_bins * self.width:
+            self.counts = np.r_[self.counts.reshape(-1, 2).sum(axis=1), np.zeros(n_bins // 2, dtype=np.int64)]
+            self.width *= 2
+        codes = np.clip(((values - self.start) // self.width).astype(np.int64), 0, n_bins - 1)
+        self.counts += np.bincount(codes, minlength=n_bins)
+
+    def edges(self):
+        if self.start is None:
+            return np.zeros(0)
+        return self.start + self.width * np.arange(len(self.counts) + 1)
+
+class QuantileSketch:
+    def __init__(self, relative_accuracy=0.01, min_value=1e-9):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = np.log(self.gamma)
+        self.min_value = min_value # magnitudes below this count as zero
+        self.stores = {1: (0, np.zeros(0, dtype=np.int64)), -1: (0, np.zeros(0, dtype=np.int64))} # sign -> (first key, counts)
+        self.zero_count = 0
+        self.count = 0
+
+    def _keys(self, magnitudes):
+        return np.ceil(np.log(magnitudes) / self.log_gamma).astype(np.int64)
+
+    def _add(self, sign, keys):
+        first_key, counts = self.stores[sign]
+        if len(counts) == 0:
+            first_key = keys.min()
+        low, high = min(first_key, keys.min()), max(first_key + len(counts) - 1, keys.max())
+        if low < first_key or high >= first_key + len(counts):
+            grown = np.zeros(high - low + 1, dtype=np.int64)
+            grown[first_key - low:first_key - low + len(counts)] = counts
+            first_key, counts = low, grown
+        counts += np.bincount(keys - first_key, minlength=len(counts))
+        self.stores[sign] = (first_key, counts)
+
+    def update(self, values):
+        values = _as_float_array(values)
+        values = values[np.isfinite(values)]
+        positive = values > self.min_value
+        negative = values < -self.min_value
+        if positive.any():
+            self._add(1, self._keys(values[positive]))
+        if negative.any():
+            self._add(-1, self._keys(-values[negative]))
+        self.zero_count += len(values) - int(positive.sum()) - int(negative.sum())
+        self.count += len(values)
+
+    def _buckets(self):
+        # (representative value, count) of every bucket in ascending value order
+        representatives, counts = [], []
+        for sign in (-1, 1):
+            first_key, sign_counts = self.stores[sign]
+            values = sign * 2 * self.gamma ** (first_key + np.arange(len(sign_counts))) / (self.gamma + 1)
+            representatives.append(values[::sign])
+            counts.append(sign_counts[::sign])
+        return np.r_[representatives[0], 0.0, representatives[1]], np.r_[counts[0], self.zero_count, counts[1]]
+
+    def quantile(self, q):
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        values, counts = self._buckets()
+        positions = np.searchsorted(np.cumsum(counts), np.asarray(q, dtype=float) * (self.count - 1), side='right')
+        return values[np.minimum(positions, len(values) - 1)]
+
+    def rank(self, value):
+        # Fraction of values at or below value
+        if self.count == 0:
+            return np.nan
+        if abs(value) <= self.min_value:
+            bucket_value = 0.0
+        else:
+            bucket_value = np.sign(value) * 2 * self.gamma ** self._keys(np.abs(value)) / (self.gamma + 1)
+        values, counts = self._buckets()
+        return counts[values <= bucket_value].sum() / self.count
+
+class GroupedSums:
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.keys = pd.Index([])
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.sums = np.zeros((0, len(self.columns)))
+
+    def update(self, keys, values):
+        # keys: one group key per row; values: mapping of column name -> array (e.g. a DataFrame)
+        keys = keys if isinstance(keys, pd.Series) else pd.Series(keys)
+        codes = _index_codes(self.keys, keys)
+        if (codes < 0).any():
+            new_keys = _unique_index(keys[codes < 0])
+            self.keys = self.keys.append(new_keys)
+            self.counts = np.r_[self.counts, np.zeros(len(new_keys), dtype=np.int64)]
+            self.sums = np.vstack([self.sums, np.zeros((len(new_keys), len(self.columns)))])
+            codes = _index_codes(self.keys, keys)
+        self.counts += np.bincount(codes, minlength=len(self.keys))
+        for position, column in enumerate(self.columns):
+            self.sums[:, position] += np.bincount(codes, weights=_as_float_array(values[column]), minlength=len(self.keys))
+
+    def means(self):
+        means = pd.DataFrame(self.sums / np.maximum(self.counts, 1)[:, None], index=self.keys, columns=self.columns)
+        means.insert(0, 'count', self.counts)
+        return means
+
+class CohortAggregates:
+    # Histograms and quantile sketches of every metric plus per-occupation means, including the skill
+    # gap (100 - skills match: the importance-weighted share of required skill levels not yet met)
+    def __init__(self, metrics=COHORT_METRICS, n_bins=64, relative_accuracy=0.01):
+        self.metrics = list(metrics)
+        self.histograms = {metric: StreamingHistogram(n_bins) for metric in self.metrics}
+        self.sketches = {metric: QuantileSketch(relative_accuracy) for metric in self.metrics}
+        self.by_occupation = GroupedSums(self.metrics + ['skill_gap'])
+        self.rows = 0
+        self.users = 0
+        self._last_user_id = None
+
+    def update(self, scored):
+        if len(scored) == 0:
+            return
+        self.rows += len(scored)
+        # Rows of one user are adjacent in batch output, so users are counted at user_id changes
+        user_ids = np.asarray(scored['user_id'])
+        self.users += int(np.count_nonzero(user_ids[1:] != user_ids[:-1])) + int(user_ids[0] != self._last_user_id)
+        self._last_user_id = user_ids[-1]
+        for metric in self.metrics:
+            self.histograms[metric].update(scored[metric])
+            self.sketches[metric].update(scored[metric])
+        values = {metric: scored[metric] for metric in self.metrics}
+        values['skill_gap'] = 100 - _as_float_array(scored['skills_match_score'])
+        self.by_occupation.update(scored['occupation_name'], values)
+
+    def percentiles(self, percentiles=(1, 5, 25, 50, 75, 95, 99)):
+        return pd.DataFrame({f"p{p}": [self.sketches[metric].quantile(p / 100) for metric in self.metrics] for p in percentiles},
+                            index=pd.Index(self.metrics, name='metric'))
+
+def summarize_scored_results(scored_chunks, metrics=COHORT_METRICS, n_bins=64, relative_accuracy=0.01):
+    aggregates = CohortAggregates(metrics, n_bins, relative_accuracy)
+    for scored in scored_chunks:
+        aggregates.update(scored)
+    return aggregates
+
+def iter_synthetic_cohort_scores(n_profiles, hr_table, occupation_required_skills_df, chunk_size=100_000, seed=0, max_possible_match=100, alpha=0.6, beta=0.15):
+    # Scored chunks for a synthetic cohort whose skills are drawn from the catalog's required skills
+    skill_names = _unique_index(occupation_required_skills_df['skill_name'])
+    for profiles, skills in iter_synthetic_profiles(n_profiles, max(len(skill_names), 1), chunk_size=chunk_size, seed=seed, compact=True):
+        if len(skill_names):
+            skills['skill_name'] = skills['skill_name'].cat.rename_categories(skill_names)
+        yield score_profiles_batch(profiles, skills, hr_table, occupation_required_skills_df, max_possible_match, alpha, beta)
+
+# Chart rendering
+# Plotly figures are serialized to JSON and drawn by the browser point by point, so render_chart reduces
+# the data on the server before building a figure: bar charts keep the largest CHART_MAX_BARS bars,
+# pie charts keep the largest CHART_MAX_BARS - 1 slices plus an "Other" slice for the rest, histograms
+# are binned with NumPy (raw values never reach the figure), line traces are downsampled to the min and
+# max of each bucket (peaks survive) and scatter plots above CHART_MAX_POINTS become a binned density
+# heatmap. Line and scatter traces above CHART_WEBGL_POINTS are drawn with WebGL.
+# Figures are cached by kind, a content hash of the data and the options. The cache holds each figure's
+# JSON, so it is bounded by the bytes actually held (FIGURE_CACHE_MAX_BYTES), and every call returns
+# a new figure that the caller may modify.
+
+CHART_MAX_BARS = 40
+CHART_MAX_POINTS = 5_000
+CHART_WEBGL_POINTS = 1_000
+CHART_HISTOGRAM_BINS = 64
+CHART_DENSITY_BINS = 100
+FIGURE_CACHE_MAX_BYTES = 16 * 2**20
+
+def hash_chart_data(data):
+    digest = hashlib.sha1()
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        digest.update(repr(list(data.columns) if isinstance(data, pd.DataFrame) else data.name).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    elif isinstance(data, np.ndarray):
+        digest.update(repr((data.dtype.str, data.shape)).encode())
+        digest.update(np.ascontiguousarray(data).tobytes())
+    elif isinstance(data, (list, tuple)):
+        for item in data:
+            digest.update(hash_chart_data(item).encode())
+    else:
+        digest.update(repr(data).encode())
+    return digest.hexdigest()
+
+def limit_bars(df, y, max_bars=CHART_MAX_BARS):
+    # The max_bars rows with the largest y (first y column for grouped bars), in their original order
+    if len(df) <= max_bars:
+        return df
+    y = y[0] if isinstance(y, (list, tuple)) else y
+    return df.iloc[np.sort(np.argsort(-_as_float_array(df[y]), kind='stable')[:max_bars])]
+
+def downsample_min_max(values, max_points=CHART_MAX_POINTS):
+    # Positions of the minimum and maximum of each of at most max_points // 2 equal buckets, in order
+    values = _as_float_array(values)
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n)
+    n_buckets = max_points // 2
+    bucket_size = -(-n // n_buckets)
+    # One bucket per row; padding and NaNs never win
+    padded = np.full(n_buckets * bucket_size, np.nan)
+    padded[:n] = values
+    rows = padded.reshape(n_buckets, bucket_size)
+    missing = np.isnan(rows)
+    offsets = np.arange(n_buckets) * bucket_size
+    positions = np.r_[offsets + np.where(missing, np.inf, rows).argmin(axis=1), offsets + np.where(missing, -np.inf, rows).argmax(axis=1)]
+    return np.unique(positions[positions < n])
+
+def bin_points(x, y, n_bins=CHART_DENSITY_BINS):
+    # (counts[y_bin, x_bin], x_edges, y_edges) of the finite (x, y) pairs
+    x, y = _as_float_array(x), _as_float_array(y)
+    finite = np.isfinite(x) & np.isfinite(y)
+    counts, x_edges, y_edges = np.histogram2d(x[finite], y[finite], bins=n_bins)
+    return counts.T, x_edges, y_edges
+
+def _bar_figure(df, x, y, max_bars=CHART_MAX_BARS, title=None, **px_options):
+    import plotly.express as px
+
+    shown = limit_bars(df, y, max_bars)
+    if title and len(shown) < len(df):
+        title = f"{title} (Top {len(shown)} of {len(df)})"
+    return px.bar(shown, x=x, y=y, title=title, **px_options)
+
+def _pie_figure(df, names, values, max_bars=CHART_MAX_BARS, other_label="Other", **px_options):
+    import plotly.express as px
+
+    if len(df) > max_bars:
+        # The largest max_bars - 1 slices, and the rest summed into one slice so the total is unchanged
+        shown = limit_bars(df, values, max_bars - 1)
+        other = pd.DataFrame({names: [other_label], values: [_as_float_array(df[values]).sum() - _as_float_array(shown[values]).sum()]})
+        df = pd.concat([shown[[names, values]], other], ignore_index=True)
+    return px.pie(df, names=names, values=values, **px_options)
+
+def _line_figure(df, x, y, max_points=CHART_MAX_POINTS, **px_options):
+    import plotly.express as px
+
+    y_columns = list(y) if isinstance(y, (list, tuple)) else [y]
+    if len(df) > max_points:
+        # Union of every trace's extremes, so no trace loses its peaks
+        positions = np.unique(np.concatenate([downsample_min_max(df[column], max_points // len(y_columns)) for column in y_columns]))
+        df = df.iloc[positions]
+    render_mode = 'webgl' if len(df) > CHART_WEBGL_POINTS else 'auto'
+    return px.line(df, x=x, y=y, render_mode=render_mode, **px_options)
+
+def _scatter_figure(df, x, y, max_points=CHART_MAX_POINTS, n_bins=CHART_DENSITY_BINS, title=None, labels=None, **px_options):
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    if len(df) <= max_points:
+        render_mode = 'webgl' if len(df) > CHART_WEBGL_POINTS else 'auto'
+        return px.scatter(df, x=x, y=y, title=title, labels=labels, render_mode=render_mode, **px_options)
+    counts, x_edges, y_edges = bin_points(df[x], df[y], n_bins)
+    labels = labels or {}
+    figure = go.Figure(go.Heatmap(x=(x_edges[:-1] + x_edges[1:]) / 2, y=(y_edges[:-1] + y_edges[1:]) / 2,
+                                  z=np.where(counts > 0, counts, np.nan), colorscale='Viridis', colorbar=dict(title='Rows')))
+    figure.update_layout(title=title, xaxis_title=labels.get(x, x), yaxis_title=labels.get(y, y))
+    return figure
+
+def _histogram_figure(data, n_bins=CHART_HISTOGRAM_BINS, title=None, x_title=None, y_title='Rows', marker_x=None, marker_label=None, color=None):
+    # data: raw values, or precomputed (counts, edges) such as a StreamingHistogram's
+    import plotly.graph_objects as go
+
+    if isinstance(data, tuple):
+        counts, edges = data
+    else:
+        values = _as_float_array(data)
+        counts, edges = np.histogram(values[np.isfinite(values)], bins=n_bins)
+    figure = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), marker_color=color))
+    figure.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, bargap=0)
+    if marker_x is not None:
+        figure.add_vline(x=marker_x, line_dash='dash', annotation_text=marker_label)
+    return figure
+
+CHART_BUILDERS = {'bar': _bar_figure, 'pie': _pie_figure, 'line': _line_figure, 'scatter': _scatter_figure, 'histogram': _histogram_figure}
+# Entries are figure JSON strings, whose size estimate_memory_bytes measures exactly
+FIGURE_CACHE = ScoreCache(max_entries=256, max_bytes=FIGURE_CACHE_MAX_BYTES)
+
+def render_chart(kind, data, cache=FIGURE_CACHE, **options):
+    # Plotly figure of data for a CHART_BUILDERS kind; options are the builder's keyword arguments.
+    # A cache hit rebuilds the figure from its cached JSON, so callers never share a figure object.
+    if cache is None:
+        return CHART_BUILDERS[kind](data, **options)
+    import plotly.io as pio
+
+    key = hashlib.sha1(repr((kind, hash_chart_data(data), sorted(options.items()))).encode()).hexdigest()
+    figure_json = cache.get(key)
+    if figure_json is None:
+        figure = CHART_BUILDERS[kind](data, **options)
+        cache.put(key, pio.to_json(figure, validate=False))
+        return figure
+    return pio.from_json(figure_json)
+
+# Session memory accounting
+
+def estimate_memory_bytes(value):
+    # Deep estimate: pandas and NumPy buffers, containers item by item, and objects that report their own
+    # size with a memory_bytes() method (SkillGapIndex, ScoreGraph, ScoreCache, HotPathTimer)
+    if not isinstance(value, type) and callable(getattr(value, 'memory_bytes', None)):
+        return value.memory_bytes()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(deep=True)))
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_memory_bytes(k) + estimate_memory_bytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_memory_bytes(v) for v in value)
+    return sys.getsizeof(value)
+
+def calculate_session_memory_usage(session_values, shared_keys):
+    # Bytes owned by the session: values under shared_keys (views of the process-shared tables, measured
+    # once per data version by the caller) and their aliases are skipped; a value held under several
+    # keys is counted once
+    counted_ids = {id(session_values[key]) for key in shared_keys if key in session_values}
+    session_bytes = 0
+    for key, value in session_values.items():
+        if key not in shared_keys and id(value) not in counted_ids:
+            counted_ids.add(id(value))
+            session_bytes += estimate_memory_bytes(value)
+    return session_bytes
+
+# Hot-path timing
+# Opt-in call counts and wall time for every public utils.py function but the scalar formulas (see
+# SCALAR_FORMULA_NAMES), for the public methods of its classes (recorded as e.g. ScoreGraph.evaluate)
+# and for named page sections.
+# Each is wrapped once, when this module finishes loading (see the end of the file);
+# the wrapper looks up the timer active in the calling context (a contextvar, so per thread and per
+# asyncio task) and calls straight through when there is none. A timer records only inside its own
+# activate() block, so one session's timing never sees another session's calls. Times are
+# cumulative: a function's total includes the utils calls it makes.
+
+_active_hot_path_timer = contextvars.ContextVar('active_hot_path_timer', default=None)
+
+class HotPathTimer:
+    def __init__(self):
+        self.stats = {} # name -> [calls, total seconds, max seconds]
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            stat = self.stats.get(name)
+            if stat is None:
+                self.stats[name] = [1, seconds, seconds]
+            else:
+                stat[0] += 1
+                stat[1] += seconds
+                stat[2] = max(stat[2], seconds)
+
+    @contextmanager
+    def activate(self, enabled=True):
+        # Times the utils.py calls and sections made in this context until the block exits
+        if not enabled:
+            yield self
+            return
+        token = _active_hot_path_timer.set(self)
+        try:
+            yield self
+        finally:
+            _active_hot_path_timer.reset(token)
+
+    @contextmanager
+    def section(self, name):
+        if _active_hot_path_timer.get() is not self:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def reset(self):
+        with self._lock:
+            self.stats.clear()
+
+    def memory_bytes(self):
+        with self._lock:
+            return sys.getsizeof(self) + estimate_memory_bytes(self.stats)
+
+    def snapshot(self):
+        with self._lock:
+            rows = [(name, calls, total, total / calls, maximum) for name, (calls, total, maximum) in self.stats.items()]
+        return pd.DataFrame(rows, columns=['name', 'calls', 'total_seconds', 'mean_seconds', 'max_seconds']).sort_values(
+            'total_seconds', ascending=False, ignore_index=True)
+
+    def to_json(self):
+        return json.dumps({'timings': self.snapshot().to_dict('records')}, indent=2)
+
+    def to_openmetrics(self, prefix="qulab_hot_path"):
+        snapshot = self.snapshot()
+        labels = ['name="' + name.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"' for name in snapshot['name']]
+        lines = [f"# TYPE {prefix}_calls counter", f"# HELP {prefix}_calls Calls of each timed function or page section."]
+        lines += [f"{prefix}_calls_total{{{label}}} {calls}" for label, calls in zip(labels, snapshot['calls'])]
+        lines += [f"# TYPE {prefix}_seconds counter", f"# UNIT {prefix}_seconds seconds", f"# HELP {prefix}_seconds Cumulative wall time."]
+        lines += [f"{prefix}_seconds_total{{{label}}} {total!r}" for label, total in zip(labels, snapshot['total_seconds'])]
+        lines += [f"# TYPE {prefix}_max_seconds gauge", f"# UNIT {prefix}_max_seconds seconds", f"# HELP {prefix}_max_seconds Slowest single call."]
+        lines += [f"{prefix}_max_seconds{{{label}}} {maximum!r}" for label, maximum in zip(labels, snapshot['max_seconds'])]
+        return "\n".join(lines + ["# EOF"]) + "\n"
+
+def _timed(function, name=None):
+    name = name or function.__name__
+
+    @functools.wraps(function)
+    def timed_function(*args, **kwargs):
+        timer = _active_hot_path_timer.get()
+        if timer is None:
+            return function(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timer.record(name, time.perf_counter() - started)
+    return timed_function
+
+def _wrap_hot_paths(namespace):
+    # Rebinds each public function of this module, except the scalar formulas, and each public method of
+    # its classes, except the timer's own, to its timed wrapper
+    for name, value in list(namespace.items()):
+        if inspect.isfunction(value) and value.__module__ == __name__ and not name.startswith('_') and name not in SCALAR_FORMULA_NAMES:
+            namespace[name] = _timed(value)
+        elif inspect.isclass(value) and value.__module__ == __name__ and value is not HotPathTimer:
+            for method_name, method in list(vars(value).items()):
+                if inspect.isfunction(method) and not method_name.startswith('_'):
+                    setattr(value, method_name, _timed(method, f"{name}.{method_name}"))
+
+# Compact dtype schema
+# Large cohorts repeat the same few strings millions of times and keep bounded scores in 8-byte
+# numbers. compact_table stores names as categoricals (one integer code per row; lookups such as
+# the education table and skill/occupation matching then work per category, see _index_codes),
+# 0-100 integer scores as uint8, counts as uint16 and the remaining bounded scores, hours and years
+# as float32. Integer targets fall back to float32 when a column holds fractional, negative,
+# out-of-range or missing values, so integers are never truncated. float32 keeps about 7
+# significant digits, which is plenty for these inputs; the formulas still compute in float64.
+# Education levels outside the known list become missing, which scores 0.0 like any other level.
+
+EDUCATION_LEVEL_DTYPE = pd.CategoricalDtype(EDUCATION_LEVELS + ["Other"])
+COMPACT_COLUMN_DTYPES = {
+    'education_level': EDUCATION_LEVEL_DTYPE,
+    'occupation_name': 'category', 'skill_name': 'category', 'pathway_name': 'category', 'pathway_type': 'category',
+    'prompting_score': np.float32, 'tools_score': np.float32, 'understanding_score': np.float32, 'datalit_score': np.float32,
+    'delta_proficiency': np.float32, 'portfolio_score': np.float32, 'recognition_score': np.float32, 'credentials_score': np.float32,
+    'skill_importance': np.float32,
+    'time_without_ai': np.float32, 'time_with_ai': np.float32, 'delta_t_hours_invested': np.float32, 'years_experience': np.float32,
+    'output_quality_with_ai': np.uint8, 'output_quality_without_ai': np.uint8, 'cognitive_flexibility': np.uint8,
+    'social_emotional_intelligence': np.uint8, 'strategic_career_management': np.uint8,
+    'individual_skill_score': np.uint8, 'required_skill_score': np.uint8,
+    'errors_caught': np.uint16, 'total_ai_errors': np.uint16, 'appropriate_trust_decisions': np.uint16, 'total_decisions': np.uint16
+}
+
+def _compact_column(values, dtype):
+    if isinstance(dtype, pd.CategoricalDtype):
+        return values.where(values.isin(dtype.categories)).astype(dtype)
+    if dtype == 'category':
+        return values.astype(dtype)
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'u':
+        numbers = values.to_numpy(dtype=float, na_value=np.nan)
+        if not (np.all(np.isfinite(numbers)) and np.all(numbers == np.round(numbers))
+                and (len(numbers) == 0 or (numbers.min() >= 0 and numbers.max() <= np.iinfo(dtype).max))):
+            dtype = np.dtype(np.float32)
+    return values.astype(dtype)
+
+def compact_table(df, dtypes=None):
+    # Copy of df with every column listed in dtypes (default COMPACT_COLUMN_DTYPES) converted
+    dtypes = COMPACT_COLUMN_DTYPES if dtypes is None else dtypes
+    return df.assign(**{column: _compact_column(df[column], dtype) for column, dtype in dtypes.items() if column in df.columns})
+
+# Columnar storage
+# Tables are stored as Parquet (a file or a directory of parts), Arrow IPC / Feather (.arrow, .feather)
+# or a directory of .npy files, one per column (categoricals as codes plus categories, string and
+# nullable columns with a null mask). Only the requested columns are read; Arrow IPC and .npy files
+# are memory-mapped, so numeric columns are paged in from disk as they are touched instead of being
+# loaded up front. Large users x skills matrices are stored as .npy and memory-mapped too.
+
+REFERENCE_TABLE_FILES = {
+    'individual_profiles_df': 'individual_profiles', 'occupational_data_df': 'occupational_data',
+    'learning_pathways_df': 'learning_pathways', 'occupation_required_skills_df': 'occupation_required_skills',
+    'individual_skills_df': 'individual_skills'
+}
+COLUMNAR_TABLE_SUFFIXES = ['.arrow', '.feather', '.parquet', '']
+
+def is_npy_table(path):
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, '_columns.txt'))
+
+def read_columnar_table(path, columns=None):
+    if is_npy_table(path):
+        with open(os.path.join(path, '_columns.txt')) as column_file:
+            available = column_file.read().split('\n')[:-1]
+        selected = available if columns is None else [column for column in columns if column in available]
+        dtypes_path = os.path.join(path, '_dtypes.json')
+        dtypes = {}
+        if os.path.exists(dtypes_path):
+            with open(dtypes_path) as dtypes_file:
+                dtypes = json.load(dtypes_file)
+        arrays = {column: _read_npy_column(path, available.index(column), dtypes.get(column)) for column in selected}
+        return pd.DataFrame(arrays, columns=selected, copy=False)
+    if path.endswith(('.arrow', '.feather')):
+        import pyarrow as pa
+
+        # Record batches reference the mapped file directly; nothing is read until a column is used
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        if columns is not None:
+            table = table.select([column for column in columns if column in table.column_names])
+    else:
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(path, format='parquet')
+        table = dataset.to_table(columns=None if columns is None else [column for column in columns if column in dataset.schema.names])
+    return table.to_pandas(split_blocks=True)
+
+def iter_columnar_chunks(path, chunk_size, columns=None):
+    # The table at path (CSV or any read_columnar_table format) as DataFrames of at most chunk_size rows,
+    # holding one chunk in memory at a time; columns selects a subset (unknown names are ignored)
+    if path.endswith(('.arrow', '.feather')):
+        import pyarrow as pa
+
+        # Memory-mapped: each slice is read from disk only when converted
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        if columns is not None:
+            table = table.select([column for column in columns if column in table.column_names])
+        for start in range(0, table.num_rows, chunk_size):
+            yield table.slice(start, chunk_size).to_pandas()
+    elif is_npy_table(path):
+        table = read_columnar_table(path, columns)
+        for start in range(0, len(table), chunk_size):
+            yield table.iloc[start:start + chunk_size]
+    elif os.path.isdir(path):
+        for part_path in sorted(glob.glob(os.path.join(path, '*.parquet'))):
+            yield from iter_columnar_chunks(part_path, chunk_size, columns)
+    elif path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        selected = None if columns is None else [column for column in columns if column in parquet_file.schema_arrow.names]
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=selected):
+            yield batch.to_pandas()
+    else:
+        header = pd.read_csv(path, nrows=0).columns
+        yield from pd.read_csv(path, chunksize=chunk_size, usecols=None if columns is None else [column for column in columns if column in header])
+
+def write_columnar_table(df, path):
+    # Format follows the path: .parquet, .arrow/.feather (uncompressed, so it can be memory-mapped) or a .npy directory
+    if path.endswith('.parquet'):
+        df.to_parquet(path, index=False)
+    elif path.endswith(('.arrow', '.feather')):
+        import pyarrow.feather as feather
+
+        feather.write_feather(df.reset_index(drop=True), path, compression='uncompressed')
+    else:
+        # Convert every column before writing anything, so an unsupported column leaves no partial table
+        encoded = [_npy_column(df[column]) for column in df.columns]
+        os.makedirs(path, exist_ok=True)
+        dtypes = {}
+        for position, (column, (values, mask, categories, dtype)) in enumerate(zip(df.columns, encoded)):
+            np.save(os.path.join(path, f"{position}.npy"), values)
+            if mask is not None:
+                np.save(os.path.join(path, f"{position}.mask.npy"), mask)
+            if categories is not None:
+                np.save(os.path.join(path, f"{position}.categories.npy"), categories)
+            if dtype is not None:
+                dtypes[column] = dtype
+        with open(os.path.join(path, '_dtypes.json'), 'w') as dtypes_file:
+            json.dump(dtypes, dtypes_file)
+        with open(os.path.join(path, '_columns.txt'), 'w') as column_file:
+            column_file.write(''.join(f"{column}\n" for column in df.columns))
+
+def _npy_column(series):
+    # (values, null mask or None, categories or None, dtype record or None) for one column of a .npy
+    # table. Categoricals are stored as integer codes (-1 = missing) plus their categories; string and
+    # nullable columns as plain arrays plus a null mask. NumPy columns are stored as they are (NaN and
+    # NaT included). Anything else raises rather than being written as something it is not.
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories, _, _, _ = _npy_column(pd.Series(dtype.categories))
+        return series.cat.codes.to_numpy(), None, categories, {'dtype': 'category', 'ordered': bool(dtype.ordered)}
+    if isinstance(dtype, np.dtype) and dtype != object:
+        return series.to_numpy(), None, None, None
+    mask = series.isna().to_numpy()
+    if dtype == object or isinstance(dtype, pd.StringDtype):
+        if not all(type(value) is str for value in series[~mask]):
+            raise TypeError(f"column {series.name!r} holds non-string objects, which a .npy table cannot store")
+        values = series.to_numpy(dtype=object, na_value='').astype(str)
+    elif isinstance(getattr(dtype, 'numpy_dtype', None), np.dtype):
+        # Nullable integer, float and boolean columns
+        values = series.to_numpy(dtype=dtype.numpy_dtype, na_value=dtype.numpy_dtype.type(0))
+    else:
+        raise TypeError(f"column {series.name!r} has dtype {dtype}, which a .npy table cannot store")
+    return values, mask if mask.any() else None, None, {'dtype': str(dtype)}
+
+def _read_npy_column(path, position, dtype):
+    values = np.load(os.path.join(path, f"{position}.npy"), mmap_mode='r')
+    if dtype is None:
+        return values
+    if dtype['dtype'] == 'category':
+        categories = np.load(os.path.join(path, f"{position}.categories.npy"))
+        return pd.Categorical.from_codes(values, categories=categories, ordered=dtype['ordered'])
+    mask_path = os.path.join(path, f"{position}.mask.npy")
+    column = pd.Series(values, copy=False)
+    if dtype['dtype'] == 'object' or os.path.exists(mask_path):
+        column = column.astype(object)
+    if os.path.exists(mask_path):
+        column = column.mask(np.load(mask_path), None)
+    return column.astype(dtype['dtype'])
+
+def find_columnar_table(data_dir, name):
+    for suffix in COLUMNAR_TABLE_SUFFIXES:
+        path = os.path.join(data_dir, name + suffix)
+        if os.path.isfile(path) or is_npy_table(path) or (suffix == '' and os.path.isdir(path) and glob.glob(os.path.join(path, '*.parquet'))):
+            return path
+    return None
+
+def load_reference_data(data_dir, columns=None):
+    # Tables found in data_dir (named as in REFERENCE_TABLE_FILES, any supported format) replace the
+    # synthetic defaults. Only the columns of the synthetic schema are read unless columns maps a
+    # table name to other columns (None reads every column).
+    tables = dict(zip(REFERENCE_TABLE_FILES, generate_synthetic_data()))
+    for table_name, file_name in REFERENCE_TABLE_FILES.items():
+        path = find_columnar_table(data_dir, file_name)
+        if path is not None:
+            tables[table_name] = read_columnar_table(path, (columns or {}).get(table_name, list(tables[table_name].columns)))
+    return tables
+
+def write_user_skill_matrix(path, users, skills, user_skill_matrix):
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, 'matrix.npy'), np.ascontiguousarray(user_skill_matrix))
+    np.save(os.path.join(path, 'users.npy'), np.asarray(users))
+    np.save(os.path.join(path, 'skills.npy'), np.asarray(skills).astype(str))
+
+def read_user_skill_matrix(path):
+    # Returns (users, skills, memory-mapped matrix) for calculate_skills_match_from_matrix(..., matrix_skills=skills)
+    users = pd.Index(np.load(os.path.join(path, 'users.npy')), name='user_id')
+    skills = pd.Index(np.load(os.path.join(path, 'skills.npy')))
+    return users, skills, np.load(os.path.join(path, 'matrix.npy'), mmap_mode='r')
+
+# Startup snapshot
+# The reference tables saved as memory-mappable Arrow IPC files (.npy column directories when pyarrow is
+# not installed) with a manifest holding their data version and a fingerprint of their source: this
+# module's code plus the path, size and modification time of every table file in data_dir. An app
+# process that finds a matching snapshot starts without parsing, converting or hashing the tables;
+# a stale one is ignored.
+
+STARTUP_SNAPSHOT_FORMAT = 1
+
+def prepare_reference_data(data_dir=None):
+    # Reference tables (from data_dir, else synthetic) and their data version; derived tables such as
+    # the H^R table and skill index depend only on the occupation, pathway and required-skill tables
+    tables = load_reference_data(data_dir) if data_dir else dict(zip(REFERENCE_TABLE_FILES, generate_synthetic_data()))
+    data_version = compute_data_version(tables['occupational_data_df'], tables['learning_pathways_df'], tables['occupation_required_skills_df'])
+    return tables, data_version
+
+def reference_data_fingerprint(data_dir=None):
+    digest = hashlib.sha1()
+    with open(__file__, 'rb') as module_file:
+        digest.update(module_file.read())
+    for file_name in (REFERENCE_TABLE_FILES.values() if data_dir else []):
+        path = find_columnar_table(data_dir, file_name)
+        if path is None:
+            continue
+        paths = [path] if os.path.isfile(path) else sorted(glob.glob(os.path.join(path, '**'), recursive=True))
+        for file_path in filter(os.path.isfile, paths):
+            stat = os.stat(file_path)
+            digest.update(f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+def write_startup_snapshot(snapshot_dir, data_dir=None):
+    tables, data_version = prepare_reference_data(data_dir)
+    suffix = '.arrow' if importlib.util.find_spec('pyarrow') else ''
+    os.makedirs(snapshot_dir, exist_ok=True)
+    for table_name, table in tables.items():
+        write_columnar_table(table, os.path.join(snapshot_dir, table_name + suffix))
+    # Manifest last: a snapshot interrupted while writing has none and is never loaded
+    with open(os.path.join(snapshot_dir, 'snapshot.json'), 'w') as manifest_file:
+        json.dump({'format': STARTUP_SNAPSHOT_FORMAT, 'fingerprint': reference_data_fingerprint(data_dir), 'data_version': data_version,
+                   'tables': {table_name: table_name + suffix for table_name in tables}}, manifest_file, indent=2)
+    return data_version
+
+def load_startup_snapshot(snapshot_dir, data_dir=None):
+    # (tables, data_version) from a snapshot of the same source, else None
+    manifest_path = os.path.join(snapshot_dir, 'snapshot.json')
+    if not os.path.isfile(manifest_path):
+        return None
+    with open(manifest_path) as manifest_file:
+        manifest = json.load(manifest_file)
+    if manifest.get('format') != STARTUP_SNAPSHOT_FORMAT or manifest.get('fingerprint') != reference_data_fingerprint(data_dir):
+        return None
+    tables = {table_name: read_columnar_table(os.path.join(snapshot_dir, file_name)) for table_name, file_name in manifest['tables'].items()}
+    return tables, manifest['data_version']
+
 # Synthetic Data Generation
 def generate_synthetic_data():
     individual_profiles_data = {
@@ -190,7 +1989,8 @@ def generate_synthetic_data():
         'pathway_type': ['AI-Fluency', 'Domain+AI Integration', 'Adaptive Capacity'],
         'impact_ai_fluency': [0.2, 0.1, 0.05],
         'impact_domain_expertise': [0.05, 0.2, 0.1],
-        'impact_adaptive_capacity': [0.1, 0.05, 0.2]
+        'impact_adaptive_capacity': [0.1, 0.05, 0.2],
+        'duration_hours': [20, 40, 15]
     }
     learning_pathways_df = pd.DataFrame(learning_pathways_data)
 
@@ -210,3 +2010,160 @@ def generate_synthetic_data():
     individual_skills_df = pd.DataFrame(individual_skills_data)
 
     return individual_profiles_df, occupational_data_df, learning_pathways_df, occupation_required_skills_df, individual_skills_df
+
+# Scalable synthetic population
+# Seeded NumPy sampling with the same column schema and value ranges as generate_synthetic_data.
+# Profiles are produced in chunks (each chunk has its own seed derived from (seed, chunk index)),
+# so populations far larger than memory can be streamed or written out partition by partition.
+
+PATHWAY_TYPES = ["AI-Fluency", "Domain+AI Integration", "Adaptive Capacity"]
+
+def _synthetic_skill_names(n_skills):
+    return np.array([f"Skill {i:05d}" for i in range(n_skills)], dtype=object)
+
+def _synthetic_skill_popularity(n_skills):
+    # Zipf-like: a few skills (think Python, Data Visualization) are held by most people
+    weights = 1.0 / np.arange(1, n_skills + 1)
+    return weights / weights.sum()
+
+def generate_synthetic_reference_data(n_occupations=6, n_pathways=3, n_skills=50, skills_per_occupation=5, seed=0):
+    rng = np.random.default_rng(np.random.SeedSequence([seed, 0]))
+
+    median_wage = rng.integers(50, 151, n_occupations) * 1000
+    previous_job_postings = rng.integers(100, 1001, n_occupations)
+    job_growth_rate_g = np.round(rng.uniform(0.05, 0.45, n_occupations), 2)
+    occupational_data_df = pd.DataFrame({
+        'occupation_name': [f"Occupation {i:05d}" for i in range(n_occupations)],
+        'ai_enhancement_score': np.round(rng.uniform(0.5, 1.0, n_occupations), 2),
+        'job_growth_rate_g': job_growth_rate_g,
+        'ai_skilled_wage': (median_wage * rng.uniform(1.1, 1.5, n_occupations)).round(-3).astype(int),
+        'median_wage': median_wage,
+        'education_years_required': rng.choice([2, 4, 6], n_occupations),
+        'experience_years_required': rng.integers(0, 6, n_occupations),
+        'current_job_postings': (previous_job_postings * (1 + job_growth_rate_g * rng.uniform(0.5, 1.5, n_occupations))).astype(int),
+        'previous_job_postings': previous_job_postings,
+        'remote_work_factor': np.round(rng.uniform(0.2, 0.9, n_occupations), 2),
+        'local_demand': np.round(rng.uniform(0.8, 1.5, n_occupations), 2),
+        'national_avg_demand': np.ones(n_occupations)
+    })
+
+    pathway_type_codes = rng.integers(0, len(PATHWAY_TYPES), n_pathways)
+    impacts = np.round(rng.uniform(0.0, 0.1, (n_pathways, 3)), 2)
+    impacts[np.arange(n_pathways), pathway_type_codes] += 0.1 # each pathway mostly moves the component it targets
+    learning_pathways_df = pd.DataFrame({
+        'pathway_id': np.arange(1, n_pathways + 1),
+        'pathway_name': [f"Pathway {i:04d}" for i in range(1, n_pathways + 1)],
+        'pathway_type': np.array(PATHWAY_TYPES, dtype=object)[pathway_type_codes],
+        'impact_ai_fluency': impacts[:, 0],
+        'impact_domain_expertise': impacts[:, 1],
+        'impact_adaptive_capacity': impacts[:, 2],
+        'duration_hours': rng.integers(5, 81, n_pathways)
+    })
+
+    skills_per_occupation = min(skills_per_occupation, n_skills)
+    skill_names = _synthetic_skill_names(n_skills)
+    # Weighted sampling without replacement (Gumbel top-k), skewed towards popular skills;
+    # done in blocks of occupations so large catalogs never materialize occupations x skills
+    log_popularity = np.log(_synthetic_skill_popularity(n_skills))
+    occupation_skill_codes = np.empty((n_occupations, skills_per_occupation), dtype=int)
+    block_size = max(1, 2**22 // n_skills)
+    for start in range(0, n_occupations, block_size):
+        skill_keys = log_popularity + rng.gumbel(size=(min(block_size, n_occupations - start), n_skills))
+        occupation_skill_codes[start:start + block_size] = np.argpartition(-skill_keys, skills_per_occupation - 1, axis=1)[:, :skills_per_occupation]
+    n_required = n_occupations * skills_per_occupation
+    occupation_required_skills_df = pd.DataFrame({
+        'occupation_name': np.repeat(occupational_data_df['occupation_name'].to_numpy(), skills_per_occupation),
+        'skill_name': skill_names[occupation_skill_codes.ravel()],
+        'required_skill_score': rng.integers(50, 96, n_required),
+        'skill_importance': np.round(rng.uniform(0.3, 1.0, n_required), 2)
+    })
+
+    return occupational_data_df, learning_pathways_df, occupation_required_skills_df
+
+def _generate_synthetic_profile_chunk(user_ids, n_skills, skills_per_profile, rng):
+    n = len(user_ids)
+    total_ai_errors = rng.integers(0, 51, n)
+    total_decisions = rng.integers(0, 51, n)
+    individual_profiles_df = pd.DataFrame({
+        'user_id': user_ids,
+        'prompting_score': np.round(rng.uniform(0, 1, n), 2), 'tools_score': np.round(rng.uniform(0, 1, n), 2),
+        'understanding_score': np.round(rng.uniform(0, 1, n), 2), 'datalit_score': np.round(rng.uniform(0, 1, n), 2),
+        'output_quality_with_ai': rng.integers(0, 101, n), 'output_quality_without_ai': rng.integers(0, 101, n),
+        'time_without_ai': rng.integers(0, 11, n), 'time_with_ai': rng.integers(0, 11, n),
+        'errors_caught': np.floor(total_ai_errors * rng.uniform(0, 1, n)).astype(int),
+        'total_ai_errors': total_ai_errors,
+        'appropriate_trust_decisions': np.floor(total_decisions * rng.uniform(0, 1, n)).astype(int),
+        'total_decisions': total_decisions, 'delta_proficiency': np.round(rng.uniform(0, 1, n), 2),
+        'delta_t_hours_invested': rng.integers(0, 51, n),
+        'education_level': np.array(EDUCATION_LEVELS + ["Other"], dtype=object)[rng.integers(0, len(EDUCATION_LEVELS) + 1, n)],
+        'years_experience': rng.integers(0, 31, n), 'portfolio_score': np.round(rng.uniform(0, 1, n), 2),
+        'recognition_score': np.round(rng.uniform(0, 1, n), 2), 'credentials_score': np.round(rng.uniform(0, 1, n), 2),
+        'cognitive_flexibility': rng.integers(0, 101, n), 'social_emotional_intelligence': rng.integers(0, 101, n),
+        'strategic_career_management': rng.integers(0, 101, n)
+    })
+
+    # Sparse skill matrix: a Poisson number of draws per user from a skewed popularity
+    # distribution; repeated draws of the same skill collapse into one row
+    skill_counts = np.maximum(rng.poisson(skills_per_profile, n), 1)
+    skill_user_ids = np.repeat(user_ids, skill_counts)
+    skill_codes = rng.choice(n_skills, size=skill_counts.sum(), p=_synthetic_skill_popularity(n_skills))
+    individual_skills_df = pd.DataFrame({
+        'user_id': skill_user_ids,
+        'skill_code': skill_codes,
+        'individual_skill_score': rng.integers(0, 101, len(skill_codes))
+    }).drop_duplicates(subset=['user_id', 'skill_code'])
+    individual_skills_df.insert(1, 'skill_name', _synthetic_skill_names(n_skills)[individual_skills_df.pop('skill_code').to_numpy()])
+
+    return individual_profiles_df, individual_skills_df.reset_index(drop=True)
+
+def _synthetic_compact_dtypes(n_skills):
+    # Every chunk and table shares one skill-name category list, so codes agree across them
+    return {**COMPACT_COLUMN_DTYPES, 'skill_name': pd.CategoricalDtype(_synthetic_skill_names(n_skills))}
+
+def iter_synthetic_profiles(n_profiles, n_skills=50, skills_per_profile=8, chunk_size=100_000, seed=0, compact=False):
+    # Yields (individual_profiles_df, individual_skills_df) chunks covering user_id 1..n_profiles;
+    # compact=True applies compact_table
+    for chunk_index, start in enumerate(range(0, n_profiles, chunk_size)):
+        rng = np.random.default_rng(np.random.SeedSequence([seed, 1, chunk_index]))
+        user_ids = np.arange(start + 1, min(start + chunk_size, n_profiles) + 1)
+        profiles, skills = _generate_synthetic_profile_chunk(user_ids, n_skills, skills_per_profile, rng)
+        if compact:
+            profiles, skills = compact_table(profiles), compact_table(skills, _synthetic_compact_dtypes(n_skills))
+        yield profiles, skills
+
+def generate_synthetic_population(n_profiles, n_occupations=6, n_pathways=3, n_skills=50, skills_per_profile=8, skills_per_occupation=5, chunk_size=100_000, seed=0, compact=False):
+    # In-memory variant returning the same five frames as generate_synthetic_data
+    occupational_data_df, learning_pathways_df, occupation_required_skills_df = generate_synthetic_reference_data(
+        n_occupations, n_pathways, n_skills, skills_per_occupation, seed)
+    if compact:
+        occupational_data_df, learning_pathways_df, occupation_required_skills_df = (
+            compact_table(table, _synthetic_compact_dtypes(n_skills)) for table in (occupational_data_df, learning_pathways_df, occupation_required_skills_df))
+    chunks = list(iter_synthetic_profiles(n_profiles, n_skills, skills_per_profile, chunk_size, seed, compact))
+    individual_profiles_df = pd.concat([profiles for profiles, _ in chunks], ignore_index=True)
+    individual_skills_df = pd.concat([skills for _, skills in chunks], ignore_index=True)
+    return individual_profiles_df, occupational_data_df, learning_pathways_df, occupation_required_skills_df, individual_skills_df
+
+def write_synthetic_population(output_dir, n_profiles, n_occupations=6, n_pathways=3, n_skills=50, skills_per_profile=8, skills_per_occupation=5, chunk_size=100_000, seed=0, compact=False):
+    # Writes reference tables as single Parquet files and profiles/skills as one Parquet
+    # partition per chunk, holding at most one chunk in memory (requires pyarrow)
+    os.makedirs(os.path.join(output_dir, "individual_profiles"), exist_ok=True)
+    os.makedirs(os.path.join(output_dir, "individual_skills"), exist_ok=True)
+
+    occupational_data_df, learning_pathways_df, occupation_required_skills_df = generate_synthetic_reference_data(
+        n_occupations, n_pathways, n_skills, skills_per_occupation, seed)
+    if compact:
+        occupational_data_df, learning_pathways_df, occupation_required_skills_df = (
+            compact_table(table, _synthetic_compact_dtypes(n_skills)) for table in (occupational_data_df, learning_pathways_df, occupation_required_skills_df))
+    occupational_data_df.to_parquet(os.path.join(output_dir, "occupational_data.parquet"), index=False)
+    learning_pathways_df.to_parquet(os.path.join(output_dir, "learning_pathways.parquet"), index=False)
+    occupation_required_skills_df.to_parquet(os.path.join(output_dir, "occupation_required_skills.parquet"), index=False)
+
+    n_parts = 0
+    for part, (profiles, skills) in enumerate(iter_synthetic_profiles(n_profiles, n_skills, skills_per_profile, chunk_size, seed, compact)):
+        profiles.to_parquet(os.path.join(output_dir, "individual_profiles", f"part-{part:05d}.parquet"), index=False)
+        skills.to_parquet(os.path.join(output_dir, "individual_skills", f"part-{part:05d}.parquet"), index=False)
+        n_parts += 1
+    return n_parts
+
+# Hot-path timing wrappers, applied last so that every public function above is covered
+_wrap_hot_paths(globals())
@@ -0,0 +1,182 @@
+import argparse
+import multiprocessing
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from application_pages.utils import (
+    iter_columnar_chunks,
+    prepare_reference_data,
+    calculate_systematic_opportunity_table,
+    score_profiles_batch
+)
+
+# Headless AI-R scoring for large profile files.
+#
+# Profiles (and optionally individual skills) are read in chunks from CSV, Parquet, a
+# directory of Parquet part files, Arrow IPC / Feather or a .npy column directory (see
+# iter_columnar_chunks), scored against the selected occupations with the utils.py batch
+# formulas and appended to the output file chunk by chunk, so memory use depends on
+# --chunk-size rather than on the input size. Skill rows are matched to profile
+# chunks by streaming both inputs in user_id order, so both files must be sorted by user_id
+# (write_synthetic_population produces them that way).
+#
+# With --workers N, chunks are scored by a pool of N processes. Workers are started with
+# forkserver where the platform has it (spawn otherwise), never fork, so they do not inherit
+# the parent's threads and locks. The reference tables are handed to each worker once, as pool
+# initializer arguments, and results are written back in input order, so the output is
+# identical to the serial path.
+#
+#   python batch_score.py profiles.parquet --skills skills.parquet --output scores.parquet --workers 32
+#   python batch_score.py profiles.csv --occupation "Data Scientist" --output scores.csv
+
+def read_table(path):
+    return pd.concat(iter_columnar_chunks(path, 1_000_000), ignore_index=True)
+
+def iter_aligned_chunks(profile_chunks, skill_chunks, skill_columns):
+    # Pairs each profile chunk with the skill rows of the same users; both streams sorted by user_id
+    pending = pd.DataFrame(columns=skill_columns)
+    skill_chunks = iter(skill_chunks)
+    skills_exhausted = False
+    last_user_id = None
+    for profiles in profile_chunks:
+        if profiles.empty:
+            continue
+        if not profiles['user_id'].is_monotonic_increasing or (last_user_id is not None and profiles['user_id'].iloc[0] <= last_user_id):
+            raise ValueError("Profiles must be sorted by user_id")
+        last_user_id = profiles['user_id'].iloc[-1]
+
+        while not skills_exhausted and (pending.empty or pending['user_id'].iloc[-1] <= last_user_id):
+            try:
+                next_chunk = next(skill_chunks)
+            except StopIteration:
+                skills_exhausted = True
+                break
+            pending = next_chunk if pending.empty else pd.concat([pending, next_chunk], ignore_index=True)
+            if not pending['user_id'].is_monotonic_increasing:
+                raise ValueError("Individual skills must be sorted by user_id")
+
+        in_chunk = (pending['user_id'] <= last_user_id).to_numpy()
+        yield profiles, pending[in_chunk]
+        pending = pending[~in_chunk]
+
+class ResultWriter:
+    def __init__(self, path):
+        self.path = path
+        self.parquet_writer = None
+        self.rows_written = 0
+
+    def write(self, results):
+        if self.path.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(results, preserve_index=False)
+            if self.parquet_writer is None:
+                self.parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self.parquet_writer.write_table(table)
+        else:
+            results.to_csv(self.path, mode="w" if self.rows_written == 0 else "a", header=self.rows_written == 0, index=False)
+        self.rows_written += len(results)
+
+    def close(self):
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+
+# Reference data and parameters of the current process (the parent when scoring serially,
+# each pool worker otherwise); set once by init_scoring_worker rather than sent with every task
+_worker_reference = None
+
+def init_scoring_worker(hr_table, occupation_required_skills_df, scoring_params):
+    global _worker_reference
+    _worker_reference = (hr_table, occupation_required_skills_df, scoring_params)
+
+def score_chunk(profiles, skills):
+    hr_table, occupation_required_skills_df, scoring_params = _worker_reference
+    return score_profiles_batch(profiles, skills, hr_table, occupation_required_skills_df, **scoring_params)
+
+def iter_scored_chunks(aligned_chunks, hr_table, occupation_required_skills_df, scoring_params, workers=1):
+    # Yields (number of profiles, results) per chunk, in input order
+    if workers <= 1:
+        init_scoring_worker(hr_table, occupation_required_skills_df, scoring_params)
+        for profiles, skills in aligned_chunks:
+            yield len(profiles), score_chunk(profiles, skills)
+        return
+
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    mp_context = multiprocessing.get_context(start_method)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=init_scoring_worker,
+                             initargs=(hr_table, occupation_required_skills_df, scoring_params)) as executor:
+        # Bounded number of chunks in flight keeps memory flat while every worker stays busy
+        in_flight = deque()
+        for profiles, skills in aligned_chunks:
+            in_flight.append((len(profiles), executor.submit(score_chunk, profiles, skills)))
+            if len(in_flight) >= 2 * workers:
+                n_profiles, future = in_flight.popleft()
+                yield n_profiles, future.result()
+        while in_flight:
+            n_profiles, future = in_flight.popleft()
+            yield n_profiles, future.result()
+
+def load_reference_tables(occupations_path=None, required_skills_path=None):
+    # Given files replace the built-in synthetic tables
+    tables, _ = prepare_reference_data()
+    occupational_data_df = read_table(occupations_path) if occupations_path else tables['occupational_data_df']
+    occupation_required_skills_df = read_table(required_skills_path) if required_skills_path else tables['occupation_required_skills_df']
+    return occupational_data_df, occupation_required_skills_df
+
+def run_batch_scoring(profiles_path, output_path, skills_path=None, occupations_path=None, required_skills_path=None,
+                      occupations=None, chunk_size=50_000, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2,
+                      max_possible_match=100, workers=1, log=sys.stderr):
+    occupational_data_df, occupation_required_skills_df = load_reference_tables(occupations_path, required_skills_path)
+    hr_table = calculate_systematic_opportunity_table(occupational_data_df, lambda_val, gamma_val)
+    if occupations:
+        missing = sorted(set(occupations) - set(hr_table.index))
+        if missing:
+            raise ValueError(f"Unknown occupation(s): {', '.join(missing)}")
+        hr_table = hr_table.loc[list(occupations)]
+
+    skill_columns = ['user_id', 'skill_name', 'individual_skill_score']
+    profile_chunks = iter_columnar_chunks(profiles_path, chunk_size)
+    skill_chunks = iter_columnar_chunks(skills_path, chunk_size) if skills_path else iter(())
+
+    writer = ResultWriter(output_path)
+    n_profiles = 0
+    try:
+        aligned_chunks = iter_aligned_chunks(profile_chunks, skill_chunks, skill_columns)
+        scoring_params = {'max_possible_match': max_possible_match, 'alpha': alpha, 'beta': beta}
+        for chunk_profiles, results in iter_scored_chunks(aligned_chunks, hr_table, occupation_required_skills_df, scoring_params, workers):
+            writer.write(results)
+            n_profiles += chunk_profiles
+            if log is not None:
+                print(f"scored {n_profiles} profiles ({writer.rows_written} rows)", file=log)
+    finally:
+        writer.close()
+    return writer.rows_written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score individual profiles against occupations (AI-R) without the Streamlit UI.")
+    parser.add_argument("profiles", help="Profiles file (CSV/Parquet) or directory of Parquet parts, sorted by user_id")
+    parser.add_argument("--skills", help="Individual skills file or directory, sorted by user_id")
+    parser.add_argument("--occupations-file", help="Occupational data table (defaults to the built-in synthetic data)")
+    parser.add_argument("--required-skills-file", help="Occupation required skills table (defaults to the built-in synthetic data)")
+    parser.add_argument("--occupation", action="append", help="Occupation to score against; repeat for several (default: all)")
+    parser.add_argument("--output", required=True, help="Output file (.csv or .parquet), written incrementally")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Profiles per chunk")
+    parser.add_argument("--workers", type=int, default=1, help="Scoring processes (default: 1, serial)")
+    parser.add_argument("--alpha", type=float, default=0.6)
+    parser.add_argument("--beta", type=float, default=0.15)
+    parser.add_argument("--lambda", dest="lambda_val", type=float, default=0.3)
+    parser.add_argument("--gamma", dest="gamma_val", type=float, default=0.2)
+    parser.add_argument("--max-possible-match", type=float, default=100)
+    args = parser.parse_args(argv)
+
+    run_batch_scoring(
+        args.profiles, args.output, skills_path=args.skills, occupations_path=args.occupations_file,
+        required_skills_path=args.required_skills_file, occupations=args.occupation, chunk_size=args.chunk_size,
+        alpha=args.alpha, beta=args.beta, lambda_val=args.lambda_val, gamma_val=args.gamma_val,
+        max_possible_match=args.max_possible_match, workers=args.workers
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import numpy as np
+import pandas as pd
+from application_pages.utils import (
+    AI_READINESS_GRAPH_NODES,
+    calculate_ai_enhancement_potential,
+    calculate_job_growth_projection,
+    calculate_wage_premium,
+    calculate_entry_accessibility,
+    calculate_base_opportunity_score,
+    calculate_growth_multiplier,
+    calculate_regional_multiplier,
+    calculate_systematic_opportunity,
+    calculate_skills_match_score,
+    simulate_pathway_impact,
+    build_ai_readiness_graph,
+    generate_synthetic_data,
+    generate_synthetic_population,
+    generate_synthetic_reference_data,
+    calculate_idiosyncratic_readiness_batch,
+    calculate_systematic_opportunity_batch,
+    calculate_systematic_opportunity_table,
+    calculate_skills_match_matrix,
+    simulate_pathway_impact_batch,
+    score_profiles_batch,
+    render_chart
+)
+
+# Reproducible timings of the scoring hot paths, written as JSON and compared with a stored baseline.
+#
+# Covers every scalar formula in utils.py, calculate_skills_match_score as the number of skills grows,
+# the all-occupations match matrix as the catalog grows, the V^R and H^R pipelines and pathway
+# simulation (scalar loop versus batch function) over cohort sizes from 1 up to --max-size,
+# score_profiles_batch, the synthetic data generators and chart rendering (render_chart plus JSON
+# serialization) of that many points, and of bar charts over catalogs of up to 10k occupations. Inputs
+# are seeded synthetic data, so runs on the same machine time the same work. Each case reports the
+# median and minimum seconds per call over --repeat runs, each run looping enough calls to last at
+# least 0.2 s.
+#
+# Cold start is timed too, each run in a fresh interpreter: importing what app.py imports, and the
+# first render of app.py (Page 1, via Streamlit's AppTest). A first render slower than
+# --startup-budget seconds fails the run like a regression.
+#
+# With --baseline, a case whose median is more than --tolerance slower than the baseline (and slower
+# by at least --min-difference seconds, to ignore timer noise on microsecond calls) is a regression:
+# they are listed and the exit status is 1. Timings are machine specific; refresh the stored
+# baseline with --save-baseline after changing hardware or dependencies.
+#
+#   python benchmark.py --output benchmark_results.json --baseline benchmark_baseline.json
+#   python benchmark.py --save-baseline benchmark_baseline.json
+#   python benchmark.py --max-size 10000000 --match scalar --output full.json
+
+COHORT_SIZES = [1, 100, 10_000, 1_000_000, 10_000_000]
+SKILL_SIZES = [10, 100, 1_000, 10_000]
+OCCUPATION_SIZES = [10, 100, 1_000, 10_000]
+MATCH_MATRIX_USERS = 1_000
+STARTUP_CASES = {
+    'startup/import': "import streamlit, application_pages.utils",
+    'startup/first_render': "from streamlit.testing.v1 import AppTest\nAppTest.from_file('app.py', default_timeout=60).run()"
+}
+STARTUP_BUDGET_SECONDS = 1.5
+
+def scalar_vr_score(profile):
+    # The page 2 chain, one profile at a time
+    graph = build_ai_readiness_graph()
+    graph.update(profile)
+    return graph.get('vr_score')
+
+def scalar_hr_score(occupation, lambda_val=0.3, gamma=0.2):
+    # The page 3 chain, one occupation at a time
+    base_opportunity_score = calculate_base_opportunity_score(
+        calculate_ai_enhancement_potential(occupation['ai_enhancement_score']),
+        calculate_job_growth_projection(occupation['job_growth_rate_g']),
+        calculate_wage_premium(occupation['ai_skilled_wage'], occupation['median_wage']),
+        calculate_entry_accessibility(occupation['education_years_required'], occupation['experience_years_required']))
+    growth_multiplier = calculate_growth_multiplier(occupation['current_job_postings'], occupation['previous_job_postings'], lambda_val)
+    regional_multiplier = calculate_regional_multiplier(occupation['local_demand'], occupation['national_avg_demand'], occupation['remote_work_factor'], gamma)
+    return calculate_systematic_opportunity(base_opportunity_score, growth_multiplier, regional_multiplier) * 100
+
+def iter_scalar_formula_cases():
+    # Every scalar formula once, called with the values the default profile and occupation produce
+    profiles, occupations, pathways, required_skills, skills = generate_synthetic_data()
+    graph = build_ai_readiness_graph()
+    graph.update(profiles.iloc[0].to_dict())
+    graph.update({'hr_score': scalar_hr_score(occupations.iloc[0]), 'max_possible_match': 100, 'alpha': 0.6, 'beta': 0.15,
+                  'skills_match_score': calculate_skills_match_score(skills, required_skills[required_skills['occupation_name'] == occupations['occupation_name'].iloc[0]])})
+    for name, (function, inputs) in AI_READINESS_GRAPH_NODES.items():
+        if function.__name__ != '<lambda>':
+            args = [graph.get(input_name) for input_name in inputs]
+            yield f"scalar/{function.__name__}", 1, lambda function=function, args=args: function(*args)
+
+    occupation = occupations.iloc[0].to_dict()
+    yield "scalar/calculate_ai_enhancement_potential", 1, lambda: calculate_ai_enhancement_potential(occupation['ai_enhancement_score'])
+    yield "scalar/calculate_job_growth_projection", 1, lambda: calculate_job_growth_projection(occupation['job_growth_rate_g'])
+    yield "scalar/calculate_wage_premium", 1, lambda: calculate_wage_premium(occupation['ai_skilled_wage'], occupation['median_wage'])
+    yield "scalar/calculate_entry_accessibility", 1, lambda: calculate_entry_accessibility(occupation['education_years_required'], occupation['experience_years_required'])
+    yield "scalar/calculate_base_opportunity_score", 1, lambda: calculate_base_opportunity_score(0.8, 75, 0.33, 0.625)
+    yield "scalar/calculate_growth_multiplier", 1, lambda: calculate_growth_multiplier(occupation['current_job_postings'], occupation['previous_job_postings'])
+    yield "scalar/calculate_regional_multiplier", 1, lambda: calculate_regional_multiplier(occupation['local_demand'], occupation['national_avg_demand'], occupation['remote_work_factor'])
+    yield "scalar/calculate_systematic_opportunity", 1, lambda: calculate_systematic_opportunity(0.5, 1.07, 1.16)
+    pathway = pathways.iloc[0]
+    yield "scalar/simulate_pathway_impact", 1, lambda: simulate_pathway_impact(
+        0.7, 0.6, 0.8, pathway['pathway_type'], pathway['impact_ai_fluency'], pathway['impact_domain_expertise'], pathway['impact_adaptive_capacity'])
+    yield "generate_synthetic_data", 1, generate_synthetic_data
+
+def iter_skills_match_cases():
+    for n_skills in SKILL_SIZES:
+        rng = np.random.default_rng(n_skills)
+        skill_names = [f"Skill {i:05d}" for i in range(n_skills)]
+        user_skills = pd.DataFrame({'user_id': 1, 'skill_name': skill_names, 'individual_skill_score': rng.integers(0, 101, n_skills)})
+        required_skills = pd.DataFrame({'occupation_name': 'Occupation', 'skill_name': rng.permutation(skill_names)[:max(1, n_skills // 2)]})
+        required_skills['required_skill_score'] = rng.integers(50, 96, len(required_skills))
+        required_skills['skill_importance'] = rng.uniform(0.3, 1.0, len(required_skills))
+        yield "skills_match/scalar", n_skills, lambda user_skills=user_skills, required_skills=required_skills: calculate_skills_match_score(user_skills, required_skills)
+
+    # All occupations for MATCH_MATRIX_USERS users, growing catalog
+    for n_occupations in OCCUPATION_SIZES:
+        _, _, _, required_skills, skills = generate_synthetic_population(
+            MATCH_MATRIX_USERS, n_occupations=n_occupations, n_skills=1_000, skills_per_profile=20, skills_per_occupation=10)
+        yield "skills_match/matrix", n_occupations, lambda required_skills=required_skills, skills=skills: calculate_skills_match_matrix(skills, required_skills)
+
+def iter_cohort_cases(sizes, max_scalar_size):
+    for size in sizes:
+        yield "synthetic/generate_synthetic_population", size, lambda size=size: generate_synthetic_population(size)
+        profiles, occupations, pathways, required_skills, skills = generate_synthetic_population(size)
+        hr_table = calculate_systematic_opportunity_table(occupations)
+        impacts = pathways.loc[np.arange(size) % len(pathways), ['impact_ai_fluency', 'impact_domain_expertise', 'impact_adaptive_capacity']].to_numpy()
+        components = calculate_idiosyncratic_readiness_batch(profiles)
+
+        if size <= max_scalar_size:
+            profile_records = profiles.to_dict('records')
+            component_records = components[['ai_fluency', 'domain_expertise', 'adaptive_capacity']].to_numpy().tolist()
+            yield "vr/scalar", size, lambda records=profile_records: [scalar_vr_score(profile) for profile in records]
+            yield "pathway/scalar", size, lambda records=component_records, impacts=impacts.tolist(): [
+                simulate_pathway_impact(ai_fluency, domain_expertise, adaptive_capacity, None, *impact)
+                for (ai_fluency, domain_expertise, adaptive_capacity), impact in zip(records, impacts)]
+        yield "vr/batch", size, lambda profiles=profiles: calculate_idiosyncratic_readiness_batch(profiles)
+        yield "pathway/batch", size, lambda components=components, impacts=impacts: simulate_pathway_impact_batch(
+            components['ai_fluency'], components['domain_expertise'], components['adaptive_capacity'], impacts[:, 0], impacts[:, 1], impacts[:, 2])
+        yield "ai_r/score_profiles_batch", size, lambda profiles=profiles, skills=skills, hr_table=hr_table, required_skills=required_skills: score_profiles_batch(
+            profiles, skills, hr_table, required_skills)
+
+        # H^R at the same sizes, as a catalog of that many occupations
+        occupations, _, _ = generate_synthetic_reference_data(n_occupations=size, n_skills=10, skills_per_occupation=1)
+        if size <= max_scalar_size:
+            occupation_records = occupations.to_dict('records')
+            yield "hr/scalar", size, lambda records=occupation_records: [scalar_hr_score(occupation) for occupation in records]
+        yield "hr/batch", size, lambda occupations=occupations: calculate_systematic_opportunity_batch(occupations)
+
+def iter_chart_cases(sizes):
+    import plotly.io as pio
+
+    # Figure build plus JSON serialization (what st.plotly_chart sends), uncached
+    for size in sizes:
+        rng = np.random.default_rng(size)
+        points = pd.DataFrame({'user_id': np.arange(size), 'vr_score': rng.gamma(4, 250, size), 'ai_r_score': rng.gamma(3, 800, size)})
+        yield "chart/line", size, lambda points=points: pio.to_json(render_chart("line", points, cache=None, x="user_id", y=["vr_score", "ai_r_score"]), validate=False)
+        yield "chart/scatter", size, lambda points=points: pio.to_json(render_chart("scatter", points, cache=None, x="vr_score", y="ai_r_score"), validate=False)
+        yield "chart/histogram", size, lambda points=points: pio.to_json(render_chart("histogram", points['ai_r_score'].to_numpy(), cache=None), validate=False)
+        if size <= OCCUPATION_SIZES[-1]:
+            bars = points.assign(occupation_name="Occupation " + points['user_id'].astype(str))
+            yield "chart/bar", size, lambda bars=bars: pio.to_json(render_chart("bar", bars, cache=None, x="occupation_name", y="ai_r_score"), validate=False)
+
+def iter_benchmark_cases(max_size=1_000_000, max_scalar_size=10_000):
+    yield from iter_scalar_formula_cases()
+    yield from iter_skills_match_cases()
+    yield from iter_cohort_cases([size for size in COHORT_SIZES if size <= max_size], max_scalar_size)
+    yield from iter_chart_cases([size for size in COHORT_SIZES if size <= max_size])
+
+def time_case(function, repeat=5, min_time=0.2):
+    # Seconds per call: timeit's autorange picks the loop count, then `repeat` timed runs
+    timer = timeit.Timer(function)
+    loops = 1
+    while True:
+        elapsed = timer.timeit(loops)
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+    times = [elapsed / loops] + [run / loops for run in timer.repeat(repeat - 1, loops)] if repeat > 1 else [elapsed / loops]
+    return {'median_seconds': float(np.median(times)), 'min_seconds': float(min(times)), 'loops': loops, 'repeat': len(times)}
+
+def time_cold_start(code, repeat=5):
+    # Seconds for `code` in a new interpreter started from the repository root, timed inside it
+    script = f"import time\nstarted = time.perf_counter()\n{code}\nprint(time.perf_counter() - started)"
+    times = [float(subprocess.run([sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                  capture_output=True, text=True, check=True).stdout.split()[-1]) for _ in range(repeat)]
+    return {'median_seconds': float(np.median(times)), 'min_seconds': float(min(times)), 'loops': 1, 'repeat': repeat}
+
+def case_key(name, size):
+    return f"{name}[{size}]"
+
+def run_benchmarks(max_size=1_000_000, max_scalar_size=10_000, repeat=5, min_time=0.2, match=None, log=sys.stderr):
+    results = {}
+    for name, size, function in iter_benchmark_cases(max_size, max_scalar_size):
+        if match and not any(pattern in name for pattern in match):
+            continue
+        gc.collect()
+        result = time_case(function, repeat, min_time)
+        results[case_key(name, size)] = {'name': name, 'size': size, **result}
+        if log is not None:
+            print(f"{case_key(name, size):<48} {format_seconds(result['median_seconds']):>10}", file=log)
+    for name, code in STARTUP_CASES.items():
+        if match and not any(pattern in name for pattern in match):
+            continue
+        result = time_cold_start(code, repeat)
+        results[case_key(name, 1)] = {'name': name, 'size': 1, **result}
+        if log is not None:
+            print(f"{case_key(name, 1):<48} {format_seconds(result['median_seconds']):>10}", file=log)
+    return {
+        'metadata': {
+            'created': time.strftime("%Y-%m-%dT%H:%M:%S%z"), 'python': platform.python_version(), 'platform': platform.platform(),
+            'machine': platform.machine(), 'cpu_count': os.cpu_count(), 'numpy': np.__version__, 'pandas': pd.__version__
+        },
+        'results': results
+    }
+
+def format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+def compare_with_baseline(report, baseline, tolerance=0.3, min_difference=1e-6):
+    # Rows of (key, baseline seconds, current seconds, ratio, status) for cases in both runs
+    rows = []
+    for key, result in report['results'].items():
+        if key not in baseline['results']:
+            continue
+        baseline_seconds = baseline['results'][key]['median_seconds']
+        current_seconds = result['median_seconds']
+        ratio = current_seconds / baseline_seconds if baseline_seconds > 0 else float('inf')
+        regressed = ratio > 1 + tolerance and current_seconds - baseline_seconds > min_difference
+        improved = ratio < 1 / (1 + tolerance) and baseline_seconds - current_seconds > min_difference
+        rows.append((key, baseline_seconds, current_seconds, ratio, "REGRESSION" if regressed else "faster" if improved else "ok"))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the AI-R scoring hot paths and compare against a stored baseline.")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against; regressions exit with status 1")
+    parser.add_argument("--save-baseline", help="Write results to this JSON file as the new baseline")
+    parser.add_argument("--max-size", type=int, default=1_000_000, help="Largest cohort size (sizes: 1, 100, 10k, 1M, 10M)")
+    parser.add_argument("--max-scalar-size", type=int, default=10_000, help="Largest cohort timed with the scalar (one-by-one) paths")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per timed run")
+    parser.add_argument("--match", action="append", help="Only run cases whose name contains this text; repeat for several")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed slowdown relative to the baseline (0.3 = 30%%)")
+    parser.add_argument("--min-difference", type=float, default=1e-6, help="Slowdowns smaller than this many seconds are never regressions")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_SECONDS, help="Longest allowed first render of app.py, in seconds")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.max_size, args.max_scalar_size, args.repeat, args.min_time, args.match)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+
+    status = 0
+    first_render = report['results'].get(case_key('startup/first_render', 1))
+    if first_render is not None and first_render['median_seconds'] > args.startup_budget:
+        print(f"First render took {first_render['median_seconds']:.2f} s, over the {args.startup_budget:.2f} s start-up budget", file=sys.stderr)
+        status = 1
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare_with_baseline(report, baseline, args.tolerance, args.min_difference)
+        print(f"\n{'case':<48} {'baseline':>10} {'current':>10} {'ratio':>7}")
+        for key, baseline_seconds, current_seconds, ratio, row_status in rows:
+            print(f"{key:<48} {format_seconds(baseline_seconds):>10} {format_seconds(current_seconds):>10} {ratio:>7.2f}  {row_status}")
+        regressions = [row[0] for row in rows if row[4] == "REGRESSION"]
+        if regressions:
+            print(f"\n{len(regressions)} benchmark regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions beyond {args.tolerance:.0%} in {len(rows)} compared case(s).")
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+import argparse
+import os
+import time
+from application_pages.utils import write_startup_snapshot
+
+# Precomputes the reference tables and their data version for app start-up (see load_startup_snapshot).
+#
+# Run it wherever the app is deployed, after the code and data are in place (the Dockerfile does this at
+# image build time). The app uses the snapshot only while it matches: changing utils.py or any table
+# file in the data directory makes it stale, and the app then loads the tables as before.
+#
+#   python build_startup_snapshot.py
+#   python build_startup_snapshot.py --data-dir /data/qulab --output /data/qulab_snapshot
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a start-up snapshot of the reference tables for the Streamlit app.")
+    parser.add_argument("--data-dir", default=os.environ.get("QULAB_DATA_DIR"), help="Directory of reference tables (defaults to QULAB_DATA_DIR, then the built-in synthetic data)")
+    parser.add_argument("--output", default=os.environ.get("QULAB_SNAPSHOT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_snapshot")),
+                        help="Snapshot directory (defaults to QULAB_SNAPSHOT_DIR, then startup_snapshot/ next to app.py)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    data_version = write_startup_snapshot(args.output, args.data_dir)
+    print(f"wrote {args.output} (data version {data_version[:12]}) in {time.perf_counter() - started:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from application_pages.utils import (
+    PATHWAY_IMPACT_COLUMNS,
+    generate_synthetic_data,
+    prepare_reference_data,
+    calculate_systematic_opportunity_table,
+    build_occupation_skill_index,
+    build_user_skill_matrix,
+    calculate_skills_match_pairs,
+    calculate_idiosyncratic_readiness_batch,
+    calculate_idiosyncratic_readiness,
+    calculate_ai_readiness_batch,
+    calculate_synergy_percentage,
+    calculate_ai_readiness_score,
+    simulate_pathway_impact_batch
+)
+
+# Local HTTP scoring service for other systems that need AI-R scores without the Streamlit UI.
+#
+#   POST /score     {"profile": {...}, "skills": [{"skill_name": ..., "individual_skill_score": ...}],
+#                    "occupation": "Data Scientist", "alpha": 0.6, "beta": 0.15}
+#   POST /simulate  the same plus "pathway", "completion_score" and "mastery_score"
+#   GET  /stats     request counts, batch sizes, queue depth and latency percentiles
+#   GET  /health
+#
+# Requests are validated as they arrive and queued. A single worker drains the queue in
+# micro-batches (up to --max-batch-size requests, waiting at most --max-wait-ms for a batch
+# to fill) and scores each batch with the vectorized utils.py functions on a worker thread,
+# so the event loop keeps accepting requests meanwhile. At most --max-queue requests wait
+# at any time; beyond that new requests are rejected with 503 instead of queueing without
+# bound. Reference tables come from --data-dir / QULAB_DATA_DIR (see prepare_reference_data)
+# or the built-in synthetic data; lambda, gamma and the max possible match are fixed at start.
+#
+#   python score_service.py --port 8600 --max-batch-size 256 --max-wait-ms 2
+
+PROFILE_FIELDS = [column for column in generate_synthetic_data()[0].columns if column != 'user_id']
+MAX_BODY_BYTES = 1 << 20
+HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+class RequestError(ValueError):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+def _number(payload, name, default=None):
+    value = payload.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RequestError(f"'{name}' must be a number")
+    # json.loads accepts NaN and Infinity, which would propagate through every score, and integers
+    # too large for a float
+    try:
+        value = float(value)
+    except OverflowError:
+        raise RequestError(f"'{name}' must be a finite number") from None
+    if not math.isfinite(value):
+        raise RequestError(f"'{name}' must be a finite number")
+    return value
+
+class ScoringModel:
+    # Reference data prepared once at start-up, plus the vectorized batch scorer
+    def __init__(self, tables, lambda_val=0.3, gamma_val=0.2, max_possible_match=100, alpha=0.6, beta=0.15):
+        self.hr_table = calculate_systematic_opportunity_table(tables['occupational_data_df'], lambda_val, gamma_val)
+        self.skill_index = build_occupation_skill_index(tables['occupation_required_skills_df'], self.hr_table.index)
+        self.pathways = tables['learning_pathways_df'].drop_duplicates('pathway_name', keep='last').set_index('pathway_name')
+        self.max_possible_match = max_possible_match
+        self.alpha = alpha
+        self.beta = beta
+
+    def parse(self, kind, payload):
+        # Validates one request body; errors surface as 400 before the request is queued
+        if not isinstance(payload, dict):
+            raise RequestError("Request body must be a JSON object")
+        profile = payload.get('profile')
+        if not isinstance(profile, dict):
+            raise RequestError("'profile' must be an object")
+        missing = [field for field in PROFILE_FIELDS if field not in profile]
+        if missing:
+            raise RequestError(f"Profile is missing: {', '.join(missing)}")
+        parsed_profile = {field: _number(profile, field) for field in PROFILE_FIELDS if field != 'education_level'}
+        parsed_profile['education_level'] = str(profile['education_level'])
+
+        skills = payload.get('skills', [])
+        if not isinstance(skills, list) or not all(isinstance(skill, dict) and 'skill_name' in skill for skill in skills):
+            raise RequestError("'skills' must be a list of {skill_name, individual_skill_score} objects")
+        occupation = payload.get('occupation')
+        if occupation not in self.hr_table.index:
+            raise RequestError(f"Unknown occupation: {occupation}")
+
+        request = {
+            'profile': parsed_profile,
+            'skill_names': [str(skill['skill_name']) for skill in skills],
+            'skill_scores': [_number(skill, 'individual_skill_score') for skill in skills],
+            'occupation_code': self.hr_table.index.get_loc(occupation),
+            'alpha': _number(payload, 'alpha', self.alpha),
+            'beta': _number(payload, 'beta', self.beta),
+            'pathway_impacts': None
+        }
+        if kind == 'simulate':
+            pathway = payload.get('pathway')
+            if pathway not in self.pathways.index:
+                raise RequestError(f"Unknown pathway: {pathway}")
+            request['pathway_impacts'] = self.pathways.loc[pathway, PATHWAY_IMPACT_COLUMNS].to_numpy(dtype=float)
+            request['completion_score'] = _number(payload, 'completion_score', 1.0)
+            request['mastery_score'] = _number(payload, 'mastery_score', 1.0)
+        return request
+
+    def score(self, requests):
+        # One vectorized pass over a micro-batch; returns one result dict per request
+        n = len(requests)
+        profiles = pd.DataFrame([request['profile'] for request in requests])
+        components = calculate_idiosyncratic_readiness_batch(profiles)
+        vr_score = components['vr_score'].to_numpy()
+
+        skill_counts = [len(request['skill_names']) for request in requests]
+        skills = pd.DataFrame({
+            'user_id': np.repeat(np.arange(n), skill_counts),
+            'skill_name': [name for request in requests for name in request['skill_names']],
+            'individual_skill_score': np.array([score for request in requests for score in request['skill_scores']], dtype=float)
+        })
+        users, user_skill_matrix = build_user_skill_matrix(skills, self.skill_index['skills'])
+        row_requests = users.to_numpy(dtype=int)
+        occupation_codes = np.array([request['occupation_code'] for request in requests])
+        # A request with repeated skills has several matrix rows whose matches add up; requests without skills score 0
+        row_match = calculate_skills_match_pairs(user_skill_matrix, self.skill_index, np.arange(len(users)), occupation_codes[row_requests])
+        skills_match_score = np.bincount(row_requests, weights=row_match, minlength=n)
+
+        hr_score = self.hr_table['hr_score'].to_numpy()[occupation_codes]
+        alpha = np.array([request['alpha'] for request in requests])
+        beta = np.array([request['beta'] for request in requests])
+        scores = calculate_ai_readiness_batch(vr_score, hr_score, skills_match_score, profiles['years_experience'], self.max_possible_match, alpha, beta)
+        results = [{
+            'vr_score': float(vr_score[i]), 'hr_score': float(hr_score[i]), 'skills_match_score': float(skills_match_score[i]),
+            'alignment_factor': float(scores['alignment_factor'][i]), 'synergy_percentage': float(scores['synergy_percentage'][i]),
+            'ai_r_score': float(scores['ai_r_score'][i])
+        } for i in range(n)]
+
+        simulated = [i for i, request in enumerate(requests) if request['pathway_impacts'] is not None]
+        if simulated:
+            impacts = np.array([requests[i]['pathway_impacts'] for i in simulated])
+            ai_fluency, domain_expertise, adaptive_capacity = simulate_pathway_impact_batch(
+                components['ai_fluency'].to_numpy()[simulated], components['domain_expertise'].to_numpy()[simulated],
+                components['adaptive_capacity'].to_numpy()[simulated], impacts[:, 0], impacts[:, 1], impacts[:, 2],
+                np.array([requests[i]['completion_score'] for i in simulated]), np.array([requests[i]['mastery_score'] for i in simulated]))
+            vr_score_new = calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity) * 100
+            synergy_percentage_new = calculate_synergy_percentage(vr_score_new, hr_score[simulated], scores['alignment_factor'][simulated])
+            ai_r_score_new = calculate_ai_readiness_score(vr_score_new, hr_score[simulated], synergy_percentage_new, alpha[simulated], beta[simulated])
+            for position, i in enumerate(simulated):
+                results[i].update({
+                    'vr_score_new': float(vr_score_new[position]), 'synergy_percentage_new': float(synergy_percentage_new[position]),
+                    'ai_r_score_new': float(ai_r_score_new[position])
+                })
+        return results
+
+class LatencyStats:
+    # Request latencies over a sliding window of the most recent requests
+    def __init__(self, window=10_000):
+        self.latencies = deque(maxlen=window)
+        self.batch_sizes = deque(maxlen=window)
+        self.requests = 0
+        self.rejected = 0
+        self.errors = 0
+        self.batches = 0
+
+    def summary(self):
+        latencies_ms = np.array(self.latencies) * 1000
+        percentiles = np.percentile(latencies_ms, [50, 90, 99]) if len(latencies_ms) else np.zeros(3)
+        return {
+            'requests': self.requests, 'rejected': self.rejected, 'errors': self.errors, 'batches': self.batches,
+            'mean_batch_size': float(np.mean(self.batch_sizes)) if self.batch_sizes else 0.0,
+            'latency_ms': {
+                'p50': float(percentiles[0]), 'p90': float(percentiles[1]), 'p99': float(percentiles[2]),
+                'max': float(latencies_ms.max()) if len(latencies_ms) else 0.0
+            }
+        }
+
+class MicroBatcher:
+    def __init__(self, score_batch, max_batch_size=256, max_wait_ms=2.0, max_queue=4096, stats=None):
+        self.score_batch = score_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.queue = asyncio.Queue(max_queue)
+        self.stats = stats if stats is not None else LatencyStats()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    async def submit(self, request):
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((request, future))
+        except asyncio.QueueFull:
+            self.stats.rejected += 1
+            raise RequestError("Scoring queue is full, retry later", status=503)
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+            self.stats.batches += 1
+            self.stats.batch_sizes.append(len(batch))
+            try:
+                results = await loop.run_in_executor(self.executor, self.score_batch, [request for request, _ in batch])
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+class ScoringService:
+    def __init__(self, model, max_batch_size=256, max_wait_ms=2.0, max_queue=4096):
+        self.model = model
+        self.stats = LatencyStats()
+        self.batcher = MicroBatcher(model.score, max_batch_size, max_wait_ms, max_queue, self.stats)
+
+    async def dispatch(self, method, path, body):
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if path == '/stats':
+            return 200, {**self.stats.summary(), 'queue_depth': self.batcher.queue.qsize()}
+        if path not in ('/score', '/simulate'):
+            return 404, {'error': f"Unknown path: {path}"}
+        if method != 'POST':
+            return 405, {'error': "Use POST"}
+
+        started = time.perf_counter()
+        self.stats.requests += 1
+        try:
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                raise RequestError("Request body is not valid JSON")
+            result = await self.batcher.submit(self.model.parse(path[1:], payload))
+        except RequestError as error:
+            self.stats.errors += error.status != 503
+            return error.status, {'error': str(error)}
+        except Exception as error:
+            self.stats.errors += 1
+            return 500, {'error': str(error)}
+        self.stats.latencies.append(time.perf_counter() - started)
+        return 200, result
+
+    async def handle_connection(self, reader, writer):
+        # Minimal HTTP/1.1 with keep-alive: one JSON request and response at a time per connection
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                content_length = int(headers.get('content-length', 0))
+                if content_length > MAX_BODY_BYTES:
+                    status, response = 413, {'error': "Request body too large"}
+                    headers['connection'] = 'close'
+                else:
+                    body = await reader.readexactly(content_length)
+                    status, response = await self.dispatch(method, path.split('?')[0], body)
+
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                data = json.dumps(response).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8600, ready=None):
+        batch_worker = asyncio.create_task(self.batcher.run())
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=1024)
+        if ready is not None:
+            ready(server)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batch_worker.cancel()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve AI-R scores over local HTTP with micro-batched, vectorized scoring.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--data-dir", default=os.environ.get("QULAB_DATA_DIR"), help="Directory of reference tables (defaults to QULAB_DATA_DIR, then the built-in synthetic data)")
+    parser.add_argument("--max-batch-size", type=int, default=256, help="Most requests scored in one vectorized call")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="Longest wait for a micro-batch to fill")
+    parser.add_argument("--max-queue", type=int, default=4096, help="Requests allowed to wait; more are rejected with 503")
+    parser.add_argument("--alpha", type=float, default=0.6, help="Default alpha when a request does not set one")
+    parser.add_argument("--beta", type=float, default=0.15, help="Default beta when a request does not set one")
+    parser.add_argument("--lambda", dest="lambda_val", type=float, default=0.3)
+    parser.add_argument("--gamma", dest="gamma_val", type=float, default=0.2)
+    parser.add_argument("--max-possible-match", type=float, default=100)
+    args = parser.parse_args(argv)
+
+    tables, _ = prepare_reference_data(args.data_dir)
+    model = ScoringModel(tables, args.lambda_val, args.gamma_val, args.max_possible_match, args.alpha, args.beta)
+    service = ScoringService(model, args.max_batch_size, args.max_wait_ms, args.max_queue)
+    print(f"Serving AI-R scores on http://{args.host}:{args.port}")
+    asyncio.run(service.serve(args.host, args.port))
+
+if __name__ == "__main__":
+    main()
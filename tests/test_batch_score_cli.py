@@ -0,0 +1,23 @@
+import pytest
+import batch_score
+from application_pages.utils import write_synthetic_population
+
+@pytest.fixture(scope="module")
+def population_dir(tmp_path_factory):
+    output_dir = tmp_path_factory.mktemp("population")
+    write_synthetic_population(str(output_dir), 3_000, n_occupations=8, n_skills=40, chunk_size=1_000)
+    return output_dir
+
+def run_cli(population_dir, output_path, *args):
+    batch_score.main([str(population_dir / "individual_profiles"), "--skills", str(population_dir / "individual_skills"),
+                      "--occupations-file", str(population_dir / "occupational_data.parquet"),
+                      "--required-skills-file", str(population_dir / "occupation_required_skills.parquet"),
+                      "--output", str(output_path), "--chunk-size", "700", *args])
+    return output_path.read_bytes()
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_workers_output_matches_serial(population_dir, tmp_path, suffix):
+    serial = run_cli(population_dir, tmp_path / f"serial{suffix}")
+    parallel = run_cli(population_dir, tmp_path / f"parallel{suffix}", "--workers", "2")
+    assert len(serial) > 0
+    assert parallel == serial
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+from application_pages.utils import (
+    calculate_technical_ai_skills,
+    calculate_ai_augmented_productivity,
+    calculate_critical_ai_judgment,
+    calculate_ai_learning_velocity,
+    calculate_ai_fluency,
+    calculate_education_foundation,
+    calculate_practical_experience,
+    calculate_specialization_depth,
+    calculate_domain_expertise,
+    calculate_adaptive_capacity,
+    calculate_idiosyncratic_readiness,
+    calculate_ai_enhancement_potential,
+    calculate_job_growth_projection,
+    calculate_wage_premium,
+    calculate_entry_accessibility,
+    calculate_base_opportunity_score,
+    calculate_growth_multiplier,
+    calculate_regional_multiplier,
+    calculate_systematic_opportunity,
+    calculate_skills_match_score,
+    calculate_timing_factor,
+    calculate_alignment_factor,
+    calculate_synergy_percentage,
+    calculate_ai_readiness_score,
+    calculate_idiosyncratic_readiness_batch,
+    calculate_systematic_opportunity_table,
+    calculate_skills_match_matrix,
+    generate_synthetic_population,
+    score_profiles_batch
+)
+
+# The batch (array) formulas against the scalar ones, element for element
+
+def scalar_vr_score(profile):
+    ai_fluency = calculate_ai_fluency(
+        calculate_technical_ai_skills(profile['prompting_score'], profile['tools_score'], profile['understanding_score'], profile['datalit_score']),
+        calculate_ai_augmented_productivity(profile['output_quality_with_ai'], profile['output_quality_without_ai'], profile['time_without_ai'], profile['time_with_ai']),
+        calculate_critical_ai_judgment(profile['errors_caught'], profile['total_ai_errors'], profile['appropriate_trust_decisions'], profile['total_decisions']),
+        calculate_ai_learning_velocity(profile['delta_proficiency'], profile['delta_t_hours_invested']))
+    domain_expertise = calculate_domain_expertise(
+        calculate_education_foundation(profile['education_level']),
+        calculate_practical_experience(profile['years_experience']),
+        calculate_specialization_depth(profile['portfolio_score'], profile['recognition_score'], profile['credentials_score']))
+    adaptive_capacity = calculate_adaptive_capacity(profile['cognitive_flexibility'], profile['social_emotional_intelligence'], profile['strategic_career_management'])
+    return calculate_idiosyncratic_readiness(ai_fluency, domain_expertise, adaptive_capacity) * 100
+
+def scalar_hr_score(occupation):
+    base_opportunity_score = calculate_base_opportunity_score(
+        calculate_ai_enhancement_potential(occupation['ai_enhancement_score']),
+        calculate_job_growth_projection(occupation['job_growth_rate_g']),
+        calculate_wage_premium(occupation['ai_skilled_wage'], occupation['median_wage']),
+        calculate_entry_accessibility(occupation['education_years_required'], occupation['experience_years_required']))
+    growth_multiplier = calculate_growth_multiplier(occupation['current_job_postings'], occupation['previous_job_postings'])
+    regional_multiplier = calculate_regional_multiplier(occupation['local_demand'], occupation['national_avg_demand'], occupation['remote_work_factor'])
+    return calculate_systematic_opportunity(base_opportunity_score, growth_multiplier, regional_multiplier) * 100
+
+@pytest.fixture(scope="module")
+def population():
+    profiles, occupations, _, required_skills, skills = generate_synthetic_population(200, n_occupations=12, n_skills=40)
+    # Rows hitting every division guard of the scalar formulas
+    profiles.loc[0, ['time_with_ai', 'total_ai_errors', 'total_decisions', 'delta_t_hours_invested', 'years_experience']] = 0
+    profiles.loc[1, 'education_level'] = "Other"
+    occupations.loc[0, ['median_wage', 'previous_job_postings']] = 0
+    return profiles, occupations, required_skills, skills
+
+def test_vr_batch_matches_scalar(population):
+    profiles, _, _, _ = population
+    expected = [scalar_vr_score(profile) for profile in profiles.to_dict('records')]
+    np.testing.assert_allclose(calculate_idiosyncratic_readiness_batch(profiles)['vr_score'].to_numpy(), expected, rtol=1e-12)
+
+def test_hr_batch_matches_scalar(population):
+    _, occupations, _, _ = population
+    expected = [scalar_hr_score(occupation) for occupation in occupations.to_dict('records')]
+    np.testing.assert_allclose(calculate_systematic_opportunity_table(occupations)['hr_score'].to_numpy(), expected, rtol=1e-12)
+
+def test_skills_match_matrix_matches_scalar(population):
+    _, occupations, required_skills, skills = population
+    match = calculate_skills_match_matrix(skills, required_skills, occupations['occupation_name'])
+    for user_id, user_skills in skills.groupby('user_id'):
+        for occupation_name, occupation_skills in required_skills.groupby('occupation_name'):
+            assert match.loc[user_id, occupation_name] == pytest.approx(calculate_skills_match_score(user_skills, occupation_skills), rel=1e-12)
+
+def test_ai_r_batch_matches_scalar(population):
+    profiles, occupations, required_skills, skills = population
+    scored = score_profiles_batch(profiles, skills, calculate_systematic_opportunity_table(occupations), required_skills, alpha=0.6, beta=0.15)
+    occupation_records = occupations.set_index('occupation_name', drop=False)
+    for row in scored.sample(300, random_state=0).itertuples(index=False):
+        profile = profiles[profiles['user_id'] == row.user_id].iloc[0]
+        vr_score = scalar_vr_score(profile)
+        hr_score = scalar_hr_score(occupation_records.loc[row.occupation_name])
+        skills_match_score = calculate_skills_match_score(skills[skills['user_id'] == row.user_id], required_skills[required_skills['occupation_name'] == row.occupation_name])
+        alignment_factor = calculate_alignment_factor(skills_match_score, 100, calculate_timing_factor(profile['years_experience']))
+        synergy_percentage = calculate_synergy_percentage(vr_score, hr_score, alignment_factor)
+        assert row.skills_match_score == pytest.approx(skills_match_score, rel=1e-12)
+        assert row.synergy_percentage == pytest.approx(synergy_percentage, rel=1e-12)
+        assert row.ai_r_score == pytest.approx(calculate_ai_readiness_score(vr_score, hr_score, synergy_percentage, 0.6, 0.15), rel=1e-12)
+
+def test_ai_r_batch_users_without_skills(population):
+    profiles, occupations, required_skills, skills = population
+    scored = score_profiles_batch(profiles.head(3), skills.iloc[:0], calculate_systematic_opportunity_table(occupations), required_skills)
+    assert (scored['skills_match_score'] == 0).all()
+    assert (scored['synergy_percentage'] == 0).all()
+    assert len(scored) == 3 * len(occupations)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+from application_pages.utils import (
+    GroupedSums,
+    QuantileSketch,
+    StreamingHistogram,
+    calculate_systematic_opportunity_table,
+    generate_synthetic_population,
+    iter_synthetic_cohort_scores,
+    summarize_scored_results
+)
+
+@pytest.fixture(scope="module")
+def values():
+    rng = np.random.default_rng(0)
+    return np.r_[rng.lognormal(3, 1, 20_000), -rng.lognormal(1, 2, 5_000), np.zeros(500), rng.uniform(-1e-3, 1e-3, 500)]
+
+def chunks(values, n_chunks=7):
+    return np.array_split(np.random.default_rng(1).permutation(values), n_chunks)
+
+@pytest.mark.parametrize("relative_accuracy", [0.01, 0.05])
+def test_sketch_quantiles_are_within_the_relative_accuracy(values, relative_accuracy):
+    sketch = QuantileSketch(relative_accuracy)
+    for chunk in chunks(values):
+        sketch.update(chunk)
+    assert sketch.count == len(values)
+    q = np.linspace(0, 1, 101)
+    exact = np.quantile(values, q, method='lower')
+    assert np.all(np.abs(sketch.quantile(q) - exact) <= relative_accuracy * np.abs(exact) + 1e-9)
+    for value in np.quantile(values, [0.5, 0.9]):
+        # The rank counts whole buckets, so it lies between the exact ranks of the bucket's edges
+        low, high = value / (1 + 2 * relative_accuracy), value * (1 + 2 * relative_accuracy)
+        assert np.mean(values <= low) <= sketch.rank(value) <= np.mean(values <= high)
+
+def test_histogram_counts_are_exact_after_range_growth(values):
+    histogram = StreamingHistogram(n_bins=32)
+    # Sorted chunks widen the range on every update
+    for chunk in np.array_split(np.sort(values), 7):
+        histogram.update(np.r_[chunk, np.nan])
+    assert histogram.counts.sum() == len(values)
+    np.testing.assert_array_equal(histogram.counts, np.histogram(values, bins=histogram.edges())[0])
+
+def test_grouped_sums_equal_a_groupby_mean():
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({'key': rng.choice(list("abcdefg"), 5_000), 'x': rng.normal(size=5_000), 'y': rng.uniform(size=5_000)})
+    sums = GroupedSums(['x', 'y'])
+    for start in range(0, len(df), 700):
+        chunk = df.iloc[start:start + 700]
+        sums.update(chunk['key'], chunk)
+    means = sums.means().sort_index()
+    expected = df.groupby('key').agg(count=('x', 'size'), x=('x', 'mean'), y=('y', 'mean'))
+    np.testing.assert_array_equal(means['count'], expected['count'])
+    np.testing.assert_allclose(means[['x', 'y']], expected[['x', 'y']])
+
+def test_chunked_summary_equals_the_whole_scored_cohort():
+    _, occupations, _, required_skills, _ = generate_synthetic_population(1, n_occupations=5)
+    hr_table = calculate_systematic_opportunity_table(occupations)
+    scored_chunks = list(iter_synthetic_cohort_scores(3_000, hr_table, required_skills, chunk_size=700))
+    scored = pd.concat(scored_chunks, ignore_index=True)
+    aggregates = summarize_scored_results(scored_chunks)
+    assert aggregates.rows == len(scored)
+    assert aggregates.users == scored['user_id'].nunique() == 3_000
+    by_occupation = aggregates.by_occupation.means()
+    np.testing.assert_allclose(by_occupation.loc[hr_table.index, 'ai_r_score'], scored.groupby('occupation_name')['ai_r_score'].mean()[hr_table.index])
+    np.testing.assert_allclose(by_occupation.loc[hr_table.index, 'skill_gap'], 100 - scored.groupby('occupation_name')['skills_match_score'].mean()[hr_table.index])
+    p50 = aggregates.percentiles((50,))['p50']
+    exact = scored[p50.index].quantile(0.5, interpolation='lower')
+    assert np.all(np.abs(p50 - exact) <= 0.01 * np.abs(exact) + 1e-9)
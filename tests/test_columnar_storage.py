@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+import pytest
+from application_pages.utils import compact_table, generate_synthetic_population, read_columnar_table, write_columnar_table
+
+def test_npy_round_trip_keeps_missing_values_and_dtypes(tmp_path):
+    df = pd.DataFrame({
+        'score': [0.5, np.nan, 1.0],
+        'count': np.array([1, 2, 3], dtype=np.uint16),
+        'name': pd.Series(['a', None, 'c'], dtype='str'),
+        'label': pd.Series(['x', None, 'z'], dtype=object),
+        'level': pd.Categorical(['low', None, 'high'], categories=['low', 'high'], ordered=True),
+        'group': pd.Categorical([10, 20, None]),
+        'flag': pd.array([True, None, False], dtype='boolean'),
+        'hours': pd.array([1, None, 3], dtype='Int64')
+    })
+    write_columnar_table(df, str(tmp_path / "table"))
+    # Copies turn the memory-mapped columns into plain arrays for the comparison
+    pd.testing.assert_frame_equal(read_columnar_table(str(tmp_path / "table")).copy(), df)
+    pd.testing.assert_frame_equal(read_columnar_table(str(tmp_path / "table"), ['level', 'hours']).copy(), df[['level', 'hours']])
+
+def test_npy_round_trip_of_a_compacted_table(tmp_path):
+    profiles = compact_table(generate_synthetic_population(500)[0])
+    profiles.loc[3, 'education_level'] = None
+    write_columnar_table(profiles, str(tmp_path / "profiles"))
+    pd.testing.assert_frame_equal(read_columnar_table(str(tmp_path / "profiles")).copy(), profiles)
+
+def test_npy_table_rejects_columns_it_cannot_store(tmp_path):
+    with pytest.raises(TypeError, match="non-string"):
+        write_columnar_table(pd.DataFrame({'mixed': ['a', 1]}), str(tmp_path / "mixed"))
+    with pytest.raises(TypeError, match="dtype"):
+        write_columnar_table(pd.DataFrame({'when': pd.date_range('2026-01-01', periods=2, tz='UTC')}), str(tmp_path / "tz"))
+    assert not (tmp_path / "mixed").exists()
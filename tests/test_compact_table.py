@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+from application_pages.utils import (
+    EDUCATION_LEVEL_DTYPE,
+    build_occupation_skill_index,
+    calculate_idiosyncratic_readiness_batch,
+    calculate_skills_match_matrix,
+    compact_table,
+    generate_synthetic_population
+)
+
+def test_columns_take_the_compact_dtypes():
+    profiles = compact_table(generate_synthetic_population(200)[0])
+    assert profiles['education_level'].dtype == EDUCATION_LEVEL_DTYPE
+    assert profiles['cognitive_flexibility'].dtype == np.uint8
+    assert profiles['errors_caught'].dtype == np.uint16
+    assert profiles['prompting_score'].dtype == np.float32
+
+def test_integers_that_do_not_fit_fall_back_to_float32():
+    df = pd.DataFrame({'fractional': [1.5, 2.0], 'negative': [-1, 2], 'too_large': [10, 300], 'missing': [1, None], 'fits': [0, 255]})
+    compacted = compact_table(df, {column: np.uint8 for column in df.columns})
+    assert compacted['fits'].dtype == np.uint8
+    for column in ['fractional', 'negative', 'too_large', 'missing']:
+        assert compacted[column].dtype == np.float32
+        np.testing.assert_array_equal(compacted[column].to_numpy(), df[column].to_numpy(dtype=np.float32))
+
+def test_unknown_education_levels_become_missing_and_score_zero():
+    profiles = generate_synthetic_population(3)[0].assign(education_level=["Master's", "Apprenticeship", None])
+    compacted = compact_table(profiles)
+    assert compacted['education_level'].isna().tolist() == [False, True, True]
+    np.testing.assert_allclose(calculate_idiosyncratic_readiness_batch(compacted)['education_foundation'],
+                               calculate_idiosyncratic_readiness_batch(profiles)['education_foundation'])
+
+def test_scores_match_the_uncompacted_tables_and_memory_shrinks():
+    profiles, occupations, _, required_skills, skills = generate_synthetic_population(2_000)
+    compact_profiles, compact_skills = compact_table(profiles), compact_table(skills)
+    assert compact_profiles.memory_usage(deep=True).sum() < profiles.memory_usage(deep=True).sum() / 2
+    # float32 keeps about 7 significant digits of the inputs; the formulas compute in float64
+    pd.testing.assert_frame_equal(calculate_idiosyncratic_readiness_batch(compact_profiles), calculate_idiosyncratic_readiness_batch(profiles), rtol=1e-5)
+    skill_index = build_occupation_skill_index(required_skills, occupations['occupation_name'])
+    pd.testing.assert_frame_equal(calculate_skills_match_matrix(compact_skills, required_skills, skill_index=skill_index),
+                                  calculate_skills_match_matrix(skills, required_skills, skill_index=skill_index))
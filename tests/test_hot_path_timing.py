@@ -0,0 +1,77 @@
+import threading
+from application_pages import utils
+from application_pages.utils import (
+    SCALAR_FORMULA_NAMES,
+    VR_COMPONENT_NAMES,
+    HotPathTimer,
+    ScoreCache,
+    build_ai_readiness_graph,
+    calculate_timing_factor_batch,
+    generate_synthetic_data,
+    score_profile
+)
+
+def test_inactive_timer_records_nothing():
+    timer = HotPathTimer()
+    calculate_timing_factor_batch(5)
+    with timer.section("section"):
+        calculate_timing_factor_batch(5)
+    with timer.activate(enabled=False):
+        calculate_timing_factor_batch(5)
+    assert timer.stats == {}
+
+def test_active_timer_records_calls_and_sections():
+    timer = HotPathTimer()
+    with timer.activate():
+        with timer.section("section"):
+            calculate_timing_factor_batch(5)
+            calculate_timing_factor_batch(0)
+    assert timer.stats['calculate_timing_factor_batch'][0] == 2
+    assert timer.stats['section'][0] == 1
+
+def test_scalar_formulas_are_timed_through_their_callers():
+    profiles, occupations, _, required_skills, skills = generate_synthetic_data()
+    timer = HotPathTimer()
+    with timer.activate():
+        score_profile(profiles.iloc[0].to_dict(), skills, occupations.iloc[0], required_skills)
+    assert timer.stats['score_profile'][0] == 1
+    assert timer.stats['calculate_skills_match_score'][0] == 1
+    assert not SCALAR_FORMULA_NAMES & set(timer.stats)
+    assert not any(hasattr(getattr(utils, name), '__wrapped__') for name in SCALAR_FORMULA_NAMES)
+
+def test_class_methods_are_timed():
+    profiles = generate_synthetic_data()[0]
+    graph, cache = build_ai_readiness_graph(), ScoreCache()
+    timer = HotPathTimer()
+    with timer.activate():
+        # Page 2's V^R components
+        graph.update(profiles.iloc[0].to_dict())
+        graph.evaluate(VR_COMPONENT_NAMES)
+        graph.get('vr_score')
+        cache.get_or_compute('key', lambda: 1)
+    assert timer.stats['ScoreGraph.update'][0] == 1
+    assert timer.stats['ScoreGraph.evaluate'][0] == 1
+    # Lookups of a node's inputs are part of the get() that needed them
+    assert timer.stats['ScoreGraph.get'][0] == 1
+    assert timer.stats['ScoreCache.get_or_compute'][0] == 1
+    assert timer.stats['ScoreCache.get'][0] == timer.stats['ScoreCache.put'][0] == 1
+    assert not any(name.startswith('HotPathTimer.') for name in timer.stats)
+
+def test_timers_are_isolated_between_threads():
+    # Two sessions' scripts run on different threads, each with its own timer
+    timers = [HotPathTimer(), HotPathTimer()]
+    barrier = threading.Barrier(2)
+
+    def run_session(timer, calls):
+        with timer.activate():
+            barrier.wait()
+            for _ in range(calls):
+                calculate_timing_factor_batch(5)
+            barrier.wait()
+
+    threads = [threading.Thread(target=run_session, args=(timer, calls)) for timer, calls in zip(timers, (3, 7))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [timer.stats['calculate_timing_factor_batch'][0] for timer in timers] == [3, 7]
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+from application_pages.utils import (
+    build_occupation_embedding,
+    build_occupation_skill_index,
+    calculate_occupation_similarity,
+    find_adjacent_occupations,
+    find_similar_occupations,
+    generate_synthetic_population
+)
+
+@pytest.fixture(scope="module")
+def catalog():
+    _, occupations, _, required_skills, skills = generate_synthetic_population(5, n_occupations=30, n_skills=25, skills_per_profile=6)
+    embedding = build_occupation_embedding(build_occupation_skill_index(required_skills, occupations['occupation_name']))
+    # Dense occupation x skill matrix of required score x importance, the embedding before normalization
+    dense = (required_skills.assign(value=required_skills['required_skill_score'] / 100 * required_skills['skill_importance'])
+             .pivot_table(index='occupation_name', columns='skill_name', values='value', aggfunc='sum', fill_value=0.0)
+             .reindex(index=embedding['occupations'], columns=embedding['skills'], fill_value=0.0).to_numpy())
+    return skills, embedding, dense
+
+def cosine(queries, dense):
+    return (queries / np.linalg.norm(queries, axis=1, keepdims=True)) @ (dense / np.linalg.norm(dense, axis=1, keepdims=True)).T
+
+def expected_top_k(similarity, occupations, k):
+    order = np.lexsort((np.arange(len(similarity)), -similarity))[:k]
+    return occupations[order].tolist(), similarity[order]
+
+def test_similarity_equals_dense_cosine_in_any_block_size(catalog):
+    _, embedding, dense = catalog
+    queries = np.random.default_rng(0).uniform(0, 1, (7, len(embedding['skills'])))
+    for max_block_elements in (1, 50, 2**22):
+        np.testing.assert_allclose(calculate_occupation_similarity(queries, embedding, max_block_elements), cosine(queries, dense), atol=1e-12)
+
+def test_similar_occupations_for_a_person(catalog):
+    skills, embedding, dense = catalog
+    user_skills = skills[skills['user_id'] == skills['user_id'].iloc[0]]
+    query = pd.Series(user_skills['individual_skill_score'].to_numpy(dtype=float) / 100, index=user_skills['skill_name']).groupby(level=0).sum()
+    query = query.reindex(embedding['skills'], fill_value=0.0).to_numpy()[None, :]
+    names, similarity = expected_top_k(cosine(query, dense)[0], embedding['occupations'], 5)
+    similar = find_similar_occupations(user_skills, embedding, k=5)
+    assert similar.index.tolist() == names
+    np.testing.assert_allclose(similar['similarity'], similarity)
+
+def test_adjacent_occupations_exclude_the_occupation_itself(catalog):
+    _, embedding, dense = catalog
+    occupation_name = embedding['occupations'][3]
+    similarity = cosine(dense[[3]], dense)[0]
+    similarity[3] = -np.inf
+    names, values = expected_top_k(similarity, embedding['occupations'], 6)
+    adjacent = find_adjacent_occupations(occupation_name, embedding, k=6)
+    assert occupation_name not in adjacent.index
+    assert adjacent.index.tolist() == names
+    np.testing.assert_allclose(adjacent['similarity'], values)
+    assert len(find_adjacent_occupations(occupation_name, embedding, k=100)) == len(embedding['occupations']) - 1
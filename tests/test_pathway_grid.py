@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from application_pages.utils import (
+    calculate_ai_readiness_score,
+    calculate_idiosyncratic_readiness,
+    calculate_synergy_percentage,
+    generate_synthetic_data,
+    score_profile,
+    simulate_pathway_grid,
+    simulate_pathway_impact
+)
+
+@pytest.fixture(scope="module")
+def scored():
+    profiles, occupations, pathways, required_skills, skills = generate_synthetic_data()
+    occupation = occupations.iloc[1]
+    scores = score_profile(profiles.iloc[0].to_dict(), skills, occupation, required_skills[required_skills['occupation_name'] == occupation['occupation_name']])
+    return scores, pathways
+
+def test_grid_cells_equal_the_scalar_simulation(scored):
+    # Starting from score_profile's components, H^R and alignment factor, as page 3 does
+    scores, pathways = scored
+    completion_scores, mastery_scores = np.linspace(0.0, 1.0, 5), np.linspace(0.2, 1.0, 3)
+    grid = simulate_pathway_grid(scores['ai_fluency'], scores['domain_expertise'], scores['adaptive_capacity'], pathways,
+                                 scores['hr_score'], scores['alignment_factor'], 0.6, 0.15, completion_scores, mastery_scores)
+    assert grid['ai_r_score'].shape == (len(pathways), len(completion_scores), len(mastery_scores))
+    for p, (_, pathway) in enumerate(pathways.iterrows()):
+        for c, completion_score in enumerate(completion_scores):
+            for m, mastery_score in enumerate(mastery_scores):
+                components = simulate_pathway_impact(scores['ai_fluency'], scores['domain_expertise'], scores['adaptive_capacity'], pathway['pathway_type'],
+                                                     pathway['impact_ai_fluency'], pathway['impact_domain_expertise'], pathway['impact_adaptive_capacity'],
+                                                     completion_score, mastery_score)
+                vr_score = calculate_idiosyncratic_readiness(*components) * 100
+                synergy_percentage = calculate_synergy_percentage(vr_score, scores['hr_score'], scores['alignment_factor'])
+                assert grid['vr_score'][p, c, m] == pytest.approx(vr_score)
+                assert grid['ai_r_score'][p, c, m] == pytest.approx(calculate_ai_readiness_score(vr_score, scores['hr_score'], synergy_percentage, 0.6, 0.15))
@@ -0,0 +1,47 @@
+import itertools
+import pytest
+from application_pages.utils import (
+    calculate_ai_readiness_score,
+    calculate_idiosyncratic_readiness,
+    calculate_synergy_percentage,
+    generate_synthetic_reference_data,
+    optimize_pathway_portfolio,
+    simulate_pathway_impact
+)
+
+HR_SCORE, ALIGNMENT_FACTOR, ALPHA, BETA = 60.0, 0.8, 0.6, 0.15
+
+def replay(current, pathways, rows, completion_score=1.0, mastery_score=1.0):
+    # The scalar simulation applied pathway by pathway, then the AI-R chain
+    state = current
+    for _, pathway in pathways.iloc[list(rows)].iterrows():
+        state = simulate_pathway_impact(*state, pathway['pathway_type'], pathway['impact_ai_fluency'], pathway['impact_domain_expertise'],
+                                        pathway['impact_adaptive_capacity'], completion_score, mastery_score)
+    vr_score = calculate_idiosyncratic_readiness(*state) * 100
+    return calculate_ai_readiness_score(vr_score, HR_SCORE, calculate_synergy_percentage(vr_score, HR_SCORE, ALIGNMENT_FACTOR), ALPHA, BETA)
+
+def exhaustive_best(current, pathways, budget, cost_column, completion_score=1.0):
+    costs = [1.0] * len(pathways) if cost_column is None else pathways[cost_column].tolist()
+    return max(replay(current, pathways, subset, completion_score)
+               for size in range(len(pathways) + 1) for subset in itertools.combinations(range(len(pathways)), size)
+               if sum(costs[i] for i in subset) <= budget)
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("current", [(0.3, 0.5, 0.4), (0.95, 0.9, 0.98)])
+@pytest.mark.parametrize("budget, cost_column", [(2, None), (4, None), (90, 'duration_hours'), (200, 'duration_hours')])
+def test_optimizer_equals_exhaustive_search(seed, current, budget, cost_column):
+    _, pathways, _ = generate_synthetic_reference_data(n_pathways=7, seed=seed)
+    result = optimize_pathway_portfolio(*current, pathways, budget, HR_SCORE, ALIGNMENT_FACTOR, ALPHA, BETA, cost_column=cost_column, completion_score=0.8)
+    assert result['ai_r_score'] == pytest.approx(exhaustive_best(current, pathways, budget, cost_column, completion_score=0.8))
+
+    # The reported sequence is affordable and replays to the reported score
+    rows = pathways.index[pathways['pathway_name'].isin(result['sequence'])]
+    assert result['total_cost'] == pytest.approx(pathways[cost_column].iloc[rows].sum() if cost_column else len(rows))
+    assert result['total_cost'] <= budget
+    assert result['ai_r_score'] == pytest.approx(replay(current, pathways, rows, completion_score=0.8))
+
+def test_nothing_affordable_keeps_the_current_profile():
+    _, pathways, _ = generate_synthetic_reference_data(n_pathways=4)
+    result = optimize_pathway_portfolio(0.3, 0.5, 0.4, pathways, 1, HR_SCORE, ALIGNMENT_FACTOR, ALPHA, BETA, cost_column='duration_hours')
+    assert result['sequence'] == [] and result['total_cost'] == 0.0
+    assert result['ai_r_score'] == pytest.approx(replay((0.3, 0.5, 0.4), pathways, []))
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+from application_pages.utils import (
+    calculate_ai_readiness_score,
+    calculate_ai_readiness_surface,
+    calculate_occupation_ranks,
+    calculate_recommendation_stability,
+    summarize_rank_sensitivity
+)
+
+ALPHAS, BETAS = np.linspace(0.0, 1.0, 6), np.linspace(0.0, 1.0, 4)
+
+@pytest.fixture
+def cohort():
+    rng = np.random.default_rng(0)
+    # 3 users x 5 occupations
+    return rng.uniform(0, 100, (3, 1)), rng.uniform(0, 100, (1, 5)), rng.uniform(0, 50, (3, 5))
+
+def test_surface_equals_the_scalar_formula_at_every_alpha_and_beta(cohort):
+    vr_score, hr_score, synergy_percentage = cohort
+    surface = calculate_ai_readiness_surface(vr_score, hr_score, synergy_percentage, ALPHAS, BETAS)
+    assert surface.shape == (len(ALPHAS), len(BETAS), 3, 5)
+    for a, alpha in enumerate(ALPHAS):
+        for b, beta in enumerate(BETAS):
+            for user in range(3):
+                for occupation in range(5):
+                    assert surface[a, b, user, occupation] == pytest.approx(calculate_ai_readiness_score(
+                        vr_score[user, 0], hr_score[0, occupation], synergy_percentage[user, occupation], alpha, beta))
+
+def test_ranks_are_one_for_the_best_and_ties_keep_catalog_order():
+    np.testing.assert_array_equal(calculate_occupation_ranks(np.array([[10.0, 30.0, 30.0, 5.0]])), [[3, 1, 2, 4]])
+
+def test_rank_summary_and_stability_match_a_loop_over_the_grid(cohort):
+    vr_score, hr_score, synergy_percentage = cohort
+    surface = calculate_ai_readiness_surface(vr_score[0], hr_score[0], synergy_percentage[0], ALPHAS, BETAS)
+    current = calculate_ai_readiness_score(vr_score[0], hr_score[0], synergy_percentage[0], 0.6, 0.15)
+    names = [f"Occupation {i}" for i in range(5)]
+    ranks = np.array([[pd.Series(-surface[a, b]).rank(method='first').to_numpy() for b in range(len(BETAS))] for a in range(len(ALPHAS))]).reshape(-1, 5)
+
+    summary = summarize_rank_sensitivity(surface, names, current)
+    assert summary.index.tolist() == [names[i] for i in np.argsort(-current, kind='stable')]
+    summary = summary.loc[names]
+    np.testing.assert_array_equal(summary['best_rank'], ranks.min(axis=0))
+    np.testing.assert_array_equal(summary['worst_rank'], ranks.max(axis=0))
+    np.testing.assert_allclose(summary['top_share'], (ranks == 1).mean(axis=0))
+
+    current_top = int(np.argmax(current))
+    assert calculate_recommendation_stability(surface, current) == pytest.approx((ranks[:, current_top] == 1).mean())
@@ -0,0 +1,37 @@
+import pytest
+from application_pages.utils import (
+    build_occupation_skill_index,
+    calculate_systematic_opportunity_table,
+    generate_synthetic_population,
+    recommend_occupations,
+    score_profile
+)
+
+@pytest.fixture(scope="module")
+def catalog():
+    profiles, occupations, _, required_skills, skills = generate_synthetic_population(3, n_occupations=40, n_skills=30, skills_per_profile=10)
+    hr_table = calculate_systematic_opportunity_table(occupations)
+    skill_index = build_occupation_skill_index(required_skills, occupations['occupation_name'])
+    return profiles, required_skills, skills, hr_table, skill_index
+
+@pytest.mark.parametrize("user_row", [0, 1, 2])
+def test_top_k_equals_scoring_every_occupation(catalog, user_row):
+    profiles, required_skills, skills, hr_table, skill_index = catalog
+    profile = profiles.iloc[user_row].to_dict()
+    user_skills = skills[skills['user_id'] == profile['user_id']]
+    expected = {occupation_name: score_profile(profile, user_skills, hr_row, required_skills[required_skills['occupation_name'] == occupation_name])
+                for occupation_name, hr_row in hr_table.iterrows()}
+    ranking = sorted(expected, key=lambda occupation_name: -expected[occupation_name]['ai_r_score'])
+
+    vr_score = expected[ranking[0]]['vr_score']
+    recommendations = recommend_occupations(vr_score, profile['years_experience'], user_skills, hr_table, skill_index, k=7)
+    assert recommendations.index.tolist() == ranking[:7]
+    assert recommendations['rank'].tolist() == list(range(1, 8))
+    for occupation_name, recommendation in recommendations.iterrows():
+        assert recommendation['skills_match_score'] == pytest.approx(expected[occupation_name]['skills_match_score'])
+        assert recommendation['ai_r_score'] == pytest.approx(expected[occupation_name]['ai_r_score'])
+
+def test_k_is_capped_at_the_catalog_size(catalog):
+    _, _, skills, hr_table, skill_index = catalog
+    assert len(recommend_occupations(50.0, 3, skills.iloc[:0], hr_table, skill_index, k=100)) == len(hr_table)
+    assert recommend_occupations(50.0, 3, skills.iloc[:0], hr_table, skill_index, k=0).empty
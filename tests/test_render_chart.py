@@ -0,0 +1,37 @@
+import json
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+from application_pages.utils import CHART_MAX_BARS, ScoreCache, render_chart
+
+def figure_dict(figure):
+    return json.loads(pio.to_json(figure, validate=False))
+
+def test_cached_figures_are_not_shared():
+    cache = ScoreCache()
+    points = pd.DataFrame({'x': np.arange(20_000), 'y': np.sin(np.arange(20_000) / 100)})
+    first = render_chart("line", points, cache=cache, x="x", y="y")
+    second = render_chart("line", points, cache=cache, x="x", y="y")
+    assert second is not first
+    assert figure_dict(second) == figure_dict(first)
+    second.update_layout(title="Changed by the caller")
+    assert render_chart("line", points, cache=cache, x="x", y="y").layout.title.text is None
+    assert cache.stats()['hits'] == 2
+
+def test_figure_cache_is_bounded_by_bytes():
+    cache = ScoreCache(max_bytes=200_000)
+    rng = np.random.default_rng(0)
+    for seed in range(10):
+        points = pd.DataFrame({'x': np.arange(5_000), 'y': rng.normal(size=5_000) + seed})
+        render_chart("line", points, cache=cache, x="x", y="y")
+    stats = cache.stats()
+    assert stats['bytes'] <= 200_000
+    assert stats['evictions'] > 0
+
+def test_pie_groups_small_slices_into_other():
+    slices = pd.DataFrame({'name': [f"Slice {i}" for i in range(100)], 'value': np.arange(1.0, 101.0)})
+    pie = render_chart("pie", slices, cache=None, names="name", values="value").data[0]
+    assert len(pie.labels) == CHART_MAX_BARS
+    assert pie.labels[-1] == "Other"
+    assert np.sum(pie.values) == slices['value'].sum()
+    assert set(pie.labels[:-1]) == set(slices['name'].iloc[-(CHART_MAX_BARS - 1):])
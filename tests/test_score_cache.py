@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+import application_pages.utils as utils
+from application_pages.utils import (
+    ScoreCache,
+    calculate_systematic_opportunity_table,
+    generate_synthetic_data,
+    make_score_cache_key,
+    score_profile,
+    score_profile_cached
+)
+
+@pytest.fixture(scope="module")
+def inputs():
+    profiles, occupations, _, required_skills, skills = generate_synthetic_data()
+    occupation = occupations.iloc[0]
+    return (profiles.iloc[0].to_dict(), skills[skills['user_id'] == profiles['user_id'].iloc[0]].reset_index(drop=True),
+            occupation, required_skills[required_skills['occupation_name'] == occupation['occupation_name']])
+
+def test_key_ignores_row_order(inputs):
+    profile, skills, occupation, required_skills = inputs
+    assert make_score_cache_key(profile, skills, occupation, required_skills) == make_score_cache_key(profile, skills.iloc[::-1], occupation, required_skills.iloc[::-1])
+
+def test_key_depends_on_scores(inputs):
+    profile, skills, occupation, required_skills = inputs
+    changed = skills.assign(individual_skill_score=skills['individual_skill_score'] + 1)
+    assert make_score_cache_key(profile, skills, occupation, required_skills) != make_score_cache_key(profile, changed, occupation, required_skills)
+
+@pytest.mark.parametrize("blank_name", [None, np.nan])
+def test_blank_skill_row(inputs, blank_name):
+    # A row added in the page 3 skills editor and not yet filled in
+    profile, skills, occupation, required_skills = inputs
+    edited = pd.concat([skills, pd.DataFrame({'user_id': [None], 'skill_name': [blank_name], 'individual_skill_score': [np.nan]})], ignore_index=True)
+    assert make_score_cache_key(profile, edited, occupation, required_skills) == make_score_cache_key(profile, skills, occupation, required_skills)
+
+    cache = ScoreCache()
+    assert score_profile_cached(cache, profile, edited, occupation, required_skills) == score_profile(profile, skills, occupation, required_skills)
+    assert score_profile_cached(cache, profile, skills, occupation, required_skills) == score_profile(profile, skills, occupation, required_skills)
+    assert cache.stats()['hits'] == 1
+
+def test_mixed_type_skill_names(inputs):
+    profile, skills, occupation, required_skills = inputs
+    mixed = pd.concat([skills, pd.DataFrame({'user_id': [1], 'skill_name': [42], 'individual_skill_score': [10]})], ignore_index=True)
+    assert make_score_cache_key(profile, mixed, occupation, required_skills) != make_score_cache_key(profile, skills, occupation, required_skills)
+
+def test_hr_table_row_is_used_as_is(inputs, monkeypatch):
+    profile, skills, occupation, required_skills = inputs
+    hr_row = calculate_systematic_opportunity_table(generate_synthetic_data()[1], 0.4, 0.1).loc[occupation['occupation_name']]
+    expected = score_profile(profile, skills, occupation, required_skills, lambda_val=0.4, gamma=0.1)
+    monkeypatch.setattr(utils, 'calculate_systematic_opportunity_batch', lambda *args: pytest.fail("H^R recomputed"))
+    assert score_profile(profile, skills, hr_row, required_skills, lambda_val=0.4, gamma=0.1) == pytest.approx(expected)
+    cache = ScoreCache()
+    score_profile_cached(cache, profile, skills, hr_row, required_skills, lambda_val=0.4, gamma=0.1)
+    score_profile_cached(cache, profile, skills, hr_row.copy(), required_skills, lambda_val=0.4, gamma=0.1)
+    assert cache.stats()['hits'] == 1
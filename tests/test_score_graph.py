@@ -0,0 +1,57 @@
+import pytest
+from application_pages.utils import AI_READINESS_GRAPH_NODES, SCORE_PROFILE_RESULTS, ScoreGraph, build_ai_readiness_graph, generate_synthetic_data
+
+PARAMETERS = {'hr_score': 70.0, 'skills_match_score': 60.0, 'max_possible_match': 100, 'alpha': 0.6, 'beta': 0.15}
+
+@pytest.fixture
+def counted_graph():
+    # The app's graph with every node function counting its calls
+    calls = []
+
+    def counted(name, function):
+        def node(*args):
+            calls.append(name)
+            return function(*args)
+        return node
+
+    nodes = {name: (counted(name, function), inputs) for name, (function, inputs) in AI_READINESS_GRAPH_NODES.items()}
+    graph = ScoreGraph(nodes)
+    graph.update({**generate_synthetic_data()[0].iloc[0].to_dict(), **PARAMETERS})
+    graph.evaluate(SCORE_PROFILE_RESULTS)
+    return graph, calls
+
+def test_first_evaluation_computes_every_node_once(counted_graph):
+    graph, calls = counted_graph
+    assert sorted(calls) == sorted(AI_READINESS_GRAPH_NODES)
+    assert graph.evaluations == len(AI_READINESS_GRAPH_NODES)
+
+def test_changed_input_recomputes_only_its_dependents(counted_graph):
+    graph, calls = counted_graph
+    calls.clear()
+    assert graph.update({'errors_caught': 10, 'alpha': 0.6}) == ['errors_caught']
+    graph.evaluate(SCORE_PROFILE_RESULTS)
+    assert sorted(calls) == ['ai_fluency', 'ai_r_score', 's3', 'synergy_percentage', 'vr_score']
+
+    calls.clear()
+    graph.update({'hr_score': 80.0})
+    graph.evaluate(SCORE_PROFILE_RESULTS)
+    assert sorted(calls) == ['ai_r_score', 'synergy_percentage']
+
+def test_unchanged_inputs_recompute_nothing(counted_graph):
+    graph, calls = counted_graph
+    calls.clear()
+    assert graph.update(dict(graph.inputs)) == []
+    graph.evaluate(SCORE_PROFILE_RESULTS)
+    assert calls == []
+
+def test_incremental_values_equal_a_fresh_graph(counted_graph):
+    graph, _ = counted_graph
+    changes = {'errors_caught': 10, 'years_experience': 8, 'beta': 0.3}
+    graph.update(changes)
+    fresh = build_ai_readiness_graph()
+    fresh.update({**graph.inputs, **changes})
+    assert graph.evaluate(SCORE_PROFILE_RESULTS) == pytest.approx(fresh.evaluate(SCORE_PROFILE_RESULTS))
+
+def test_missing_input_raises():
+    with pytest.raises(KeyError, match="prompting_score"):
+        build_ai_readiness_graph().get('s1')
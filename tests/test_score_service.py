@@ -0,0 +1,52 @@
+import json
+import pytest
+from application_pages.utils import generate_synthetic_data, prepare_reference_data, score_profile
+from score_service import PROFILE_FIELDS, RequestError, ScoringModel
+
+@pytest.fixture(scope="module")
+def model():
+    tables, _ = prepare_reference_data()
+    return ScoringModel(tables)
+
+@pytest.fixture
+def payload():
+    profiles, occupations, _, _, skills = generate_synthetic_data()
+    profile = profiles.iloc[0]
+    return {
+        'profile': {field: profile[field].item() if hasattr(profile[field], 'item') else profile[field] for field in PROFILE_FIELDS},
+        'skills': skills[['skill_name', 'individual_skill_score']].to_dict('records'),
+        'occupation': occupations['occupation_name'].iloc[0]
+    }
+
+def test_score_matches_score_profile(model, payload):
+    _, occupations, _, required_skills, skills = generate_synthetic_data()
+    occupation = occupations.iloc[0]
+    expected = score_profile(payload['profile'], skills, occupation, required_skills[required_skills['occupation_name'] == occupation['occupation_name']])
+    result = model.score([model.parse('score', payload)])[0]
+    for name in ('vr_score', 'hr_score', 'skills_match_score', 'synergy_percentage', 'ai_r_score'):
+        assert result[name] == pytest.approx(expected[name])
+
+@pytest.mark.parametrize("literal", ["NaN", "Infinity", "-Infinity", "1" + "0" * 400, "-1" + "0" * 400])
+def test_non_finite_numbers_are_rejected(model, payload, literal):
+    # json.loads parses these literals to floats, or to integers that overflow a float
+    cases = [
+        json.loads(json.dumps(payload).replace('"prompting_score": 0.75', f'"prompting_score": {literal}')),
+        {**payload, 'alpha': json.loads(literal)},
+        {**payload, 'skills': [{'skill_name': "Python", 'individual_skill_score': json.loads(literal)}]}
+    ]
+    for case in cases:
+        with pytest.raises(RequestError) as error:
+            model.parse('score', case)
+        assert error.value.status == 400
+        assert "finite" in str(error.value)
+
+def test_repeated_skills_in_a_batch_match_score_profile(model, payload):
+    _, occupations, _, required_skills, skills = generate_synthetic_data()
+    occupation = occupations.iloc[0]
+    occupation_skills = required_skills[required_skills['occupation_name'] == occupation['occupation_name']]
+    repeated = {**payload, 'skills': payload['skills'] + payload['skills'][:1]}
+    results = model.score([model.parse('score', {**payload, 'skills': []}), model.parse('score', repeated), model.parse('score', payload)])
+    assert results[0]['skills_match_score'] == 0.0
+    expected = score_profile(payload['profile'], skills.iloc[list(range(len(skills))) + [0]], occupation, occupation_skills)
+    assert results[1]['skills_match_score'] == pytest.approx(expected['skills_match_score'])
+    assert results[1]['ai_r_score'] == pytest.approx(expected['ai_r_score'])
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+from application_pages.utils import (
+    ScoreCache,
+    SkillGapIndex,
+    build_ai_readiness_graph,
+    build_occupation_skill_index,
+    calculate_session_memory_usage,
+    estimate_memory_bytes,
+    generate_synthetic_population
+)
+
+def test_skill_gap_index_counts_its_own_arrays_only():
+    _, _, _, required_skills, skills = generate_synthetic_population(2_000, n_skills=200, skills_per_profile=20)
+    skill_index = build_occupation_skill_index(required_skills)
+    skill_gap_index = SkillGapIndex(skill_index, skills)
+    estimate = estimate_memory_bytes(skill_gap_index)
+    assert estimate >= skill_gap_index.credits.nbytes + skill_gap_index.credit_positions.nbytes + skill_gap_index.credit_starts.nbytes
+    # The skill index is shared per data version, so growing it does not change the session's figure
+    skill_index['unrelated'] = np.zeros(1_000_000)
+    assert estimate_memory_bytes(skill_gap_index) == estimate
+
+def test_session_objects_are_counted():
+    cache = ScoreCache()
+    cache.put("key", pd.DataFrame({'score': np.arange(10_000.0)}))
+    graph = build_ai_readiness_graph()
+    graph.update({'prompting_score': 0.5})
+    assert estimate_memory_bytes(cache) >= 80_000
+    assert estimate_memory_bytes(graph) > estimate_memory_bytes({})
+
+class MeasuredTable:
+    # Counts how often it is measured
+    def __init__(self):
+        self.measurements = 0
+
+    def memory_bytes(self):
+        self.measurements += 1
+        return 1_000_000
+
+def test_shared_values_are_not_measured_and_repeated_values_count_once():
+    shared_table = MeasuredTable()
+    edited_table = pd.DataFrame({'value': np.arange(2_000.0)})
+    session_values = {'shared_df': shared_table, 'alias_of_shared': shared_table, 'edited': edited_table, 'edited_again': edited_table}
+    assert calculate_session_memory_usage(session_values, {'shared_df': None}) == estimate_memory_bytes(edited_table)
+    assert shared_table.measurements == 0
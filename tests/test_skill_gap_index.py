@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+from application_pages.utils import SkillGapIndex, build_occupation_skill_index, diff_skill_scores, generate_synthetic_population
+
+@pytest.fixture(scope="module")
+def population():
+    _, occupations, _, required_skills, skills = generate_synthetic_population(300, n_skills=30)
+    return skills, required_skills, build_occupation_skill_index(required_skills, occupations['occupation_name'])
+
+def edit(skills, user_id, rng):
+    # One user's table with a changed score, a removed skill, a repeated row and a new skill
+    own = skills[skills['user_id'] == user_id].reset_index(drop=True)
+    own.loc[0, 'individual_skill_score'] = rng.integers(0, 101)
+    own = own.drop(index=1)
+    new_skill = next(f"Skill {code:05d}" for code in rng.permutation(30) if f"Skill {code:05d}" not in set(own['skill_name']))
+    extra = pd.DataFrame({'user_id': user_id, 'skill_name': [own['skill_name'].iloc[-1], new_skill], 'individual_skill_score': rng.integers(0, 101, 2)})
+    return pd.concat([own, extra], ignore_index=True)
+
+def assert_same_state(index, rebuilt):
+    for user_id in rebuilt.users:
+        np.testing.assert_allclose(index.skills_match(user_id).to_numpy(), rebuilt.skills_match(user_id).to_numpy(), atol=1e-12)
+
+def test_updates_equal_a_rebuild(population):
+    skills, required_skills, skill_index = population
+    rng = np.random.default_rng(0)
+    index = SkillGapIndex(skill_index, skills)
+    for user_id in rng.choice(skills['user_id'].unique(), 20, replace=False).tolist():
+        edited = edit(skills, user_id, rng)
+        changes = diff_skill_scores(skills[skills['user_id'] == user_id], edited)
+        revisited = index.update(user_id, changes)
+        # Only the occupations requiring a changed skill are revisited
+        requiring = required_skills[required_skills['skill_name'].isin(list(changes))]['occupation_name']
+        assert skill_index['occupations'][revisited].sort_values().tolist() == sorted(requiring.unique())
+        skills = pd.concat([skills[skills['user_id'] != user_id], edited], ignore_index=True)
+    assert_same_state(index, SkillGapIndex(skill_index, skills))
+
+def test_new_users_are_appended(population):
+    skills, _, skill_index = population
+    index = SkillGapIndex(skill_index, skills)
+    new_user = skills[skills['user_id'] == 1].assign(user_id=-1)
+    index.update(-1, diff_skill_scores(new_user.iloc[:0], new_user))
+    assert index.users[-1] == -1
+    assert_same_state(index, SkillGapIndex(skill_index, pd.concat([skills, new_user], ignore_index=True)))
+    with pytest.raises(KeyError, match="not in the skill-gap index"):
+        index.skills_match(-2)
+
+def test_closing_every_gap_reaches_the_best_attainable_match(population):
+    skills, _, skill_index = population
+    index = SkillGapIndex(skill_index, skills)
+    gap_scores = index.gap_scores(1)
+    for occupation_name in skill_index['occupations']:
+        gaps = index.gaps(1, occupation_name)
+        assert (np.diff(gaps['skills_match_gain']) <= 0).all()
+        assert gaps['skills_match_gain'].sum() == pytest.approx(gap_scores[occupation_name])
+        if len(gaps):
+            assert gaps['projected_skills_match'].iloc[-1] == pytest.approx(index.max_match[skill_index['occupations'].get_loc(occupation_name)])
+        assert (gaps['individual_skill_score'] < gaps['required_skill_score']).all()
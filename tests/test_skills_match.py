@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+from application_pages.utils import (
+    SkillGapIndex,
+    build_occupation_embedding,
+    build_occupation_skill_index,
+    calculate_skills_match_matrix,
+    calculate_skills_match_score,
+    calculate_systematic_opportunity_table,
+    diff_skill_scores,
+    find_similar_occupations,
+    generate_synthetic_data,
+    recommend_occupations
+)
+
+# Repeated skill rows are credited separately, as calculate_skills_match_score's merge always has
+
+@pytest.fixture(scope="module")
+def reference():
+    _, occupations, _, required_skills, _ = generate_synthetic_data()
+    return occupations, required_skills, build_occupation_skill_index(required_skills, occupations['occupation_name'])
+
+@pytest.fixture
+def repeated_skills(reference):
+    _, required_skills, _ = reference
+    skill_names = required_skills['skill_name'].unique()
+    return pd.DataFrame({
+        'user_id': 1,
+        'skill_name': [skill_names[0], skill_names[1], skill_names[0], None, skill_names[2]],
+        'individual_skill_score': [20, 35, 30, 90, 60]
+    })
+
+def test_scalar_credits_each_repeated_row():
+    required = pd.DataFrame({'skill_name': ['Python'], 'required_skill_score': [25], 'skill_importance': [2.0]})
+    repeated = pd.DataFrame({'user_id': 1, 'skill_name': ['Python', 'Python'], 'individual_skill_score': [20, 30]})
+    # min(20, 25) + min(30, 25), not min(20 + 30, 25) or the last row's min(30, 25)
+    assert calculate_skills_match_score(repeated, required) == pytest.approx(45.0)
+
+def test_matrix_matches_scalar_with_repeated_skills(reference, repeated_skills):
+    _, required_skills, skill_index = reference
+    users = pd.concat([repeated_skills, repeated_skills.assign(user_id=2).iloc[[1, 4]]], ignore_index=True)
+    match = calculate_skills_match_matrix(users, required_skills, skill_index=skill_index)
+    assert match.index.tolist() == [1, 2]
+    for user_id, user_skills in users.groupby('user_id'):
+        for occupation_name, occupation_skills in required_skills.groupby('occupation_name'):
+            assert match.loc[user_id, occupation_name] == pytest.approx(calculate_skills_match_score(user_skills, occupation_skills))
+
+def test_matrix_propagates_missing_scores_like_scalar(reference, repeated_skills):
+    _, required_skills, skill_index = reference
+    missing = repeated_skills.assign(individual_skill_score=[20, 35, 30, 90, np.nan])
+    match = calculate_skills_match_matrix(missing, required_skills, skill_index=skill_index).loc[1]
+    expected = [calculate_skills_match_score(missing, occupation_skills) for _, occupation_skills in required_skills.groupby('occupation_name')]
+    np.testing.assert_allclose(match[sorted(required_skills['occupation_name'].unique())].to_numpy(), expected)
+
+def test_recommendations_match_scalar(reference, repeated_skills):
+    occupations, required_skills, skill_index = reference
+    hr_table = calculate_systematic_opportunity_table(occupations)
+    recommendations = recommend_occupations(50.0, 5, repeated_skills, hr_table, skill_index, k=len(hr_table))
+    for occupation_name, skills_match in recommendations['skills_match_score'].items():
+        occupation_skills = required_skills[required_skills['occupation_name'] == occupation_name]
+        assert skills_match == pytest.approx(calculate_skills_match_score(repeated_skills, occupation_skills))
+
+def test_similarity_adds_up_repeated_skills(reference, repeated_skills):
+    _, _, skill_index = reference
+    summed = repeated_skills.iloc[[0, 1, 4]].assign(individual_skill_score=[50, 35, 60])
+    embedding = build_occupation_embedding(skill_index)
+    pd.testing.assert_frame_equal(find_similar_occupations(repeated_skills, embedding), find_similar_occupations(summed, embedding))
+
+def test_skill_gap_index_credits_repeated_skills(reference, repeated_skills):
+    _, required_skills, skill_index = reference
+    expected = calculate_skills_match_matrix(repeated_skills, required_skills, skill_index=skill_index).loc[1]
+    np.testing.assert_allclose(SkillGapIndex(skill_index, repeated_skills).skills_match(1).to_numpy(), expected.to_numpy())
+
+    # An incremental update from no skills reaches the same state as a rebuild
+    skill_gap_index = SkillGapIndex(skill_index, repeated_skills.iloc[:0])
+    skill_gap_index.update(1, diff_skill_scores(repeated_skills.iloc[:0], repeated_skills))
+    np.testing.assert_allclose(skill_gap_index.skills_match(1).to_numpy(), expected.to_numpy())
+
+    # Removing one of the repeated rows revisits that skill only
+    fewer = repeated_skills.drop(index=2)
+    assert diff_skill_scores(repeated_skills, fewer) == {repeated_skills['skill_name'][0]: [20.0]}
+    skill_gap_index.update(1, diff_skill_scores(repeated_skills, fewer))
+    np.testing.assert_allclose(skill_gap_index.skills_match(1).to_numpy(),
+                               calculate_skills_match_matrix(fewer, required_skills, skill_index=skill_index).loc[1].to_numpy())
@@ -0,0 +1,13 @@
+import os
+import subprocess
+import sys
+import benchmark
+
+# The first-render time budget is machine dependent and checked by benchmark.py (--startup-budget), not here
+
+def test_page_imports_defer_plotly_express():
+    # Plotly Express is imported by the rendering code, not when app.py imports a page
+    code = "import sys, application_pages.page2, application_pages.page3, application_pages.page4; print('plotly.express' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(benchmark.__file__)),
+                            capture_output=True, text=True, check=True).stdout
+    assert output.split()[-1] == "False"
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+from application_pages.utils import (
+    TRAJECTORY_METRICS,
+    build_pathway_schedule,
+    calculate_ai_readiness_score,
+    calculate_idiosyncratic_readiness,
+    calculate_synergy_percentage,
+    generate_synthetic_data,
+    project_job_postings,
+    score_profile,
+    simulate_ai_readiness_trajectory,
+    simulate_pathway_impact
+)
+
+N_PERIODS = 24
+METRIC = {metric: position for position, metric in enumerate(TRAJECTORY_METRICS)}
+
+@pytest.fixture(scope="module")
+def inputs():
+    profiles, occupations, pathways, required_skills, skills = generate_synthetic_data()
+    occupation = occupations.iloc[[1]]
+    required = required_skills[required_skills['occupation_name'] == occupation['occupation_name'].iloc[0]]
+    return profiles.iloc[[0]], occupation, pathways, required, skills
+
+def test_schedule_places_each_pathway_at_its_finish_month(inputs):
+    _, _, pathways, _, _ = inputs
+    # Durations 20, 40 and 15 hours at 20 hours a month: 1, 2 and 1 months back to back
+    schedule = build_pathway_schedule(['Prompt Engineering Fundamentals', 'AI for Financial Analysis', 'Human-AI Collaboration'], pathways, 6)
+    np.testing.assert_array_equal(schedule, [-1, 0, -1, 1, 2, -1, -1])
+    with pytest.raises(ValueError, match="Unknown pathway"):
+        build_pathway_schedule(['No Such Pathway'], pathways, 6)
+
+def test_every_month_equals_the_scalar_chain(inputs):
+    profiles, occupation, pathways, required, skills = inputs
+    sequence = ['AI for Financial Analysis', 'Human-AI Collaboration']
+    schedule = build_pathway_schedule(sequence, pathways, N_PERIODS)
+    skills_match_score = score_profile(profiles.iloc[0].to_dict(), skills, occupation.iloc[0], required)['skills_match_score']
+    trajectory = simulate_ai_readiness_trajectory(profiles, occupation, pathways, schedule, skills_match_score, n_periods=N_PERIODS)[0]
+    assert trajectory.shape == (N_PERIODS + 1, len(TRAJECTORY_METRICS))
+
+    postings = project_job_postings(occupation['current_job_postings'], occupation['previous_job_postings'], occupation['job_growth_rate_g'], np.arange(-12, N_PERIODS + 1))[0]
+    for month in range(N_PERIODS + 1):
+        # The profile aged by month / 12 years against postings one year apart, then the pathways completed so far
+        profile = {**profiles.iloc[0].to_dict(), 'years_experience': profiles['years_experience'].iloc[0] + month / 12}
+        shifted = pd.Series({**occupation.iloc[0].to_dict(), 'current_job_postings': postings[month + 12], 'previous_job_postings': postings[month]})
+        scores = score_profile(profile, skills, shifted, required)
+        components = (scores['ai_fluency'], scores['domain_expertise'], scores['adaptive_capacity'])
+        for pathway_row in schedule[:month + 1][schedule[:month + 1] >= 0]:
+            pathway = pathways.iloc[pathway_row]
+            components = simulate_pathway_impact(*components, pathway['pathway_type'], pathway['impact_ai_fluency'], pathway['impact_domain_expertise'], pathway['impact_adaptive_capacity'])
+        vr_score = calculate_idiosyncratic_readiness(*components) * 100
+        synergy_percentage = calculate_synergy_percentage(vr_score, scores['hr_score'], scores['alignment_factor'])
+
+        assert trajectory[month, METRIC['hr_score']] == pytest.approx(scores['hr_score'])
+        assert trajectory[month, METRIC['vr_score']] == pytest.approx(vr_score)
+        assert trajectory[month, METRIC['ai_r_score']] == pytest.approx(calculate_ai_readiness_score(vr_score, scores['hr_score'], synergy_percentage, 0.6, 0.15))
+        if month == 0:
+            assert trajectory[0, METRIC['ai_r_score']] == pytest.approx(score_profile(profiles.iloc[0].to_dict(), skills, occupation.iloc[0], required)['ai_r_score'])
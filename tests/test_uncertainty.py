@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+from application_pages.utils import generate_synthetic_data, score_profile, simulate_ai_readiness_uncertainty
+
+METRICS = ['vr_score', 'hr_score', 'synergy_percentage', 'ai_r_score']
+
+@pytest.fixture(scope="module")
+def scored():
+    profiles, occupations, _, required_skills, skills = generate_synthetic_data()
+    profile, occupation = profiles.iloc[0].to_dict(), occupations.iloc[2]
+    scores = score_profile(profile, skills, occupation, required_skills[required_skills['occupation_name'] == occupation['occupation_name']])
+    return profile, occupation, scores
+
+def bands(scored, relative_noise, seed=0):
+    profile, occupation, scores = scored
+    return simulate_ai_readiness_uncertainty(profile, occupation, scores['skills_match_score'], relative_noise=relative_noise, n_draws=2_000, seed=seed)
+
+def test_without_noise_every_band_is_the_point_score(scored):
+    result = bands(scored, 0.0)
+    expected = np.array([scored[2][metric] for metric in METRICS])
+    for column in result.columns:
+        np.testing.assert_allclose(result[column].to_numpy(), expected)
+
+def test_bands_are_ordered_seeded_and_widen_with_noise(scored):
+    narrow, wide = bands(scored, 0.05), bands(scored, 0.3)
+    assert narrow.index.tolist() == METRICS
+    assert (narrow['p5'] <= narrow['p50']).all() and (narrow['p50'] <= narrow['p95']).all()
+    assert ((wide['p95'] - wide['p5']) > (narrow['p95'] - narrow['p5'])).all()
+    pd.testing.assert_frame_equal(bands(scored, 0.05), narrow)
+    assert not bands(scored, 0.05, seed=1).equals(narrow)
+    # The point scores sit inside the 5th-95th percentile band
+    expected = pd.Series({metric: scored[2][metric] for metric in METRICS})
+    assert ((narrow['p5'] <= expected) & (expected <= narrow['p95'])).all()